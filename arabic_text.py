@@ -0,0 +1,175 @@
+"""
+Arabic text shaping for the Transportation Game
+Turns logical-order Arabic into the visual-order string pygame's font renderer
+needs: contextual letter forms, lam-alef ligatures and right-to-left runs.
+Uses arabic_reshaper + python-bidi when they are installed, otherwise the small
+built-in shaper below (enough for UI labels).
+"""
+from functools import lru_cache
+
+try:
+    import arabic_reshaper
+    from bidi.algorithm import get_display
+except ImportError:
+    arabic_reshaper = None
+
+# Joining types: D joins on both sides, R only to the letter before it,
+# U never joins, C (tatweel) joins but has no forms of its own
+# Letter -> (first presentation form, joining type); forms are consecutive in
+# Presentation Forms-B as isolated, final, initial, medial
+LETTERS = {
+    "ء": (0xFE80, "U"), "آ": (0xFE81, "R"), "أ": (0xFE83, "R"),
+    "ؤ": (0xFE85, "R"), "إ": (0xFE87, "R"), "ئ": (0xFE89, "D"),
+    "ا": (0xFE8D, "R"), "ب": (0xFE8F, "D"), "ة": (0xFE93, "R"),
+    "ت": (0xFE95, "D"), "ث": (0xFE99, "D"), "ج": (0xFE9D, "D"),
+    "ح": (0xFEA1, "D"), "خ": (0xFEA5, "D"), "د": (0xFEA9, "R"),
+    "ذ": (0xFEAB, "R"), "ر": (0xFEAD, "R"), "ز": (0xFEAF, "R"),
+    "س": (0xFEB1, "D"), "ش": (0xFEB5, "D"), "ص": (0xFEB9, "D"),
+    "ض": (0xFEBD, "D"), "ط": (0xFEC1, "D"), "ظ": (0xFEC5, "D"),
+    "ع": (0xFEC9, "D"), "غ": (0xFECD, "D"), "ـ": (None, "C"),
+    "ف": (0xFED1, "D"), "ق": (0xFED5, "D"), "ك": (0xFED9, "D"),
+    "ل": (0xFEDD, "D"), "م": (0xFEE1, "D"), "ن": (0xFEE5, "D"),
+    "ه": (0xFEE9, "D"), "و": (0xFEED, "R"), "ى": (0xFEEF, "R"),
+    "ي": (0xFEF1, "D"),
+}
+ISOLATED, FINAL, INITIAL, MEDIAL = 0, 1, 2, 3
+
+LAM = "ل"
+# Alef that follows a lam -> isolated lam-alef ligature (final form is +1)
+LAM_ALEF = {"آ": 0xFEF5, "أ": 0xFEF7, "إ": 0xFEF9, "ا": 0xFEFB}
+
+MIRRORED = {"(": ")", ")": "(", "[": "]", "]": "[", "{": "}", "}": "{", "<": ">", ">": "<"}
+
+def is_transparent(ch):
+    """Harakat and other marks that sit on a letter without breaking joining"""
+    return "ً" <= ch <= "ٟ" or ch == "ٰ"
+
+def is_arabic(ch):
+    return ("؀" <= ch <= "ۿ" or "ݐ" <= ch <= "ݿ"
+            or "ﭐ" <= ch <= "﷿" or "ﹰ" <= ch <= "﻿")
+
+def has_arabic(text):
+    return any(is_arabic(ch) for ch in text)
+
+def next_letter(text, i):
+    """Index of the next character after i that isn't a transparent mark"""
+    i += 1
+    while i < len(text) and is_transparent(text[i]):
+        i += 1
+    return i
+
+def reshape(text):
+    """Replace Arabic letters with their contextual presentation forms"""
+    out = []
+    prev_joins = False  # The previous letter connects to this one
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if is_transparent(ch):
+            out.append(ch)
+            i += 1
+            continue
+        if ch not in LETTERS:
+            out.append(ch)
+            prev_joins = False
+            i += 1
+            continue
+
+        j = next_letter(text, i)
+        following = text[j] if j < len(text) else None
+        if ch == LAM and following in LAM_ALEF:
+            out.append(chr(LAM_ALEF[following] + (1 if prev_joins else 0)))
+            out.extend(text[i + 1:j])
+            prev_joins = False  # Alef never joins the letter after it
+            i = j + 1
+            continue
+
+        first, joining = LETTERS[ch]
+        next_joins = (joining in "DC" and following in LETTERS
+                      and LETTERS[following][1] != "U")
+        if first is None:
+            out.append(ch)
+        elif joining == "D":
+            if prev_joins:
+                form = MEDIAL if next_joins else FINAL
+            else:
+                form = INITIAL if next_joins else ISOLATED
+            out.append(chr(first + form))
+        elif joining == "R":
+            out.append(chr(first + (FINAL if prev_joins else ISOLATED)))
+        else:
+            out.append(chr(first))
+        prev_joins = joining in "DC"
+        i += 1
+    return "".join(out)
+
+def char_direction(ch):
+    """'R' for Arabic, 'L' for other letters, 'N' for digits, None for neutrals"""
+    if is_arabic(ch):
+        return "N" if "٠" <= ch <= "٩" else "R"
+    if ch.isdigit():
+        return "N"
+    if ch.isalpha():
+        return "L"
+    return None
+
+def reorder(text):
+    """Put a single line into visual (left-to-right) order
+
+    A cut-down bidi algorithm: the paragraph direction comes from the first
+    strong letter, Arabic runs are right-to-left, Latin and numbers read
+    left-to-right inside them, and neutrals take the direction around them.
+    """
+    directions = [char_direction(ch) for ch in text]
+    strong = [d for d in directions if d in ("L", "R")]
+    base = 1 if strong and strong[0] == "R" else 0
+    if base == 0 and "R" not in strong:
+        return text
+
+    levels = []
+    last_strong = "R" if base else "L"
+    for d in directions:
+        if d == "R":
+            levels.append(1)
+            last_strong = "R"
+        elif d == "L":
+            levels.append(2 if base else 0)
+            last_strong = "L"
+        elif d == "N":
+            # Numbers always read left to right, one level above the text around them
+            levels.append(2 if base or last_strong == "R" else 0)
+        else:
+            levels.append(None)
+
+    # Neutrals between two runs of the same direction join them, otherwise base
+    for i, level in enumerate(levels):
+        if level is None:
+            before = next((levels[k] for k in range(i - 1, -1, -1) if levels[k] is not None), base)
+            after = next((levels[k] for k in range(i + 1, len(levels)) if levels[k] is not None), base)
+            levels[i] = before if (before % 2) == (after % 2) else base
+            if levels[i] == 2 and (before != 2 or after != 2):
+                levels[i] = base
+
+    chars = [MIRRORED.get(ch, ch) if level % 2 else ch for ch, level in zip(text, levels)]
+    for level in range(max(levels), 0, -1):
+        i = 0
+        while i < len(chars):
+            if levels[i] >= level:
+                j = i
+                while j < len(chars) and levels[j] >= level:
+                    j += 1
+                chars[i:j] = chars[i:j][::-1]
+                levels[i:j] = levels[i:j][::-1]
+                i = j
+            else:
+                i += 1
+    return "".join(chars)
+
+@lru_cache(maxsize=1024)
+def shape(text):
+    """Shaped, visual-order version of text (unchanged if it has no Arabic)"""
+    if not has_arabic(text):
+        return text
+    if arabic_reshaper:
+        return get_display(arabic_reshaper.reshape(text))
+    return "\n".join(reorder(reshape(line)) for line in text.split("\n"))
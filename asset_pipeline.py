@@ -0,0 +1,151 @@
+"""
+Build-time image preprocessing for the Transportation Game
+Resizes the large source PNGs to every size the game draws them at (high
+quality resampling, optimized PNGs) across all cores, skipping sources whose
+content hash hasn't changed, and writes a manifest the game loads them by.
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+SIZED_DIR = os.path.join("assets", "sized")
+MANIFEST_PATH = os.path.join(SIZED_DIR, "manifest.json")
+MANIFEST_VERSION = 2  # 2: sources record mtime_ns for the game's staleness check
+
+VEHICLES = ("bike", "boat", "bus", "car", "helicopter", "plane", "ship", "train")
+# Level 1 (80), Level 2 (100), Level 3 (200) and the profile avatars (70)
+VEHICLE_SIZES = ((70, 70), (80, 80), (100, 100), (200, 200))
+
+def variant_table():
+    """{source path: [sizes]} for every image the game loads at a fixed size"""
+    table = {}
+    for vehicle in VEHICLES:
+        table[f"assets/images/{vehicle}.png"] = list(VEHICLE_SIZES)
+        table[f"assets/images/{vehicle}_shadow.png"] = [(80, 80)]
+    for icon in ("sky_environment.png", "road_environment.png", "ocean_environment.png"):
+        table[f"assets/images/{icon}"] = [(150, 150)]
+    table["assets/images/check_mark.png"] = [(60, 60)]
+    table["assets/images/start_background.png"] = [(1280, 800)]
+    table["assets/arabic-image/Start-game.png"] = [(300, 100), (200, 80)]
+    table["assets/arabic-image/go-to-the-next-level.png"] = [(250, 80)]
+    table["assets/arabic-image/try-agin.png"] = [(200, 80)]
+    table["assets/arabic-image/level-1-complet.png"] = [(600, 100)]
+    return table
+
+def size_key(size):
+    return f"{size[0]}x{size[1]}"
+
+def variant_path(source, size):
+    """assets/images/car.png at 80x80 -> assets/sized/images/car@80x80.png"""
+    folder, name = os.path.split(os.path.relpath(source, "assets"))
+    stem, ext = os.path.splitext(name)
+    return os.path.join(SIZED_DIR, folder, f"{stem}@{size_key(size)}{ext}").replace(os.sep, "/")
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "sources": {}}
+
+def resize_source(source, sizes):
+    """Worker: write every size variant of source; returns (source, {size key: path}, resampler)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return source, resize_with_pygame(source, sizes), "pygame smoothscale"
+    variants = {}
+    with Image.open(source) as image:
+        image = image.convert("RGBA")
+        # Save fully opaque images without the alpha channel, it's a quarter of the data
+        opaque = image.getchannel("A").getextrema() == (255, 255)
+        for size in sizes:
+            resized = image.resize(size, Image.LANCZOS)
+            if opaque:
+                resized = resized.convert("RGB")
+            path = variant_path(source, size)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            resized.save(path, optimize=True)
+            variants[size_key(size)] = path
+    return source, variants, "Pillow LANCZOS"
+
+def resize_with_pygame(source, sizes):
+    """Fallback when Pillow isn't installed: smoothscale (area averaging when shrinking)"""
+    import pygame
+    image = pygame.image.load(source)
+    variants = {}
+    for size in sizes:
+        path = variant_path(source, size)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pygame.image.save(pygame.transform.smoothscale(image, size), path)
+        variants[size_key(size)] = path
+    return variants
+
+def preprocess(jobs=None, force=False, table=None, manifest_path=MANIFEST_PATH):
+    """Bring assets/sized up to date; returns (rebuilt sources, skipped sources)"""
+    table = table if table is not None else variant_table()
+    manifest = load_manifest(manifest_path)
+    sources = manifest["sources"]
+
+    pending = {}
+    skipped = []
+    for source, sizes in table.items():
+        if not os.path.exists(source):
+            print(f"Warning: asset '{source}' not found, skipping")
+            continue
+        digest = file_hash(source)
+        entry = sources.get(source)
+        wanted = {size_key(size) for size in sizes}
+        if (not force and entry and entry["hash"] == digest and set(entry["variants"]) == wanted
+                and all(os.path.exists(path) for path in entry["variants"].values())):
+            # Same content; a touched file only needs its new mtime recorded
+            entry["mtime_ns"] = os.stat(source).st_mtime_ns
+            skipped.append(source)
+            continue
+        pending[source] = (digest, sizes)
+
+    # Sources no longer in the table are dropped from the manifest
+    for source in list(sources):
+        if source not in table:
+            del sources[source]
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(resize_source, source, sizes) for source, (_, sizes) in pending.items()]
+            for future in futures:
+                source, variants, resampler = future.result()
+                stat = os.stat(source)
+                sources[source] = {"hash": pending[source][0], "bytes": stat.st_size,
+                                   "mtime_ns": stat.st_mtime_ns, "variants": variants, "resampler": resampler}
+
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return list(pending), skipped
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-size the game's images into assets/sized")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="rebuild every variant even if unchanged")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rebuilt, skipped = preprocess(args.jobs, args.force)
+    print(f"Assets: {len(rebuilt)} rebuilt, {len(skipped)} unchanged "
+          f"in {time.perf_counter() - start:.1f}s -> {MANIFEST_PATH}")
+
+if __name__ == "__main__":
+    main()
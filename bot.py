@@ -0,0 +1,112 @@
+"""
+Automated player for the Transportation Game
+Generates mouse events that play through the Dashboard and all three levels
+"""
+from collections import deque
+import random
+import pygame
+
+class BotPlayer:
+    """Scripted player that feeds synthetic input to a Game, one frame at a time
+
+    The bot knows each level's match rule (shadow id in Level1, zone
+    vehicle_types in Level2, vehicle_id in Level3) and makes a wrong drop
+    with probability mistake_rate. It has its own RNG so it never disturbs
+    the game's layout randomness.
+    """
+    def __init__(self, drag_steps=6, think_frames=4, mistake_rate=0.0, seed=None):
+        self.drag_steps = drag_steps  # Typical motion events between press and release
+        self.think_frames = think_frames  # Typical idle frames between actions
+        self.mistake_rate = mistake_rate
+        self.rng = random.Random(seed)
+        self.pending = deque()  # One list of events per upcoming frame
+        self.wrong_drops = 0
+        self.drags = 0
+
+    def events_for(self, game):
+        """Return the events for this frame, planning the next action if idle"""
+        if not self.pending:
+            self.plan(game)
+        if self.pending:
+            return self.pending.popleft()
+        return []
+
+    def plan(self, game):
+        """Queue the next action for whatever screen is showing"""
+        level = game.current_level
+        if level is None:
+            screen = game.get_screen(game.state)
+            if hasattr(screen, "tiles"):
+                # Profile picker: play as a random child
+                rect = self.rng.choice([tile[0] for tile in screen.tiles if tile[2]] or [screen.tiles[0][0]])
+            else:
+                rect = getattr(screen, "start_button_rect", None) or screen.button_rect
+            self.click(rect.center)
+        elif level.completed:
+            self.click(level.next_button_rect.center)
+        else:
+            wrong = self.rng.random() < self.mistake_rate
+            move = self.next_move(level, wrong)
+            if move is None and wrong:
+                move = self.next_move(level, False)
+            elif move is not None and wrong:
+                self.wrong_drops += 1
+            if move:
+                self.drag(*move)
+        self.wait(max(1, self.think_frames + self.rng.randint(-2, 4)))
+
+    def next_move(self, level, wrong=False):
+        """Return (start, end) mouse positions for a correct (or wrong) drop, or None"""
+        if hasattr(level, "shadows"):
+            # Level 1: vehicle goes onto the shadow with the same id
+            for vehicle in self.shuffled(level.vehicles):
+                if not vehicle.matched:
+                    for shadow in self.shuffled(level.shadows):
+                        if (shadow.vehicle_id == vehicle.vehicle_id) != wrong and not shadow.matched:
+                            return vehicle.rect.center, shadow.rect.center
+        elif hasattr(level, "zones"):
+            # Level 2: vehicle goes into a zone listing its type
+            for vehicle in self.shuffled(level.vehicles):
+                if not vehicle.placed:
+                    for zone in self.shuffled(level.zones):
+                        if zone.can_accept(vehicle.vehicle_type) != wrong:
+                            return vehicle.rect.center, zone.rect.center
+        elif hasattr(level, "puzzle_slots"):
+            # Level 3: half goes next to the slot with the same vehicle_id
+            for half in self.shuffled(level.draggable_halves):
+                if not half.matched:
+                    for slot in self.shuffled(level.puzzle_slots):
+                        if (slot.vehicle_id == half.vehicle_id) != wrong and not slot.matched:
+                            target = (slot.rect.right + half.rect.width // 2,
+                                      slot.rect.top + half.rect.height // 2)
+                            grab = half.piece.grab_point() if hasattr(half, "piece") else None
+                            start = (half.rect.x + grab[0], half.rect.y + grab[1]) if grab else half.rect.center
+                            return start, target  # Dragging centers the half on the mouse
+        return None
+
+    def shuffled(self, items):
+        items = list(items)
+        self.rng.shuffle(items)
+        return items
+
+    def click(self, pos):
+        self.pending.append([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)])
+        self.pending.append([pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1)])
+
+    def drag(self, start, end):
+        """Press at start, move to end along an eased, slightly wobbly path, release"""
+        self.drags += 1
+        steps = max(2, self.drag_steps + self.rng.randint(-2, 6))
+        self.pending.append([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=start, button=1)])
+        for step in range(1, steps + 1):
+            t = step / steps
+            t = t * t * (3 - 2 * t)  # Ease in/out like a hand would
+            wobble = 0 if step == steps else self.rng.randint(-6, 6)
+            pos = (int(start[0] + (end[0] - start[0]) * t) + wobble,
+                   int(start[1] + (end[1] - start[1]) * t) + wobble)
+            self.pending.append([pygame.event.Event(pygame.MOUSEMOTION, pos=pos)])
+        self.pending.append([pygame.event.Event(pygame.MOUSEBUTTONUP, pos=end, button=1)])
+
+    def wait(self, frames):
+        for _ in range(frames):
+            self.pending.append([])
@@ -2,6 +2,7 @@ import PyInstaller.__main__
 import os
 import sys
 import shutil
+from asset_pipeline import preprocess, MANIFEST_PATH
 
 def build():
     # Determine separator based on OS
@@ -11,6 +12,11 @@ def build():
     print(f"Detected OS: {os.name}")
     print(f"Using separator: '{separator}'")
     
+    # Pre-size images (in parallel, only the ones that changed) so the game
+    # loads them at display size instead of scaling 1024px PNGs at runtime
+    rebuilt, skipped = preprocess()
+    print(f"Assets: {len(rebuilt)} rebuilt, {len(skipped)} unchanged ({MANIFEST_PATH})")
+    
     # Define build arguments
     args = [
         'main.py',
@@ -21,6 +27,10 @@ def build():
         f'--add-data=assets{separator}assets',
     ]
     
+    # Screens are imported lazily by main.py, so PyInstaller can't see them
+    for module_name in ('start_screen', 'dashboard', 'profile_screen', 'level1', 'level2', 'level3'):
+        args.append(f'--hidden-import={module_name}')
+    
     # Add icon if it exists
     if os.path.exists('assets/images/car.png'):
         args.append('--icon=assets/images/car.png')
@@ -0,0 +1,195 @@
+"""
+Screen capture for the Transportation Game
+Screenshots and session recordings without stalling the game loop: frames are
+copied into a small ring of preallocated surfaces and compressed/saved on a
+background thread; when it falls behind, frames are skipped, not waited for.
+Run `python capture.py encode DIR` to turn a recording into a PNG sequence.
+"""
+import argparse
+import json
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+import pygame
+
+FRAMES_NAME = "frames.bin"
+INDEX_NAME = "frames.json"
+RECORD_HEADER = struct.Struct("<I")  # Compressed length before each frame
+
+class ScreenCapture:
+    """Ring buffer of frame copies plus an encoder thread
+
+    The game calls frame() after drawing; a copy is taken at most fps times
+    a second, and only if a ring slot is free (otherwise it counts as
+    dropped). Recordings are zlib-compressed raw RGB in one file with a JSON
+    index, since PNG encoding is far too slow to keep up with a session.
+    """
+    def __init__(self, directory, size, fps=10, ring_size=8, level=1):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.size = tuple(size)
+        self.interval = 1.0 / fps
+        self.level = level  # zlib level: 1 is fast and still shrinks flat-colored frames a lot
+        self.ring = [pygame.Surface(self.size) for _ in range(ring_size)]
+        self.free = queue.Queue()
+        for index in range(ring_size):
+            self.free.put(index)
+        self.pending = queue.Queue()
+        self.recording = None  # Session folder while recording
+        self.frames_file = None
+        self.index = []  # [frame number, seconds since start, offset, length]
+        self.offset = 0
+        self.started_at = 0.0
+        self.last_capture = 0.0
+        self.captured = 0
+        self.dropped = 0
+        self.screenshots = 0
+        self.thread = threading.Thread(target=self.run, name="capture-encoder", daemon=True)
+        self.thread.start()
+
+    def take(self, surface):
+        """Copy surface into a free ring slot and return its index, or None if all are busy"""
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            return None
+        self.ring[slot].blit(surface, (0, 0))
+        return slot
+
+    def screenshot(self, surface):
+        """Queue surface to be saved as a PNG; returns the path it will have (None if dropped)"""
+        slot = self.take(surface)
+        if slot is None:
+            self.dropped += 1
+            return None
+        self.screenshots += 1
+        path = os.path.join(self.directory, time.strftime("screenshot-%Y%m%d-%H%M%S") + f"-{self.screenshots}.png")
+        self.pending.put(("png", slot, path))
+        return path
+
+    def start(self):
+        """Begin a recording in a new timestamped folder"""
+        if self.recording:
+            return
+        self.recording = os.path.join(self.directory, time.strftime("session-%Y%m%d-%H%M%S"))
+        os.makedirs(self.recording, exist_ok=True)
+        self.started_at = time.perf_counter()
+        self.last_capture = 0.0
+        self.pending.put(("open", None, self.recording))
+
+    def stop(self):
+        """End the recording; its index is written once the queued frames are done"""
+        if self.recording:
+            self.pending.put(("close", None, self.recording))
+            self.recording = None
+
+    def toggle(self):
+        if self.recording:
+            self.stop()
+        else:
+            self.start()
+
+    def frame(self, surface, frame_number):
+        """Offer a drawn frame to the recording (cheap: at most one blit)"""
+        if not self.recording:
+            return
+        now = time.perf_counter()
+        if self.last_capture and now - self.last_capture < self.interval:
+            return
+        slot = self.take(surface)
+        if slot is None:
+            self.dropped += 1  # Encoder behind: skip rather than stall the game
+            return
+        self.last_capture = now
+        self.captured += 1
+        self.pending.put(("frame", slot, (frame_number, now - self.started_at)))
+
+    def run(self):
+        while True:
+            kind, slot, data = self.pending.get()
+            if kind == "stop":
+                break
+            try:
+                if kind == "png":
+                    pygame.image.save(self.ring[slot], data)
+                elif kind == "frame":
+                    self.write_frame(slot, *data)
+                elif kind == "open":
+                    self.open_recording(data)
+                elif kind == "close":
+                    self.close_recording(data)
+            except (OSError, pygame.error) as e:
+                print(f"Capture failed ({kind}): {e}")
+            finally:
+                if slot is not None:
+                    self.free.put(slot)
+        self.close_recording(None)
+
+    def open_recording(self, folder):
+        self.frames_file = open(os.path.join(folder, FRAMES_NAME), "wb")
+        self.index = []
+        self.offset = 0
+
+    def write_frame(self, slot, frame_number, seconds):
+        if not self.frames_file:
+            return
+        # zlib releases the GIL, so compressing doesn't hold up the game thread
+        data = zlib.compress(pygame.image.tobytes(self.ring[slot], "RGB"), self.level)
+        self.frames_file.write(RECORD_HEADER.pack(len(data)))
+        self.frames_file.write(data)
+        self.index.append([frame_number, round(seconds, 4), self.offset + RECORD_HEADER.size, len(data)])
+        self.offset += RECORD_HEADER.size + len(data)
+
+    def close_recording(self, folder):
+        if not self.frames_file:
+            return
+        folder = folder or os.path.dirname(self.frames_file.name)
+        self.frames_file.close()
+        self.frames_file = None
+        with open(os.path.join(folder, INDEX_NAME), "w") as f:
+            json.dump({"size": list(self.size), "frames": self.index, "dropped": self.dropped}, f)
+
+    def close(self):
+        """Finish the recording and any queued screenshots"""
+        self.stop()
+        self.pending.put(("stop", None, None))
+        self.thread.join()
+
+def read_frames(folder):
+    """Yield (frame number, seconds, surface) from a recording folder"""
+    with open(os.path.join(folder, INDEX_NAME)) as f:
+        index = json.load(f)
+    size = tuple(index["size"])
+    with open(os.path.join(folder, FRAMES_NAME), "rb") as f:
+        for frame_number, seconds, offset, length in index["frames"]:
+            f.seek(offset)
+            pixels = zlib.decompress(f.read(length))
+            yield frame_number, seconds, pygame.image.frombytes(pixels, size, "RGB")
+
+def encode(folder, output=None):
+    """Write a recording out as frame_NNNNNN.png files; returns how many"""
+    output = output or os.path.join(folder, "png")
+    os.makedirs(output, exist_ok=True)
+    count = 0
+    for frame_number, _, surface in read_frames(folder):
+        pygame.image.save(surface, os.path.join(output, f"frame_{frame_number:06d}.png"))
+        count += 1
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="Work with recorded game sessions")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    encode_parser = subparsers.add_parser("encode", help="convert a recording to a PNG sequence")
+    encode_parser.add_argument("folder", help="session folder containing frames.bin")
+    encode_parser.add_argument("--output", help="where to write the PNGs (default: FOLDER/png)")
+    args = parser.parse_args()
+
+    if args.command == "encode":
+        count = encode(args.folder, args.output)
+        print(f"Wrote {count} frames")
+
+if __name__ == "__main__":
+    main()
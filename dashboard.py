@@ -1,53 +1,100 @@
 import pygame
-from utils import draw_text, create_button, resource_path
+from utils import draw_text, create_button, load_image, load_shared_image, track_surface
+from widgets import Button, button_frames
+from image_fx import vertical_gradient
+
+# Rendered status panels keyed by (level, completed); they only change with progress
+_status_panels = {}
+
+def format_seconds(seconds):
+    """42s / 1m 05s, or a dash when there's no time yet"""
+    if seconds is None:
+        return "-"
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    return f"{seconds // 60}m {seconds % 60:02d}s"
 
 class Dashboard:
-    def __init__(self, screen):
+    def __init__(self, screen, classroom=False):
         self.screen = screen
         self.width, self.height = screen.get_size()
         
         # Load background - same as start screen
         try:
-            self.background = pygame.image.load(resource_path('assets/images/start_background.png'))
-            self.background = pygame.transform.scale(self.background, (self.width, self.height))
+            self.background = load_shared_image('assets/images/start_background.png', (self.width, self.height))
         except:
             # Fallback: create a colorful gradient background
-            self.background = pygame.Surface((self.width, self.height))
-            for i in range(self.height):
-                color_value = int(150 + (i / self.height) * 105)
-                pygame.draw.line(self.background, (100, color_value, 255), (0, i), (self.width, i))
+            self.background = vertical_gradient((self.width, self.height), (100, 150, 255), (100, 255, 255))
             
         # Load Checkmark
         try:
-            self.check_mark = pygame.image.load(resource_path('assets/images/check_mark.png'))
-            self.check_mark = pygame.transform.scale(self.check_mark, (60, 60))
+            self.check_mark = load_image('assets/images/check_mark.png', (60, 60))
         except:
             self.check_mark = None
 
         # Start Game Button (Arabic Image)
         from utils import load_arabic_image
-        self.start_button = load_arabic_image('Start-game.png', (300, 100))
-        if not self.start_button:
+        self.start_button = Button(
+            ((self.width - 300) // 2, self.height - 150, 300, 100),
             # Fallback to English button if image not found
-            self.start_button = create_button("Start Game", 0, 0, 300, 100, (50, 200, 50), font_size=40)
-        self.start_button_rect = pygame.Rect((self.width - 300) // 2, self.height - 150, 300, 100)
+            button_frames("Start-game.png 300x100", lambda: load_arabic_image('Start-game.png', (300, 100))
+                          or create_button("Start Game", 0, 0, 300, 100, (50, 200, 50), font_size=40)))
+        self.start_button_rect = self.start_button.rect
+        
+        # Classroom mode: button back to the profile picker
+        self.profiles_button = None
+        if classroom:
+            self.profiles_button = Button((20, 20, 220, 60), button_frames("dashboard: Change Player", lambda: create_button(
+                "Change Player", 0, 0, 220, 60, (50, 150, 200), font_size=26)))
+        
+        # History view toggle (attempts, average time and weekly trend per level)
+        self.show_history = False
+        self.history_button = Button((self.width - 200, 20, 180, 60))
+        self.history_frames = button_frames("dashboard: History", lambda: create_button(
+            "History", 0, 0, 180, 60, (200, 120, 50), font_size=26))
+        self.progress_frames = button_frames("dashboard: Progress", lambda: create_button(
+            "Progress", 0, 0, 180, 60, (200, 120, 50), font_size=26))
+        self.history_panels = None  # (summary it was drawn from, surface)
+        
+        # Background, title and panels composited into one surface, redrawn only
+        # when what they show changes (see composite_key)
+        self.composite = None  # (key, surface)
         
+    def enter(self):
+        """Called when the Dashboard is shown again (it's kept between visits)"""
+        for button in (self.start_button, self.profiles_button, self.history_button):
+            if button:
+                button.reset()
+    
     def handle_event(self, event):
-        """Handle events, return 'start' if start button clicked"""
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.start_button_rect.collidepoint(event.pos):
-                return "start"
+        """Handle events, return 'start' or 'profiles' if a button was clicked"""
+        if self.start_button.handle_event(event):
+            return "start"
+        if self.profiles_button and self.profiles_button.handle_event(event):
+            return "profiles"
+        if self.history_button.handle_event(event):
+            self.show_history = not self.show_history
         return None
         
-    def draw_status_panel(self, x, y, level_num, completed):
+    def status_panel(self, level_num, completed):
+        """Status panel surface for a level, rendered once per (level, completed)"""
+        key = (level_num, completed)
+        if key not in _status_panels:
+            panel = pygame.Surface((250, 300), pygame.SRCALPHA)
+            self.draw_status_panel(panel, 0, 0, level_num, completed)
+            _status_panels[key] = track_surface(panel, f"status panel:{level_num}:{completed}")
+        return _status_panels[key]
+        
+    def draw_status_panel(self, surface, x, y, level_num, completed):
         """Draw a status panel for a level"""
         # Panel background
         rect = pygame.Rect(x, y, 250, 300)
-        pygame.draw.rect(self.screen, (255, 255, 255, 200), rect, border_radius=15)
-        pygame.draw.rect(self.screen, (100, 100, 100), rect, 3, border_radius=15)
+        pygame.draw.rect(surface, (255, 255, 255), rect, border_radius=15)
+        pygame.draw.rect(surface, (100, 100, 100), rect, 3, border_radius=15)
         
         # Level Title (English Text)
-        draw_text(self.screen, f"Level {level_num}", 40, x + 125, y + 50, (50, 50, 50))
+        draw_text(surface, f"Level {level_num}", 40, x + 125, y + 50, (50, 50, 50))
         
         # Status Icon
         center_x = x + 125
@@ -56,38 +103,103 @@ class Dashboard:
         
         if completed:
             # Green circle
-            pygame.draw.circle(self.screen, (50, 200, 50), (center_x, center_y), radius)
+            pygame.draw.circle(surface, (50, 200, 50), (center_x, center_y), radius)
             # Draw Checkmark PNG
             if self.check_mark:
                 check_rect = self.check_mark.get_rect(center=(center_x, center_y))
-                self.screen.blit(self.check_mark, check_rect)
+                surface.blit(self.check_mark, check_rect)
             else:
-                draw_text(self.screen, "Done", 30, center_x, center_y, (255, 255, 255))
+                draw_text(surface, "Done", 30, center_x, center_y, (255, 255, 255))
             
-            draw_text(self.screen, "Completed", 30, center_x, y + 250, (50, 200, 50))
+            draw_text(surface, "Completed", 30, center_x, y + 250, (50, 200, 50))
         else:
             # Grey circle
-            pygame.draw.circle(self.screen, (200, 200, 200), (center_x, center_y), radius)
+            pygame.draw.circle(surface, (200, 200, 200), (center_x, center_y), radius)
             # Lock icon or just empty
-            pygame.draw.rect(self.screen, (150, 150, 150), (center_x - 20, center_y - 20, 40, 40))
-            pygame.draw.circle(self.screen, (150, 150, 150), (center_x, center_y - 30), 20, 5)
+            pygame.draw.rect(surface, (150, 150, 150), (center_x - 20, center_y - 20, 40, 40))
+            pygame.draw.circle(surface, (150, 150, 150), (center_x, center_y - 30), 20, 5)
             
-            draw_text(self.screen, "Not Yet", 30, center_x, y + 250, (150, 150, 150))
+            draw_text(surface, "Not Yet", 30, center_x, y + 250, (150, 150, 150))
+
+    def render_history_panels(self, summary):
+        """Render the three history panels onto one surface"""
+        surface = pygame.Surface((3 * 250 + 2 * 50, 300), pygame.SRCALPHA)
+        for i, level_num in enumerate((1, 2, 3)):
+            self.draw_history_panel(surface, i * 300, 0, level_num, summary[level_num])
+        return track_surface(surface, "history panels")
 
-    def draw(self, level_status):
-        """Draw the dashboard with current status"""
-        self.screen.blit(self.background, (0, 0))
+    def draw_history_panel(self, surface, x, y, level_num, stats):
+        """Draw attempts, times and a weekly trend chart for a level"""
+        rect = pygame.Rect(x, y, 250, 300)
+        pygame.draw.rect(surface, (255, 255, 255), rect, border_radius=15)
+        pygame.draw.rect(surface, (100, 100, 100), rect, 3, border_radius=15)
+        center_x = x + 125
         
-        # Title
-        draw_text(self.screen, "Progress Dashboard", 60, self.width // 2, 80, (255, 255, 255))
+        draw_text(surface, f"Level {level_num}", 40, center_x, y + 35, (50, 50, 50))
+        draw_text(surface, f"Tries: {stats['attempts']}   Done: {stats['completions']}", 24,
+                  center_x, y + 80, (50, 50, 50))
+        average = stats["average_seconds"]
+        best = stats["best_seconds"]
+        draw_text(surface, f"Average: {format_seconds(average)}", 24, center_x, y + 110, (50, 50, 50))
+        draw_text(surface, f"Best: {format_seconds(best)}", 24, center_x, y + 140, (50, 50, 50))
+        
+        # Weekly average time, oldest week on the left (shorter bar = faster)
+        trend = stats["trend"]
+        times = [t for t in trend if t is not None]
+        chart = pygame.Rect(x + 25, y + 170, 200, 90)
+        pygame.draw.line(surface, (150, 150, 150), chart.bottomleft, chart.bottomright, 2)
+        if times:
+            longest = max(times)
+            bar_width = chart.width // max(1, len(trend))
+            for i, seconds in enumerate(trend):
+                if seconds is None:
+                    continue
+                height = max(4, int(chart.height * seconds / longest))
+                bar = pygame.Rect(chart.left + i * bar_width + 3, chart.bottom - height, bar_width - 6, height)
+                color = (50, 200, 50) if i == len(trend) - 1 else (100, 150, 220)
+                pygame.draw.rect(surface, color, bar, border_radius=3)
+        if len(times) >= 2:
+            label, color = ("Getting faster", (50, 200, 50)) if times[-1] < times[-2] else ("Keep practising", (200, 120, 50))
+        else:
+            label, color = ("Needs more weeks", (150, 150, 150))
+        draw_text(surface, label, 22, center_x, y + 280, color)
+
+    def compose(self, level_status, summary):
+        """Render background, title and panels into one screen-sized surface"""
+        surface = pygame.Surface((self.width, self.height)).convert()
+        surface.blit(self.background, (0, 0))
         
         # Draw panels
         start_x = (self.width - (3 * 250 + 2 * 50)) // 2
         y = 150
         
-        self.draw_status_panel(start_x, y, 1, level_status.get(1, False))
-        self.draw_status_panel(start_x + 300, y, 2, level_status.get(2, False))
-        self.draw_status_panel(start_x + 600, y, 3, level_status.get(3, False))
+        if summary is not None:
+            draw_text(surface, "Play History", 60, self.width // 2, 80, (255, 255, 255))
+            if self.history_panels is None or self.history_panels[0] is not summary:
+                self.history_panels = (summary, self.render_history_panels(summary))
+            surface.blit(self.history_panels[1], (start_x, y))
+        else:
+            # Title
+            draw_text(surface, "Progress Dashboard", 60, self.width // 2, 80, (255, 255, 255))
+            
+            for i, level_num in enumerate((1, 2, 3)):
+                surface.blit(self.status_panel(level_num, level_status.get(level_num, False)), (start_x + i * 300, y))
+        return track_surface(surface, "dashboard composite")
+
+    def draw(self, level_status, history=None):
+        """Draw the dashboard with current status (or the play history)"""
+        summary = history.summary() if self.show_history and history else None
+        # The summary is a new object whenever the history changes
+        key = (tuple(level_status.get(level, False) for level in (1, 2, 3)), id(summary))
+        if self.composite is None or self.composite[0] != key:
+            self.composite = (key, self.compose(level_status, summary))
+        self.screen.blit(self.composite[1], (0, 0))
+        
+        if history:
+            self.history_button.draw(self.screen, self.progress_frames if self.show_history else self.history_frames)
         
         # Draw Start Button
-        self.screen.blit(self.start_button, self.start_button_rect)
+        self.start_button.draw(self.screen)
+        
+        if self.profiles_button:
+            self.profiles_button.draw(self.screen)
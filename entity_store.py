@@ -0,0 +1,183 @@
+"""
+Array-backed entity storage for the Transportation Game levels
+A level keeps its draggable pieces (and its drop targets) in an EntityStore:
+positions, sizes, ids and flags live in NumPy arrays, and each piece is a
+small __slots__ view onto one row, so hit tests and resets run over all
+pieces at once.
+"""
+import numpy as np
+import pygame
+
+class EntityStore:
+    """Parallel arrays of rects, home positions, ids, flags and presentation state
+
+    Rows are kept in pick/draw order, the same order as views; reorder()
+    moves rows and views together.
+    """
+    def __init__(self, capacity=8):
+        self.count = 0
+        self.views = []
+        self.xy = np.zeros((capacity, 2), np.int32)  # Top-left
+        self.size = np.zeros((capacity, 2), np.int32)
+        self.home = np.zeros((capacity, 2), np.int32)  # Where reset() and return_to_start() put it
+        self.offset = np.zeros((capacity, 2), np.int32)  # Drawn offset from xy (tweened)
+        self.ids = np.zeros(capacity, np.int32)
+        self.dragging = np.zeros(capacity, bool)
+        self.matched = np.zeros(capacity, bool)
+        self.highlight = np.zeros(capacity, bool)
+        self.hover = np.zeros(capacity, bool)
+        self.anim = np.zeros(capacity, np.float32)  # Idle animation frame cursor (idle_anim.py)
+        self.alpha = np.full(capacity, 255.0, np.float32)
+        self.scale = np.ones(capacity, np.float32)
+
+    def columns(self):
+        return ("xy", "size", "home", "offset", "ids", "dragging", "matched", "highlight", "hover", "anim",
+                "alpha", "scale")
+
+    def add(self, view, x, y, width, height, entity_id=0):
+        """Give view a new row and return its index"""
+        if self.count == len(self.ids):
+            self.grow(2 * len(self.ids))
+        index = self.count
+        self.count += 1
+        self.xy[index] = (x, y)
+        self.size[index] = (width, height)
+        self.home[index] = (x, y)
+        self.ids[index] = entity_id
+        self.views.append(view)
+        return index
+
+    def grow(self, capacity):
+        for name in self.columns():
+            column = getattr(self, name)
+            grown = np.zeros((capacity,) + column.shape[1:], column.dtype)
+            grown[:len(column)] = column
+            if name == "alpha":
+                grown[len(column):] = 255.0
+            elif name == "scale":
+                grown[len(column):] = 1.0
+            setattr(self, name, grown)
+
+    def reorder(self, indices):
+        """Put rows (and views) in the order of indices, e.g. when restoring a snapshot"""
+        indices = np.asarray(indices, np.intp)
+        for name in self.columns():
+            column = getattr(self, name)
+            column[:self.count] = column[indices]
+        self.views = [self.views[i] for i in indices]
+        for index, view in enumerate(self.views):
+            view.index = index
+
+    def contains(self, pos):
+        """Bool array: which rects contain the point pos"""
+        n = self.count
+        x, y = pos
+        left, top = self.xy[:n, 0], self.xy[:n, 1]
+        return ((left <= x) & (x < left + self.size[:n, 0]) &
+                (top <= y) & (y < top + self.size[:n, 1]))
+
+    def overlaps(self, rect):
+        """Bool array: which rects overlap rect (pygame.Rect.colliderect rules)"""
+        n = self.count
+        left, top = self.xy[:n, 0], self.xy[:n, 1]
+        return ((left < rect.right) & (rect.left < left + self.size[:n, 0]) &
+                (top < rect.bottom) & (rect.top < top + self.size[:n, 1]))
+
+    def hit(self, pos, include_matched=False):
+        """Views whose rect contains pos, in pick order (unmatched only by default)"""
+        hits = self.contains(pos)
+        if not include_matched:
+            hits &= ~self.matched[:self.count]
+        return [self.views[i] for i in np.flatnonzero(hits)]
+
+    def colliding(self, rect, include_matched=False):
+        """Views whose rect overlaps rect, in pick order (unmatched only by default)"""
+        hits = self.overlaps(rect)
+        if not include_matched:
+            hits &= ~self.matched[:self.count]
+        return [self.views[i] for i in np.flatnonzero(hits)]
+
+    def set_highlight(self, flags=False):
+        """Set every highlight flag from a bool array (or one value)"""
+        self.highlight[:self.count] = flags
+
+    def matched_count(self):
+        return int(np.count_nonzero(self.matched[:self.count]))
+
+    def reset(self):
+        """Everything back home, unmatched and not animating"""
+        n = self.count
+        self.xy[:n] = self.home[:n]
+        self.offset[:n] = 0
+        self.dragging[:n] = False
+        self.matched[:n] = False
+        self.highlight[:n] = False
+        self.hover[:n] = False
+        self.anim[:n] = 0.0
+        self.alpha[:n] = 255.0
+        self.scale[:n] = 1.0
+
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in self.columns())
+
+def _pair(name):
+    def get(self):
+        x, y = getattr(self.store, name)[self.index]
+        return (int(x), int(y))
+    def set(self, value):
+        getattr(self.store, name)[self.index] = value
+    return property(get, set)
+
+def _value(name, kind):
+    def get(self):
+        return kind(getattr(self.store, name)[self.index])
+    def set(self, value):
+        getattr(self.store, name)[self.index] = value
+    return property(get, set)
+
+class EntityView:
+    """One row of an EntityStore, with the attribute names the levels use
+
+    rect returns a new pygame.Rect on every read, so move a view with
+    move_to()/center_on() (or assign a whole rect), not by mutating rect.
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, x, y, width, height, entity_id=0):
+        self.store = store
+        self.index = store.add(self, x, y, width, height, entity_id)
+
+    @property
+    def rect(self):
+        (x, y), (width, height) = self.store.xy[self.index], self.store.size[self.index]
+        return pygame.Rect(int(x), int(y), int(width), int(height))
+
+    @rect.setter
+    def rect(self, rect):
+        self.store.xy[self.index] = rect.topleft
+        self.store.size[self.index] = rect.size
+
+    def move_to(self, topleft):
+        self.store.xy[self.index] = topleft
+
+    def center_on(self, pos):
+        width, height = self.store.size[self.index]
+        self.store.xy[self.index] = (pos[0] - int(width) // 2, pos[1] - int(height) // 2)
+
+    @property
+    def drawn_pos(self):
+        """Top-left plus the animated offset: where the renderer draws it"""
+        x, y = (self.store.xy[self.index] + self.store.offset[self.index]).tolist()
+        return (x, y)
+
+    topleft = _pair("xy")
+    original_pos = _pair("home")
+    offset = _pair("offset")
+    entity_id = _value("ids", int)
+    dragging = _value("dragging", bool)
+    matched = _value("matched", bool)
+    highlight = _value("highlight", bool)
+    hover = _value("hover", bool)
+    anim = _value("anim", float)
+    alpha = _value("alpha", float)
+    scale = _value("scale", float)
@@ -0,0 +1,158 @@
+"""
+Play history for the Transportation Game
+Sessions are folded into small daily rollup files plus one weekly rollup, so the
+Dashboard's history view reads a single aggregate instead of raw session data.
+"""
+import json
+import os
+import time
+
+HISTORY_VERSION = 1
+WEEKS_NAME = "weeks.json"
+KEEP_WEEKS = 52  # Older weeks are dropped from the weekly rollup (daily files stay)
+
+def empty_rollup():
+    return {"attempts": 0, "completions": 0, "total_seconds": 0.0, "best_seconds": None}
+
+def add_rollup(total, delta):
+    """Fold one rollup record into another"""
+    total["attempts"] += delta["attempts"]
+    total["completions"] += delta["completions"]
+    total["total_seconds"] += delta["total_seconds"]
+    best = delta["best_seconds"]
+    if best is not None and (total["best_seconds"] is None or best < total["best_seconds"]):
+        total["best_seconds"] = best
+
+def week_key(when=None):
+    """ISO week label such as 2026-W07"""
+    return time.strftime("%G-W%V", time.localtime(when))
+
+def day_key(when=None):
+    return time.strftime("%Y-%m-%d", time.localtime(when))
+
+def read_json(path):
+    try:
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable history file {path}: {e}")
+        return None
+    if data.get("version") != HISTORY_VERSION:
+        print(f"Ignoring history file with version {data.get('version')}")
+        return None
+    return data
+
+class HistoryStore:
+    """Per-day and per-week level rollups, updated incrementally
+
+    Each attempt and completion is folded into today's file and the weekly file
+    as it happens, so the history view is always current. Today's file is read
+    once, at startup; all writes go through the shared BackgroundWriter, so
+    nothing here touches the disk during a frame.
+    """
+    def __init__(self, directory, writer):
+        self.directory = directory
+        os.makedirs(os.path.join(directory, "days"), exist_ok=True)
+        self.writer = writer
+        self.weeks_path = os.path.join(directory, WEEKS_NAME)
+        self.session = {}  # level -> rollup not yet folded
+        self.today = None  # (day key, {level: rollup}) for the day file last written
+        self.weeks = {}  # week key -> {level: rollup}
+        self.summary_cache = None
+        self.load()
+
+    def load(self):
+        data = read_json(self.weeks_path)
+        if data is not None:
+            self.weeks = {week: {int(level): self.merged(record) for level, record in levels.items()}
+                          for week, levels in data.get("weeks", {}).items()}
+        day = day_key()
+        data = read_json(self.day_path(day))
+        self.today = (day, {int(level): self.merged(record)
+                            for level, record in (data or {}).get("levels", {}).items()})
+
+    def merged(self, record):
+        rollup = empty_rollup()
+        rollup.update(record)
+        return rollup
+
+    def session_record(self, level):
+        if level not in self.session:
+            self.session[level] = empty_rollup()
+        return self.session[level]
+
+    def record_attempt(self, level):
+        self.session_record(level)["attempts"] += 1
+        self.fold()
+
+    def record_completion(self, level, seconds):
+        record = self.session_record(level)
+        record["completions"] += 1
+        record["total_seconds"] += seconds
+        if record["best_seconds"] is None or seconds < record["best_seconds"]:
+            record["best_seconds"] = seconds
+        self.fold()
+
+    def day_path(self, day):
+        return os.path.join(self.directory, "days", f"{day}.json")
+
+    def fold(self, when=None):
+        """Add this session's numbers to today's and this week's rollups"""
+        if not self.session:
+            return
+        day = day_key(when)
+        if self.today[0] != day:
+            # Played past midnight: only this store writes the new day's file
+            self.today = (day, {})
+        week = self.weeks.setdefault(week_key(when), {})
+        for level, delta in self.session.items():
+            add_rollup(self.today[1].setdefault(level, empty_rollup()), delta)
+            add_rollup(week.setdefault(level, empty_rollup()), delta)
+        self.session = {}
+        self.summary_cache = None
+
+        for old_week in sorted(self.weeks)[:-KEEP_WEEKS]:
+            del self.weeks[old_week]
+        self.save(day)
+
+    def save(self, day):
+        day_data = {"version": HISTORY_VERSION, "day": day,
+                    "levels": {str(level): dict(r) for level, r in self.today[1].items()}}
+        week_data = {"version": HISTORY_VERSION,
+                     "weeks": {week: {str(level): dict(r) for level, r in levels.items()}
+                               for week, levels in self.weeks.items()}}
+        self.writer.submit(self.day_path(day), lambda: json.dumps(day_data, separators=(",", ":")).encode("utf-8"))
+        self.writer.submit(self.weeks_path, lambda: json.dumps(week_data, separators=(",", ":")).encode("utf-8"))
+
+    def summary(self, levels=(1, 2, 3), weeks=8):
+        """Per-level totals and the average time of each of the last few weeks
+
+        Returns {level: {"attempts", "completions", "average_seconds",
+        "best_seconds", "trend": [average seconds or None per week, oldest first]}}.
+        Cached until the next fold().
+        """
+        if self.summary_cache is None:
+            recent = sorted(self.weeks)[-weeks:]
+            summary = {}
+            for level in levels:
+                total = empty_rollup()
+                trend = []
+                for week in recent:
+                    record = self.weeks[week].get(level)
+                    if record:
+                        add_rollup(total, record)
+                    if record and record["completions"]:
+                        trend.append(record["total_seconds"] / record["completions"])
+                    else:
+                        trend.append(None)
+                summary[level] = {
+                    "attempts": total["attempts"],
+                    "completions": total["completions"],
+                    "average_seconds": total["total_seconds"] / total["completions"] if total["completions"] else None,
+                    "best_seconds": total["best_seconds"],
+                    "trend": trend,
+                }
+            self.summary_cache = summary
+        return self.summary_cache
@@ -0,0 +1,123 @@
+"""
+Idle animations for the Transportation Game vehicles
+Each vehicle type gets a short looping strip (helicopters wobble, boats bob,
+cars bounce) pre-rendered once with rotozoom/smoothscale; entities only keep
+a frame cursor in their EntityStore, advanced while the mouse hovers them.
+"""
+import math
+import pygame
+from memory_report import track_surface
+from tween import scheduler
+
+FRAMES = 24  # Frames per loop
+FRAME_RATE = 30  # Strip frames per second, so a loop lasts 0.8s
+
+# Motion per vehicle type; unknown types bounce
+STYLES = {
+    "helicopter": "wobble",
+    "plane": "bank",
+    "boat": "bob",
+    "ship": "bob",
+    "car": "bounce",
+    "bus": "bounce",
+    "train": "bounce",
+    "bike": "bounce",
+}
+
+# Rendered strips keyed by (vehicle type, size), shared across levels and restarts
+_strips = {}
+
+class FrameStrip:
+    """Pre-rendered frames of one image, with where to draw each relative to the image's top-left"""
+    def __init__(self, frames, offsets):
+        self.frames = frames
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.frames)
+
+    def frame(self, cursor):
+        """(surface, (dx, dy)) for a cursor position in frames"""
+        index = int(cursor) % len(self.frames)
+        return self.frames[index], self.offsets[index]
+
+def pose(style, phase):
+    """(angle in degrees, x scale, y scale, dy) at phase 0..2pi of a loop"""
+    if style == "wobble":
+        return 6 * math.sin(phase), 1.0, 1.0, -2 * math.sin(2 * phase)
+    if style == "bank":
+        return 8 * math.sin(phase), 1.0, 1.0, -4 * math.sin(phase + math.pi / 2)
+    if style == "bob":
+        return 4 * math.sin(phase), 1.0, 1.0, 4 * math.sin(phase + math.pi / 2)
+    # Bounce: squash on landing, stretch on the way up
+    height = abs(math.sin(phase))
+    squash = 0.08 * (1 - height) ** 4
+    return 0.0, 1 + squash, 1 - squash + 0.04 * height, -10 * height
+
+def render_strip(image, style, frames=FRAMES):
+    """Render one loop of style from image"""
+    width, height = image.get_size()
+    surfaces = []
+    offsets = []
+    for i in range(frames):
+        angle, scale_x, scale_y, dy = pose(style, 2 * math.pi * i / frames)
+        frame = image
+        if scale_x != 1.0 or scale_y != 1.0:
+            frame = pygame.transform.smoothscale(frame, (round(width * scale_x), round(height * scale_y)))
+        if angle:
+            frame = pygame.transform.rotozoom(frame, angle, 1.0)
+        # Keep the bottom center where it was (the wheels stay on the ground when squashing)
+        offset = ((width - frame.get_width()) // 2,
+                  height - frame.get_height() + (frame.get_height() - round(height * scale_y)) // 2 + round(dy))
+        surfaces.append(frame)
+        offsets.append(offset)
+    return FrameStrip(surfaces, offsets)
+
+def idle_strip(vehicle_type, image):
+    """The cached FrameStrip for a vehicle type at image's size"""
+    key = (vehicle_type, image.get_size())
+    if key not in _strips:
+        strip = render_strip(image, STYLES.get(vehicle_type, "bounce"))
+        for i, frame in enumerate(strip.frames):
+            track_surface(frame, f"idle:{vehicle_type}:{i}")
+        _strips[key] = strip
+    return _strips[key]
+
+class IdleAnimator:
+    """Plays the idle loops of an EntityStore's hovered entities
+
+    Lives in the tween scheduler only while something is playing, so an idle
+    screen still stops redrawing. A piece that is no longer hovered finishes
+    its loop back to frame 0 instead of snapping.
+    """
+    target = None  # Not tied to one entity (scheduler.cancel leaves it alone)
+
+    def __init__(self, store, length=FRAMES):
+        self.store = store
+        self.length = length
+        self.playing = False
+
+    def hover(self, pos=None):
+        """Hover the unmatched entities under pos (none if pos is None)"""
+        store = self.store
+        n = store.count
+        if pos is None:
+            store.hover[:n] = False
+            return
+        store.hover[:n] = store.contains(pos) & ~store.matched[:n] & ~store.dragging[:n]
+        if not self.playing and store.hover[:n].any():
+            self.playing = True
+            scheduler.add(self)
+
+    def update(self, dt):
+        store = self.store
+        n = store.count
+        cursor = store.anim[:n]
+        hover = store.hover[:n]
+        active = hover | (cursor > 0)
+        cursor[active] += dt * FRAME_RATE
+        done = cursor >= self.length
+        cursor[done & hover] -= self.length
+        cursor[done & ~hover] = 0
+        self.playing = bool(hover.any() or (cursor > 0).any())
+        return self.playing
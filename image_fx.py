@@ -0,0 +1,101 @@
+"""
+Procedural image effects for the Transportation Game
+Gradients, soft silhouettes, outline glows and color tints computed over whole
+pixel arrays with pygame.surfarray (no per-pixel Python), cached by name.
+"""
+import numpy as np
+import pygame
+from memory_report import track_surface
+
+# Finished effect surfaces keyed by (effect, name, source size, parameters)
+_effects = {}
+
+def cached(key, build):
+    """Return _effects[key], calling build() the first time; key None means don't cache"""
+    if key is None:
+        return build()
+    if key not in _effects:
+        _effects[key] = build()
+    return _effects[key]
+
+def box_blur(values, radius, passes=2):
+    """Blur a 2D array with a (2*radius+1) box, passes times (two passes look close to Gaussian)"""
+    values = values.astype(np.float32)
+    if radius <= 0:
+        return values
+    size = 2 * radius + 1
+    for _ in range(passes):
+        for axis in (0, 1):
+            padding = [(0, 0), (0, 0)]
+            padding[axis] = (radius + 1, radius)
+            sums = np.cumsum(np.pad(values, padding), axis=axis)
+            ahead = [slice(None), slice(None)]
+            behind = [slice(None), slice(None)]
+            ahead[axis] = slice(size, None)
+            behind[axis] = slice(0, -size)
+            values = (sums[tuple(ahead)] - sums[tuple(behind)]) / size
+    return values
+
+def shape_alpha(image, threshold=127):
+    """Bool array (width, height): pixels that belong to the image's shape (like mask.from_surface)"""
+    return pygame.surfarray.array_alpha(image) > threshold
+
+def alpha_surface(color, alpha):
+    """New SRCALPHA surface of one color with the given (width, height) alpha array"""
+    surface = pygame.Surface(alpha.shape, pygame.SRCALPHA)
+    surface.fill(color)
+    pixels = pygame.surfarray.pixels_alpha(surface)
+    pixels[...] = np.clip(alpha, 0, 255).astype(np.uint8)
+    del pixels  # Unlocks the surface
+    return surface
+
+def vertical_gradient(size, top, bottom):
+    """Opaque surface fading from the top color to the bottom color"""
+    def build():
+        width, height = size
+        t = np.arange(height, dtype=np.float32)[:, None] / height
+        rows = (np.array(top, np.float32) + (np.array(bottom, np.float32) - np.array(top, np.float32)) * t)
+        surface = pygame.Surface(size)
+        pygame.surfarray.blit_array(surface, np.broadcast_to(rows.astype(np.uint8)[None], (width, height, 3)))
+        return track_surface(surface, f"gradient {size[0]}x{size[1]}")
+    return cached(("gradient", tuple(size), tuple(top), tuple(bottom)), build)
+
+def silhouette(name, image, color=(0, 0, 0), alpha=100, blur=0):
+    """The image's shape filled with color at alpha, its edge softened by blur pixels"""
+    def build():
+        shape = shape_alpha(image) * np.float32(alpha)
+        return track_surface(alpha_surface(color, box_blur(shape, blur)), f"silhouette:{name}")
+    return cached(("silhouette", name, image.get_size(), tuple(color), alpha, blur) if name else None, build)
+
+def outline_glow(name, image, color=(255, 255, 100), radius=8, strength=3.0):
+    """A soft halo of color around the image's shape (and not over it)
+
+    The surface is radius pixels bigger on every side; center it on the image.
+    """
+    def build():
+        shape = np.pad(shape_alpha(image), radius).astype(np.float32)
+        halo = box_blur(shape * 255, radius // 2 + 1) * strength
+        return track_surface(alpha_surface(color, halo * (1 - shape)), f"glow:{name}")
+    return cached(("glow", name, image.get_size(), tuple(color), radius, strength) if name else None, build)
+
+def tinted(name, image, color, strength=0.6):
+    """Copy of image with its colors multiplied towards color (alpha kept)"""
+    def build():
+        factor = (1 - strength) + strength * np.array(color[:3], np.float32) / 255
+        rgb = pygame.surfarray.array3d(image) * factor
+        surface = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+        pygame.surfarray.blit_array(surface, rgb.astype(np.uint8))
+        pixels = pygame.surfarray.pixels_alpha(surface)
+        pixels[...] = pygame.surfarray.array_alpha(image)
+        del pixels
+        return track_surface(surface, f"tinted:{name}")
+    return cached(("tint", name, image.get_size(), tuple(color), strength) if name else None, build)
+
+def scaled_frames(name, image, scales):
+    """Copies of image smoothscaled by each factor in scales, so a size animation is just blits"""
+    def build():
+        width, height = image.get_size()
+        return [track_surface(pygame.transform.smoothscale(image, (round(width * scale), round(height * scale))),
+                              f"scaled:{name}:{scale:g}")
+                for scale in scales]
+    return cached(("scaled", name, image.get_size(), tuple(scales)) if name else None, build)
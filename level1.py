@@ -4,83 +4,188 @@ Players drag transportation images to match their shadows
 """
 import pygame
 import random
-from utils import SparkleEffect, ShakeAnimation, create_shadow, create_vehicle_image, draw_text, resource_path, load_sound, create_button
+from utils import SparkleEffect, best_drop_target, collision_mask, create_shadow, create_vehicle_image, resource_path, load_sound, create_button, load_arabic_image
+from widgets import Button, button_frames
+from entity_store import EntityStore, EntityView
+from image_fx import outline_glow
+from idle_anim import IdleAnimator, idle_strip
+from render import DrawList, LAYER_BACKGROUND, LAYER_OUTLINES, LAYER_TARGETS, LAYER_PIECES, LAYER_EFFECTS, LAYER_DRAGGED, LAYER_OVERLAY, LAYER_UI, make_overlay, make_solid_background
+from telemetry import emit
+from tween import scheduler, Shake, Tween
 
-class DraggableVehicle:
-    """A vehicle that can be dragged"""
-    def __init__(self, image, x, y, vehicle_id):
+# Seconds for a wrong drop to glide home, and for a match to snap and fade
+RETURN_SECONDS = 0.3
+SNAP_SECONDS = 0.15
+FADE_SECONDS = 0.3
+# Share of the smaller shape that must overlap the shadow for a precise drop
+DROP_OVERLAP = 0.25
+
+class DraggableVehicle(EntityView):
+    """A vehicle that can be dragged
+
+    Position, flags and presentation state (offset, alpha; animated by the
+    tween scheduler) live in the level's vehicle EntityStore.
+    """
+    __slots__ = ("original_image", "image", "vehicle_type", "mask", "strip")
+    vehicle_id = EntityView.entity_id
+    
+    def __init__(self, store, image, x, y, vehicle_id, vehicle_type=None):
+        super().__init__(store, x, y, *image.get_size(), vehicle_id)
         self.original_image = image
         self.image = image
-        self.rect = image.get_rect(topleft=(x, y))
-        self.original_pos = (x, y)
-        self.dragging = False
-        self.matched = False
-        self.vehicle_id = vehicle_id
-        self.shake = None
+        self.vehicle_type = vehicle_type  # Picks the idle animation
+        self.mask = None  # Collision mask, set when the level uses precise drops
+        self.strip = None  # Idle animation frames (idle_anim.FrameStrip), set by the level
     
     def start_drag(self, mouse_pos):
         if self.rect.collidepoint(mouse_pos) and not self.matched:
+            scheduler.cancel(self)
+            self.offset = (0, 0)
             self.dragging = True
             return True
         return False
     
     def drag(self, mouse_pos):
         if self.dragging:
-            self.rect.center = mouse_pos
+            self.center_on(mouse_pos)
     
     def stop_drag(self):
         self.dragging = False
     
     def return_to_start(self):
-        self.rect.topleft = self.original_pos
-        self.shake = ShakeAnimation(20)
+        """Go home at once; the drawn image glides back from the drop point and shakes"""
+        drop = self.topleft
+        home = self.original_pos
+        self.move_to(home)
+        self.offset = (drop[0] - home[0], drop[1] - home[1])
+        scheduler.sequence(Tween(self, "offset", (0, 0), RETURN_SECONDS), Shake(self))
     
-    def update(self):
-        if self.shake and self.shake.update():
-            return True
-        self.shake = None
-        return False
-    
-    def draw(self, screen):
-        pos = self.rect.topleft
-        if self.shake:
-            offset = self.shake.get_offset()
-            pos = (pos[0] + offset[0], pos[1] + offset[1])
-        
-        if not self.matched:
-            screen.blit(self.image, pos)
+    def snap_to(self, rect):
+        """Move onto a matched shadow; the drawn image slides in and fades out"""
+        drop = self.topleft
+        self.center_on(rect.center)
+        x, y = self.topleft
+        self.offset = (drop[0] - x, drop[1] - y)
+        scheduler.sequence(Tween(self, "offset", (0, 0), SNAP_SECONDS, "ease_out_back"),
+                           Tween(self, "alpha", 0, FADE_SECONDS))
 
-class ShadowSlot:
-    """A shadow slot where vehicles can be matched"""
-    def __init__(self, shadow_image, x, y, vehicle_id):
+class ShadowSlot(EntityView):
+    """A shadow slot where vehicles can be matched (a row of the level's shadow EntityStore)"""
+    __slots__ = ("shadow", "mask")
+    vehicle_id = EntityView.entity_id
+    
+    def __init__(self, store, shadow_image, x, y, vehicle_id):
+        super().__init__(store, x, y, *shadow_image.get_size(), vehicle_id)
         self.shadow = shadow_image
-        self.rect = shadow_image.get_rect(topleft=(x, y))
-        self.vehicle_id = vehicle_id
-        self.matched = False
-        self.highlight = False
+        self.mask = None  # Collision mask, set when the level uses precise drops
     
     def check_match(self, vehicle):
         """Check if vehicle matches this shadow"""
         return self.vehicle_id == vehicle.vehicle_id
+
+class Level1Renderer:
+    """Draws a Level1's state; owns all presentation-only surfaces"""
+    def __init__(self, screen):
+        self.screen = screen
+        self.width, self.height = screen.get_size()
+        
+        # Load background - Solid pastel color as requested
+        self.background = make_solid_background((self.width, self.height), (173, 216, 230), "level1 background")  # Pastel blue
+        self.overlay = make_overlay((self.width, self.height))
+        
+        # Success Screen Elements (Arabic Images)
+        self.next_button = button_frames(
+            "go-to-the-next-level.png 250x80",
+            lambda: load_arabic_image('go-to-the-next-level.png', (250, 80)) or create_button("Next Level", 0, 0, 200, 80, (50, 200, 50), font_size=30))
+        self.restart_button = button_frames(
+            "try-agin.png 200x80",
+            lambda: load_arabic_image('try-agin.png', (200, 80)) or create_button("Restart", 0, 0, 200, 80, (200, 50, 50), font_size=30))
+        # Level 1 Complete Arabic image, loaded once instead of every frame
+        self.level_complete_img = load_arabic_image('level-1-complet.png', (600, 100))
+        
+        self.draw_list = DrawList(screen)
     
-    def draw(self, screen):
-        if not self.matched:
-            # Draw highlight if hovering
-            if self.highlight:
-                pygame.draw.rect(screen, (255, 255, 100), self.rect.inflate(10, 10), 3)
-            screen.blit(self.shadow, self.rect.topleft)
+    def draw_vehicle(self, vehicle):
+        pos = vehicle.drawn_pos
+        
+        if vehicle.dragging:
+            self.draw_list.add(vehicle.image, pos, LAYER_DRAGGED)
+        elif not vehicle.matched:
+            if vehicle.hover or vehicle.anim > 0:
+                # Idle animation while hovered (finishes its loop after)
+                frame, (dx, dy) = vehicle.strip.frame(vehicle.anim)
+                self.draw_list.add(frame, (pos[0] + dx, pos[1] + dy), LAYER_PIECES)
+            else:
+                self.draw_list.add(vehicle.image, pos, LAYER_PIECES)
+        elif vehicle.alpha > 0:
+            # Fading out over its shadow
+            self.draw_list.add(vehicle.image, pos, LAYER_PIECES, alpha=vehicle.alpha)
+    
+    def draw_shadow(self, shadow):
+        if not shadow.matched:
+            # Glow around the shadow while a vehicle hovers over it
+            if shadow.highlight:
+                glow = outline_glow(f"level1 shadow:{shadow.vehicle_id}", shadow.shadow)
+                self.draw_list.add(glow, shadow.rect, LAYER_OUTLINES)
+            self.draw_list.add(shadow.shadow, shadow.rect.topleft, LAYER_TARGETS)
+    
+    def draw(self, level):
+        """Draw the level"""
+        draw_list = self.draw_list
+        draw_list.clear()
+        draw_list.add(self.background, (0, 0), LAYER_BACKGROUND, opaque=True)
+        
+        # Draw title
+        draw_list.add_text("Match Vehicles with their Shadows", 36, self.width // 2, 50, (80, 80, 80), LAYER_BACKGROUND)
+        
+        # Draw shadows
+        for shadow in level.shadows:
+            self.draw_shadow(shadow)
+        
+        # Draw vehicles
+        for vehicle in level.vehicles:
+            self.draw_vehicle(vehicle)
+        
+        # Draw sparkles
+        for sparkle in level.sparkles:
+            draw_list.add_call(sparkle.draw, LAYER_EFFECTS)
+        
+        # Draw completion message
+        if level.completed:
+            # Draw semi-transparent overlay
+            draw_list.add(self.overlay, (0, 0), LAYER_OVERLAY)
+            
+            if self.level_complete_img:
+                img_rect = self.level_complete_img.get_rect(center=(self.width // 2, self.height // 2 - 50))
+                draw_list.add(self.level_complete_img, img_rect.topleft, LAYER_UI)
+            else:
+                # Fallback to English text
+                draw_list.add_text("Level 1 Complete!", 60, self.width // 2, self.height // 2 - 50, (50, 200, 50))
+                draw_list.add_text("Great Job!", 40, self.width // 2, self.height // 2 + 20, (255, 215, 0))
+            
+            draw_list.add(*level.next_button.frame(self.next_button), LAYER_UI)
+            draw_list.add(*level.restart_button.frame(self.restart_button), LAYER_UI)
+        
+        draw_list.draw()
 
 class Level1:
-    def __init__(self, screen, success_sound=None, error_sound=None, complete_sound=None):
+    def __init__(self, screen, success_sound=None, error_sound=None, complete_sound=None, renderer=None, rng=None,
+                 precise_drops=False):
         self.screen = screen
         self.width, self.height = screen.get_size()
         self.success_sound = success_sound
         self.error_sound = error_sound
         self.complete_sound = complete_sound
         
-        # Load background - Solid pastel color as requested
-        self.background = pygame.Surface((self.width, self.height))
-        self.background.fill((173, 216, 230))  # Pastel blue
+        # Layout RNG; the game passes a per-level seeded Random so layouts are reproducible
+        self.rng = rng if rng else random
+        
+        # Judge drops by how much of the piece's shape overlaps the target (cached masks)
+        # instead of any rect contact / center distance
+        self.precise_drops = precise_drops
+        
+        # Presentation lives in the renderer; pass render.NullRenderer() to skip drawing
+        self.renderer = renderer if renderer else Level1Renderer(screen)
         
         # Vehicle definitions
         vehicle_types = [
@@ -94,26 +199,21 @@ class Level1:
             ("ship", (100, 200, 200))
         ]
         
-        # Create vehicles and shadows
-        self.vehicles = []
-        self.shadows = []
+        # Create vehicles and shadows; their lists are the stores' views, in pick/draw order
+        self.vehicle_store = EntityStore()
+        self.shadow_store = EntityStore()
+        self.vehicles = self.vehicle_store.views
+        self.shadows = self.shadow_store.views
         self.sparkles = []
         
-        # Load specific level complete sound and images
+        # Load specific level complete sound
         self.level_complete_sound = load_sound(resource_path('assets/sounds/level1_complete.wav'))
         
-        # Success Screen Elements (Arabic Images)
-        from utils import load_arabic_image
-        
-        self.next_button = load_arabic_image('go-to-the-next-level.png', (250, 80))
-        if not self.next_button:
-            self.next_button = create_button("Next Level", 0, 0, 200, 80, (50, 200, 50), font_size=30)
-        self.next_button_rect = pygame.Rect((self.width - 250) // 2, self.height // 2 + 150, 250, 80)
-
-        self.restart_button = load_arabic_image('try-agin.png', (200, 80))
-        if not self.restart_button:
-            self.restart_button = create_button("Restart", 0, 0, 200, 80, (200, 50, 50), font_size=30)
-        self.restart_button_rect = pygame.Rect((self.width - 200) // 2, self.height // 2 + 250, 200, 80)
+        # Success screen button hit areas (images are in the renderer)
+        self.next_button = Button(pygame.Rect((self.width - 250) // 2, self.height // 2 + 150, 250, 80))
+        self.restart_button = Button(pygame.Rect((self.width - 200) // 2, self.height // 2 + 250, 200, 80))
+        self.next_button_rect = self.next_button.rect
+        self.restart_button_rect = self.restart_button.rect
 
         # Randomize order of vehicle types for initial display
         # random.shuffle(vehicle_types) # Keep fixed order for alignment as requested
@@ -147,7 +247,7 @@ class Level1:
         # Create indices for left (vehicles) and right (shadows) columns
         # Shuffle left column to add randomness as requested
         left_indices = list(range(num_vehicles))
-        random.shuffle(left_indices)
+        self.rng.shuffle(left_indices)
         
         # Keep right column fixed (or shuffle independently if desired, but fixed is good for stability)
         right_indices = list(range(num_vehicles))
@@ -156,53 +256,67 @@ class Level1:
         for row, v_idx in enumerate(left_indices):
             vtype, color = vehicle_types[v_idx]
             
-            # Create at default size then scale
-            raw_img = create_vehicle_image(vtype, color, (120, 120))
-            vehicle_img = pygame.transform.scale(raw_img, (display_size, display_size))
+            # Loaded at display size (pre-sized at build time by asset_pipeline.py)
+            vehicle_img = create_vehicle_image(vtype, color, (display_size, display_size))
             
             x_main = start_x_left_column
             y_main = start_y + row * (display_size + vertical_spacing)
             
             # Pass v_idx as the ID so it matches the shadow with the same v_idx
-            vehicle = DraggableVehicle(vehicle_img, x_main, y_main, v_idx)
-            self.vehicles.append(vehicle)
+            vehicle = DraggableVehicle(self.vehicle_store, vehicle_img, x_main, y_main, v_idx, vtype)
+            # Pre-render the idle loop now so the first hover doesn't hitch
+            vehicle.strip = idle_strip(vtype, vehicle_img)
+            if self.precise_drops:
+                vehicle.mask = collision_mask(f"vehicle:{vtype}", vehicle_img)
             
         # Create Shadows (Right Column)
         for row, s_idx in enumerate(right_indices):
             vtype, color = vehicle_types[s_idx]
             
             # Create shadow from the vehicle image
-            raw_img = create_vehicle_image(vtype, color, (120, 120))
-            vehicle_img = pygame.transform.scale(raw_img, (display_size, display_size))
+            vehicle_img = create_vehicle_image(vtype, color, (display_size, display_size))
             shadow_img = create_shadow(vehicle_img, vtype)
             
             x_shadow = start_x_right_column
             y_shadow = start_y + row * (display_size + vertical_spacing)
             
             # Pass s_idx as the ID
-            shadow = ShadowSlot(shadow_img, x_shadow, y_shadow, s_idx)
-            self.shadows.append(shadow)
+            shadow = ShadowSlot(self.shadow_store, shadow_img, x_shadow, y_shadow, s_idx)
+            if self.precise_drops:
+                shadow.mask = collision_mask(f"shadow:{vtype}", shadow_img)
+        
+        # Plays a vehicle's idle loop while the mouse rests on it
+        self.idle = IdleAnimator(self.vehicle_store)
         
         self.dragging_vehicle = None
         self.matches_found = 0
         self.total_matches = len(self.vehicles)
         self.completed = False
         self.completion_timer = 0
+    
+    def drop_shadows(self, vehicle):
+        """Unmatched shadows to try for a drop: all the vehicle touches, or just the one it covers most"""
+        if not self.precise_drops:
+            return self.shadow_store.colliding(vehicle.rect)
+        targets = [(shadow, shadow.rect, shadow.mask) for shadow in self.shadows if not shadow.matched]
+        shadow = best_drop_target(vehicle.mask, vehicle.rect, targets, DROP_OVERLAP)
+        return [shadow] if shadow else []
         
     def handle_event(self, event):
         """Handle mouse events for dragging"""
         if self.completed:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.next_button_rect.collidepoint(event.pos):
-                    return True
-                elif self.restart_button_rect.collidepoint(event.pos):
-                    return "restart"
+            if self.next_button.handle_event(event):
+                return True
+            if self.restart_button.handle_event(event):
+                return "restart"
             return False
         
         if event.type == pygame.MOUSEBUTTONDOWN:
-            for vehicle in self.vehicles:
+            for vehicle in self.vehicle_store.hit(event.pos):
                 if vehicle.start_drag(event.pos):
                     self.dragging_vehicle = vehicle
+                    self.idle.hover(None)
+                    emit("drag_start", level=1, piece=vehicle.vehicle_id)
                     break
         
         elif event.type == pygame.MOUSEMOTION:
@@ -210,34 +324,38 @@ class Level1:
                 self.dragging_vehicle.drag(event.pos)
                 
                 # Check hover over shadows
-                for shadow in self.shadows:
-                    shadow.highlight = shadow.rect.collidepoint(event.pos) and not shadow.matched
+                store = self.shadow_store
+                store.set_highlight(store.contains(event.pos) & ~store.matched[:store.count])
+            else:
+                self.idle.hover(event.pos)
         
         elif event.type == pygame.MOUSEBUTTONUP:
             if self.dragging_vehicle:
                 # Check if dropped on correct shadow
                 matched = False
-                for shadow in self.shadows:
-                    if shadow.rect.colliderect(self.dragging_vehicle.rect) and not shadow.matched:
-                        if shadow.check_match(self.dragging_vehicle):
-                            # Correct match!
-                            self.dragging_vehicle.matched = True
-                            shadow.matched = True
-                            self.matches_found += 1
-                            
-                            # Play success sound
-                            if self.success_sound:
-                                self.success_sound.play()
-                            
-                            # Create sparkle effect
-                            sparkle = SparkleEffect(shadow.rect.centerx, shadow.rect.centery)
-                            self.sparkles.append(sparkle)
-                            
-                            matched = True
-                            break
+                for shadow in self.drop_shadows(self.dragging_vehicle):
+                    if shadow.check_match(self.dragging_vehicle):
+                        # Correct match!
+                        self.dragging_vehicle.matched = True
+                        self.dragging_vehicle.snap_to(shadow.rect)
+                        shadow.matched = True
+                        self.matches_found += 1
+                        emit("correct_match", level=1, piece=shadow.vehicle_id)
+                        
+                        # Play success sound
+                        if self.success_sound:
+                            self.success_sound.play()
+                        
+                        # Create sparkle effect
+                        sparkle = SparkleEffect(shadow.rect.centerx, shadow.rect.centery)
+                        self.sparkles.append(sparkle)
+                        
+                        matched = True
+                        break
                 
                 if not matched and self.dragging_vehicle.dragging:
                     # Wrong match - return to start with shake
+                    emit("wrong_drop", level=1, piece=self.dragging_vehicle.vehicle_id, pos=event.pos)
                     self.dragging_vehicle.return_to_start()
                     if self.error_sound:
                         self.error_sound.play()
@@ -249,10 +367,6 @@ class Level1:
     
     def update(self):
         """Update animations and check completion"""
-        # Update vehicle animations
-        for vehicle in self.vehicles:
-            vehicle.update()
-        
         # Update sparkles
         self.sparkles = [s for s in self.sparkles if s.update()]
         
@@ -261,6 +375,7 @@ class Level1:
         if self.matches_found >= self.total_matches and not self.completed:
             self.completed = True
             self.completion_timer = pygame.time.get_ticks()
+            emit("level_complete", level=1)
             if self.level_complete_sound:
                 self.level_complete_sound.play()
         
@@ -270,44 +385,36 @@ class Level1:
         
         return False
     
+    def get_state(self):
+        """Progress as plain data for session snapshots (no surfaces)"""
+        return {
+            "vehicles": [[v.vehicle_id, v.rect.x, v.rect.y, v.original_pos[0], v.original_pos[1], v.matched]
+                         for v in self.vehicles],
+            "matched_shadows": [s.vehicle_id for s in self.shadows if s.matched],
+            "matches_found": self.matches_found,
+            "completed": self.completed,
+        }
+    
+    def restore_state(self, state):
+        """Put vehicles and shadows back where a snapshot left them"""
+        self.vehicle_store.reset()
+        self.shadow_store.reset()
+        vehicles = {v.vehicle_id: v for v in self.vehicles}
+        for vehicle_id, x, y, original_x, original_y, matched in state["vehicles"]:
+            vehicle = vehicles[vehicle_id]
+            vehicle.move_to((x, y))
+            vehicle.original_pos = (original_x, original_y)
+            vehicle.matched = matched
+            vehicle.alpha = 0 if matched else 255
+        # Keep draw/pick order
+        self.vehicle_store.reorder([vehicles[record[0]].index for record in state["vehicles"]])
+        self.vehicles = self.vehicle_store.views
+        matched_shadows = set(state["matched_shadows"])
+        for shadow in self.shadows:
+            shadow.matched = shadow.vehicle_id in matched_shadows
+        self.matches_found = state["matches_found"]
+        self.completed = state["completed"]
+    
     def draw(self):
         """Draw the level"""
-        self.screen.blit(self.background, (0, 0))
-        
-        # Draw title
-        draw_text(self.screen, "Match Vehicles with their Shadows", 36, self.width // 2, 50, (80, 80, 80))
-        
-        # Draw shadows
-        for shadow in self.shadows:
-            shadow.draw(self.screen)
-        
-        # Draw vehicles
-        for vehicle in self.vehicles:
-            vehicle.draw(self.screen)
-        
-        # Draw sparkles
-        for sparkle in self.sparkles:
-            sparkle.draw(self.screen)
-        
-        # Draw completion message
-        # Draw completion message
-        if self.completed:
-            # Draw semi-transparent overlay
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            self.screen.blit(overlay, (0, 0))
-            
-            # Load and display Level 1 Complete Arabic image
-            from utils import load_arabic_image
-            level_complete_img = load_arabic_image('level-1-complet.png', (600, 100))
-            
-            if level_complete_img:
-                img_rect = level_complete_img.get_rect(center=(self.width // 2, self.height // 2 - 50))
-                self.screen.blit(level_complete_img, img_rect)
-            else:
-                # Fallback to English text
-                draw_text(self.screen, "Level 1 Complete!", 60, self.width // 2, self.height // 2 - 50, (50, 200, 50))
-                draw_text(self.screen, "Great Job!", 40, self.width // 2, self.height // 2 + 20, (255, 215, 0))
-            
-            self.screen.blit(self.next_button, self.next_button_rect)
-            self.screen.blit(self.restart_button, self.restart_button_rect)
+        self.renderer.draw(self)
@@ -4,18 +4,42 @@ Players drag vehicles to their correct environments (air, land, sea)
 """
 import pygame
 import random
-from utils import SparkleEffect, ShakeAnimation, ConfettiEffect, create_vehicle_image, draw_text, resource_path, load_sound, create_button
+from utils import SparkleEffect, ConfettiEffect, best_drop_target, collision_mask, rect_mask, create_vehicle_image, resource_path, load_sound, create_button, load_image, load_arabic_image
+from widgets import Button, button_frames
+from entity_store import EntityStore, EntityView
+from idle_anim import IdleAnimator, idle_strip
+from image_fx import scaled_frames
+from render import DrawList, LAYER_BACKGROUND, LAYER_OUTLINES, LAYER_TARGETS, LAYER_PIECES, LAYER_EFFECTS, LAYER_DRAGGED, LAYER_OVERLAY, LAYER_UI, make_overlay, make_solid_background
+from telemetry import emit
+from tween import scheduler, Shake, Tween
 
-class EnvironmentZone:
-    """An environment zone where vehicles can be placed"""
-    def __init__(self, name, rect, color, vehicle_types, max_vehicles=3, display_name=None):
+# Seconds for a wrong drop to glide home, and for a placed vehicle to settle
+RETURN_SECONDS = 0.3
+SNAP_SECONDS = 0.25
+POP_SCALE = 1.2  # A placed vehicle pops from this size back to normal
+# Pre-scaled pop frames (POP_SCALES[-1] == POP_SCALE); the renderer picks the nearest
+POP_SCALES = tuple(1 + (POP_SCALE - 1) * step / 6 for step in range(1, 7))
+# Share of the vehicle that must be inside a zone for a precise drop
+DROP_OVERLAP = 0.5
+
+# Icon/symbol drawn inside each environment zone
+ZONE_ICONS = {
+    "AIR": "sky_environment.png",
+    "LAND": "road_environment.png",
+    "SEA": "ocean_environment.png",
+}
+
+class EnvironmentZone(EntityView):
+    """An environment zone where vehicles can be placed (a row of the level's zone EntityStore)"""
+    __slots__ = ("name", "display_name", "color", "vehicle_types", "vehicles", "max_vehicles")
+    
+    def __init__(self, store, name, rect, color, vehicle_types, max_vehicles=3, display_name=None):
+        super().__init__(store, *rect)
         self.name = name
         self.display_name = display_name if display_name else name
-        self.rect = rect
         self.color = color
         self.vehicle_types = vehicle_types  # List of vehicle types that belong here
         self.vehicles = []  # Vehicles placed in this zone
-        self.highlight = False
         self.max_vehicles = max_vehicles  # Now customizable per zone
     
     def can_accept(self, vehicle_type):
@@ -25,158 +49,188 @@ class EnvironmentZone:
     def add_vehicle(self, vehicle):
         """Add a vehicle to this zone"""
         self.vehicles.append(vehicle)
-    
-    def draw(self, screen):
-        """Draw the environment zone"""
-        # Draw zone background
-        if self.highlight:
-            pygame.draw.rect(screen, (255, 255, 100), self.rect, 5)
-        pygame.draw.rect(screen, self.color, self.rect, 3)
-        
-        # Draw zone label
-        # Use draw_text from utils to get Arabic support
-        draw_text(screen, self.display_name, 48, self.rect.centerx, self.rect.top - 30, (50, 50, 50))
-        
-        # Draw icon/symbol for environment
-        icon_name = ""
-        if self.name == "AIR":
-            icon_name = "sky_environment.png"
-        elif self.name == "LAND":
-            icon_name = "road_environment.png"
-        elif self.name == "SEA":
-            icon_name = "ocean_environment.png"
-            
-        if icon_name:
-            try:
-                icon = pygame.image.load(resource_path(f'assets/images/{icon_name}'))
-                # Scale icon to fit nicely in the zone
-                icon = pygame.transform.scale(icon, (150, 150))
-                icon_rect = icon.get_rect(center=(self.rect.centerx, self.rect.centery))
-                screen.blit(icon, icon_rect)
-            except:
-                pass
 
-class Level2:
-    def __init__(self, screen, success_sound=None, error_sound=None, complete_sound=None):
-        # ... (init code) ...
-        
-        # Create environment zones
-        zone_width = 280
-        zone_height = 450
-        zone_y = 250
-        
-        self.zones = [
-            EnvironmentZone("AIR", pygame.Rect(50, zone_y, zone_width, zone_height), 
-                          (173, 216, 230), ["plane", "helicopter"], max_vehicles=2, display_name="Air"),
-            EnvironmentZone("LAND", pygame.Rect(370, zone_y, zone_width, zone_height),
-                          (144, 238, 144), ["car", "bike", "bus", "train"], max_vehicles=4, display_name="Land"),
-            EnvironmentZone("SEA", pygame.Rect(690, zone_y, zone_width, zone_height),
-                          (135, 206, 250), ["boat", "ship"], max_vehicles=2, display_name="Sea")
-        ]
-        
-        # ... (rest of init) ...
-
-    # ... (handle_event and update methods) ...
-
-    def draw(self):
-        """Draw the level"""
-        self.screen.blit(self.background, (0, 0))
-        
-        # Draw title
-        draw_text(self.screen, "Sort Vehicles to their Environments", 48, self.width // 2, 50, (80, 80, 80))
-        
-        # Draw zones
-        for zone in self.zones:
-            zone.draw(self.screen)
-            
-        # Draw vehicles
-        for vehicle in self.vehicles:
-            vehicle.draw(self.screen)
-            
-        # Draw sparkles
-        for sparkle in self.sparkles:
-            sparkle.draw(self.screen)
-            
-        # Draw confetti
-        if self.confetti:
-            self.confetti.draw(self.screen)
-        
-        # Draw completion message
-        if self.completed:
-            draw_text(self.screen, "Excellent!", 72, self.width // 2, self.height // 2, (255, 215, 0))
+class DraggableVehicle2(EntityView):
+    """A vehicle that can be dragged to environment zones
 
-class DraggableVehicle2:
-    """A vehicle that can be dragged to environment zones"""
-    def __init__(self, image, x, y, vehicle_type):
+    Position, flags and presentation state (offset, scale; animated by the
+    tween scheduler) live in the level's vehicle EntityStore.
+    """
+    __slots__ = ("image", "vehicle_type", "mask", "strip", "pop")
+    placed = EntityView.matched
+    
+    def __init__(self, store, image, x, y, vehicle_type):
+        super().__init__(store, x, y, *image.get_size())
         self.image = image
-        self.rect = image.get_rect(topleft=(x, y))
-        self.original_pos = (x, y)
         self.vehicle_type = vehicle_type
-        self.dragging = False
-        self.placed = False
-        self.shake = None
+        self.mask = None  # Collision mask, set when the level uses precise drops
+        self.strip = None  # Idle animation frames (idle_anim.FrameStrip), set by the level
+        self.pop = None  # Images at POP_SCALES, set by the level
     
     def start_drag(self, mouse_pos):
         if self.rect.collidepoint(mouse_pos) and not self.placed:
+            scheduler.cancel(self)
+            self.offset = (0, 0)
             self.dragging = True
             return True
         return False
     
     def drag(self, mouse_pos):
         if self.dragging:
-            self.rect.center = mouse_pos
+            self.center_on(mouse_pos)
     
     def stop_drag(self):
         self.dragging = False
     
     def return_to_start(self):
-        self.rect.topleft = self.original_pos
-        self.shake = ShakeAnimation(20)
+        """Go home at once; the drawn image glides back from the drop point and shakes"""
+        drop = self.topleft
+        home = self.original_pos
+        self.move_to(home)
+        self.offset = (drop[0] - home[0], drop[1] - home[1])
+        scheduler.sequence(Tween(self, "offset", (0, 0), RETURN_SECONDS), Shake(self))
+    
+    def snap_from(self, drop):
+        """Slide the drawn image from the drop point into its (already set) place with a little pop"""
+        x, y = self.topleft
+        self.offset = (drop[0] - x, drop[1] - y)
+        scheduler.tween(self, "offset", (0, 0), SNAP_SECONDS, "ease_out_back")
+        scheduler.tween(self, "scale", 1.0, SNAP_SECONDS, start=POP_SCALE)
     
     def place_in_zone(self, zone_rect):
         """Snap to position in zone"""
-        num_in_zone = len([v for z in [] for v in z.vehicles])
-        self.rect.center = zone_rect.center
+        self.center_on(zone_rect.center)
         self.placed = True
     
-    def update(self):
-        if self.shake and self.shake.update():
-            return True
-        self.shake = None
-        return False
+class Level2Renderer:
+    """Draws a Level2's state; owns all presentation-only surfaces"""
+    def __init__(self, screen):
+        self.screen = screen
+        self.width, self.height = screen.get_size()
+        
+        # Load background - Solid pastel color as requested
+        self.background = make_solid_background((self.width, self.height), (255, 253, 208), "level2 background")  # Pastel yellow
+        self.overlay = make_overlay((self.width, self.height))
+        
+        # Zone icons are loaded and scaled once instead of every frame
+        self.zone_icons = {}
+        for zone_name, icon_name in ZONE_ICONS.items():
+            try:
+                # Scale icon to fit nicely in the zone
+                self.zone_icons[zone_name] = load_image(f'assets/images/{icon_name}', (150, 150))
+            except:
+                pass
+        
+        # Success Screen Elements (Arabic Images)
+        self.next_button = button_frames(
+            "go-to-the-next-level.png 250x80",
+            lambda: load_arabic_image('go-to-the-next-level.png', (250, 80)) or create_button("Next Level", 0, 0, 200, 80, (50, 200, 50), font_size=30))
+        self.restart_button = button_frames(
+            "try-agin.png 200x80",
+            lambda: load_arabic_image('try-agin.png', (200, 80)) or create_button("Restart", 0, 0, 200, 80, (200, 50, 50), font_size=30))
+        
+        self.draw_list = DrawList(screen)
+    
+    def draw_zone(self, zone):
+        """Draw the environment zone"""
+        # Draw zone background
+        def outline(screen, zone=zone):
+            if zone.highlight:
+                pygame.draw.rect(screen, (255, 255, 100), zone.rect, 5)
+            pygame.draw.rect(screen, zone.color, zone.rect, 3)
+        self.draw_list.add_call(outline, LAYER_OUTLINES, zone.rect)
+        
+        # Draw zone label (text_surface shapes Arabic labels)
+        self.draw_list.add_text(zone.display_name, 48, zone.rect.centerx, zone.rect.top - 30, (50, 50, 50), LAYER_TARGETS)
+        
+        # Draw icon/symbol for environment
+        icon = self.zone_icons.get(zone.name)
+        if icon:
+            self.draw_list.add(icon, zone.rect, LAYER_TARGETS)
     
-    def draw(self, screen):
-        pos = self.rect.topleft
-        if self.shake:
-            offset = self.shake.get_offset()
-            pos = (pos[0] + offset[0], pos[1] + offset[1])
-        screen.blit(self.image, pos)
+    def draw_vehicle(self, vehicle):
+        pos = vehicle.drawn_pos
+        layer = LAYER_DRAGGED if vehicle.dragging else LAYER_PIECES
+        if vehicle.hover or vehicle.anim > 0:
+            if not vehicle.dragging and not vehicle.placed:
+                # Idle animation while hovered (finishes its loop after)
+                frame, (dx, dy) = vehicle.strip.frame(vehicle.anim)
+                self.draw_list.add(frame, (pos[0] + dx, pos[1] + dy), layer)
+                return
+        if vehicle.scale != 1.0:
+            # Only while the placement pop is running: the nearest pre-scaled frame
+            step = round((vehicle.scale - 1) / (POP_SCALE - 1) * len(POP_SCALES))
+            image = vehicle.pop[min(step, len(POP_SCALES)) - 1] if step > 0 else vehicle.image
+            self.draw_list.add(image, vehicle.rect.move(vehicle.offset), layer)
+            return
+        self.draw_list.add(vehicle.image, pos, layer)
+    
+    def draw(self, level):
+        """Draw the level"""
+        draw_list = self.draw_list
+        draw_list.clear()
+        draw_list.add(self.background, (0, 0), LAYER_BACKGROUND, opaque=True)
+        
+        # Draw title
+        draw_list.add_text("Sort Vehicles to their Environments", 48, self.width // 2, 50, (80, 80, 80), LAYER_BACKGROUND)
+        
+        # Draw zones
+        for zone in level.zones:
+            self.draw_zone(zone)
+        
+        # Draw vehicles
+        for vehicle in level.vehicles:
+            self.draw_vehicle(vehicle)
+        
+        # Draw sparkles
+        for sparkle in level.sparkles:
+            draw_list.add_call(sparkle.draw, LAYER_EFFECTS)
+        
+        # Draw completion message
+        if level.completed:
+            # Draw semi-transparent overlay
+            draw_list.add(self.overlay, (0, 0), LAYER_OVERLAY)
+            
+            draw_list.add_text("Level 2 Complete!", 60, self.width // 2, self.height // 2 - 50, (50, 200, 50))
+            draw_list.add_text("Environment Sorted!", 40, self.width // 2, self.height // 2 + 20, (255, 215, 0))
+            
+            draw_list.add(*level.next_button.frame(self.next_button), LAYER_UI)
+            draw_list.add(*level.restart_button.frame(self.restart_button), LAYER_UI)
+        
+        draw_list.draw()
 
 class Level2:
-    def __init__(self, screen, success_sound=None, error_sound=None, complete_sound=None):
+    def __init__(self, screen, success_sound=None, error_sound=None, complete_sound=None, renderer=None, rng=None,
+                 precise_drops=False):
         self.screen = screen
         self.width, self.height = screen.get_size()
         self.success_sound = success_sound
         self.error_sound = error_sound
         self.complete_sound = complete_sound
         
-        # Load background - Solid pastel color as requested
-        self.background = pygame.Surface((self.width, self.height))
-        self.background.fill((255, 253, 208))  # Pastel yellow
+        # Layout RNG; the game passes a per-level seeded Random so layouts are reproducible
+        self.rng = rng if rng else random
+        
+        # Judge drops by how much of the piece's shape overlaps the target (cached masks)
+        # instead of any rect contact / center distance
+        self.precise_drops = precise_drops
+        
+        # Presentation lives in the renderer; pass render.NullRenderer() to skip drawing
+        self.renderer = renderer if renderer else Level2Renderer(screen)
         
         # Create environment zones
         zone_width = 280
         zone_height = 450
         zone_y = 250
         
-        self.zones = [
-            EnvironmentZone("AIR", pygame.Rect(50, zone_y, zone_width, zone_height), 
-                          (173, 216, 230), ["plane", "helicopter"], max_vehicles=2, display_name="Air"),
-            EnvironmentZone("LAND", pygame.Rect(370, zone_y, zone_width, zone_height),
-                          (144, 238, 144), ["car", "bike", "bus", "train"], max_vehicles=4, display_name="Land"),
-            EnvironmentZone("SEA", pygame.Rect(690, zone_y, zone_width, zone_height),
-                          (135, 206, 250), ["boat", "ship"], max_vehicles=2, display_name="Sea")
-        ]
+        self.zone_store = EntityStore(capacity=3)
+        EnvironmentZone(self.zone_store, "AIR", pygame.Rect(50, zone_y, zone_width, zone_height), 
+                        (173, 216, 230), ["plane", "helicopter"], max_vehicles=2, display_name="Air")
+        EnvironmentZone(self.zone_store, "LAND", pygame.Rect(370, zone_y, zone_width, zone_height),
+                        (144, 238, 144), ["car", "bike", "bus", "train"], max_vehicles=4, display_name="Land")
+        EnvironmentZone(self.zone_store, "SEA", pygame.Rect(690, zone_y, zone_width, zone_height),
+                        (135, 206, 250), ["boat", "ship"], max_vehicles=2, display_name="Sea")
+        self.zones = self.zone_store.views
         
         # Create vehicles
         vehicle_data = [
@@ -190,7 +244,6 @@ class Level2:
             ("ship", (100, 200, 200))
         ]
         
-        self.vehicles = []
         self.sparkles = []
         self.vehicles_placed = 0
         self.total_vehicles = len(vehicle_data)
@@ -201,24 +254,19 @@ class Level2:
         # Load specific level complete sound
         self.level_complete_sound = load_sound(resource_path('assets/sounds/level2_complete.wav'))
             
-        # Success Screen Elements (Arabic Images)
-        from utils import load_arabic_image
-        
-        self.next_button = load_arabic_image('go-to-the-next-level.png', (250, 80))
-        if not self.next_button:
-            self.next_button = create_button("Next Level", 0, 0, 200, 80, (50, 200, 50), font_size=30)
-        self.next_button_rect = pygame.Rect((self.width - 250) // 2, self.height // 2 + 150, 250, 80)
-
-        self.restart_button = load_arabic_image('try-agin.png', (200, 80))
-        if not self.restart_button:
-            self.restart_button = create_button("Restart", 0, 0, 200, 80, (200, 50, 50), font_size=30)
-        self.restart_button_rect = pygame.Rect((self.width - 200) // 2, self.height // 2 + 250, 200, 80)
+        # Success screen button hit areas (images are in the renderer)
+        self.next_button = Button(pygame.Rect((self.width - 250) // 2, self.height // 2 + 150, 250, 80))
+        self.restart_button = Button(pygame.Rect((self.width - 200) // 2, self.height // 2 + 250, 200, 80))
+        self.next_button_rect = self.next_button.rect
+        self.restart_button_rect = self.restart_button.rect
         # Create draggable vehicles
         # Increase size for kids view (was 80, now 100)
-        random.shuffle(vehicle_data)
+        self.rng.shuffle(vehicle_data)
         
         # Grid Layout: All objects fixed below the title
-        self.vehicles = []
+        # The vehicle list is the store's views, in pick/draw order
+        self.vehicle_store = EntityStore()
+        self.vehicles = self.vehicle_store.views
         
         # 8 vehicles total. 2 rows of 4.
         # Title is at y=50, so position vehicles below it
@@ -226,9 +274,8 @@ class Level2:
         start_y = 120 # Below the title "Sort Vehicles to their Environments"
         
         for i, (vtype, color) in enumerate(vehicle_data):
-            # Create at larger size
-            raw_img = create_vehicle_image(vtype, color, (150, 150))
-            vehicle_img = pygame.transform.scale(raw_img, (100, 100))
+            # Loaded at display size (pre-sized at build time by asset_pipeline.py)
+            vehicle_img = create_vehicle_image(vtype, color, (100, 100))
             
             row = i // 4
             col = i % 4
@@ -236,31 +283,45 @@ class Level2:
             x = start_x + col * 220
             y = start_y + row * 110
             
-            vehicle = DraggableVehicle2(vehicle_img, x, y, vtype)
-            # Store initial pos for resetting if dropped in wrong place
-            vehicle.initial_x = x
-            vehicle.initial_y = y
-            self.vehicles.append(vehicle)
+            # The store keeps (x, y) as the home position for wrong drops
+            vehicle = DraggableVehicle2(self.vehicle_store, vehicle_img, x, y, vtype)
+            # Pre-render the idle loop now so the first hover doesn't hitch
+            vehicle.strip = idle_strip(vtype, vehicle_img)
+            vehicle.pop = scaled_frames(f"vehicle:{vtype}", vehicle_img, POP_SCALES)
+            if self.precise_drops:
+                vehicle.mask = collision_mask(f"vehicle:{vtype}", vehicle_img)
+        
+        # Plays a vehicle's idle loop while the mouse rests on it
+        self.idle = IdleAnimator(self.vehicle_store)
         
         self.dragging_vehicle = None
         self.total_vehicles = len(self.vehicles)
         self.completed = False
         self.completion_timer = 0
     
+    def drop_zones(self, vehicle):
+        """Zones to try for a drop: all the vehicle touches, or just the one most of it is in"""
+        if not self.precise_drops:
+            return self.zone_store.colliding(vehicle.rect)
+        targets = [(zone, zone.rect, rect_mask(zone.rect.size)) for zone in self.zones]
+        zone = best_drop_target(vehicle.mask, vehicle.rect, targets, DROP_OVERLAP)
+        return [zone] if zone else []
+    
     def handle_event(self, event):
         """Handle mouse events"""
         if self.completed:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.next_button_rect.collidepoint(event.pos):
-                    return True
-                elif self.restart_button_rect.collidepoint(event.pos):
-                    return "restart"
+            if self.next_button.handle_event(event):
+                return True
+            if self.restart_button.handle_event(event):
+                return "restart"
             return False
         
         if event.type == pygame.MOUSEBUTTONDOWN:
-            for vehicle in self.vehicles:
+            for vehicle in self.vehicle_store.hit(event.pos):
                 if vehicle.start_drag(event.pos):
                     self.dragging_vehicle = vehicle
+                    self.idle.hover(None)
+                    emit("drag_start", level=2, piece=vehicle.vehicle_type)
                     break
         
         elif event.type == pygame.MOUSEMOTION:
@@ -268,41 +329,46 @@ class Level2:
                 self.dragging_vehicle.drag(event.pos)
                 
                 # Highlight zones
-                for zone in self.zones:
-                    zone.highlight = (zone.rect.collidepoint(event.pos) and 
-                                    zone.can_accept(self.dragging_vehicle.vehicle_type))
+                self.zone_store.set_highlight(False)
+                for zone in self.zone_store.hit(event.pos):
+                    zone.highlight = zone.can_accept(self.dragging_vehicle.vehicle_type)
+            else:
+                self.idle.hover(event.pos)
         
         elif event.type == pygame.MOUSEBUTTONUP:
             if self.dragging_vehicle:
                 placed = False
                 
                 # Check if dropped in correct zone
-                for zone in self.zones:
-                    if zone.rect.colliderect(self.dragging_vehicle.rect):
-                        if zone.can_accept(self.dragging_vehicle.vehicle_type):
-                            # Correct placement!
-                            zone.add_vehicle(self.dragging_vehicle)
-                            self.dragging_vehicle.place_in_zone(zone.rect)
-                            self.vehicles_placed += 1
-                            
-                            # Calculate position in zone
-                            slot = len(zone.vehicles) - 1
-                            self.dragging_vehicle.rect.center = (
-                                zone.rect.centerx + (slot - 1) * 30,
-                                zone.rect.centery + 80 + slot * 40
-                            )
-                            
-                            if self.success_sound:
-                                self.success_sound.play()
-                            
-                            sparkle = SparkleEffect(self.dragging_vehicle.rect.centerx,
-                                                   self.dragging_vehicle.rect.centery)
-                            self.sparkles.append(sparkle)
-                            placed = True
-                            break
+                for zone in self.drop_zones(self.dragging_vehicle):
+                    if zone.can_accept(self.dragging_vehicle.vehicle_type):
+                        # Correct placement!
+                        drop = self.dragging_vehicle.topleft
+                        zone.add_vehicle(self.dragging_vehicle)
+                        emit("correct_match", level=2, piece=self.dragging_vehicle.vehicle_type, zone=zone.name)
+                        self.dragging_vehicle.place_in_zone(zone.rect)
+                        self.vehicles_placed += 1
+                        
+                        # Calculate position in zone
+                        slot = len(zone.vehicles) - 1
+                        zone_rect = zone.rect
+                        self.dragging_vehicle.center_on((
+                            zone_rect.centerx + (slot - 1) * 30,
+                            zone_rect.centery + 80 + slot * 40
+                        ))
+                        self.dragging_vehicle.snap_from(drop)
+                        
+                        if self.success_sound:
+                            self.success_sound.play()
+                        
+                        sparkle = SparkleEffect(*self.dragging_vehicle.rect.center)
+                        self.sparkles.append(sparkle)
+                        placed = True
+                        break
                 
                 if not placed and self.dragging_vehicle.dragging:
                     # Wrong placement
+                    emit("wrong_drop", level=2, piece=self.dragging_vehicle.vehicle_type, pos=event.pos)
                     self.dragging_vehicle.return_to_start()
                     if self.error_sound:
                         self.error_sound.play()
@@ -311,27 +377,22 @@ class Level2:
                 self.dragging_vehicle = None
                 
                 # Reset highlights
-                for zone in self.zones:
-                    zone.highlight = False
+                self.zone_store.set_highlight(False)
         
         return False
     
     def update(self):
         """Update animations and check completion"""
-        for vehicle in self.vehicles:
-            vehicle.update()
-            # If placed, it stays placed (or disappears? usually stays in zone)
-            # In original logic, they stayed.
-        
         self.sparkles = [s for s in self.sparkles if s.update()]
         
         # Check completion
         # Count placed vehicles
-        placed_count = sum(1 for v in self.vehicles if v.placed)
+        placed_count = self.vehicle_store.matched_count()
         
         if placed_count >= self.total_vehicles and not self.completed:
             self.completed = True
             self.completion_timer = pygame.time.get_ticks()
+            emit("level_complete", level=2)
             if self.level_complete_sound:
                 self.level_complete_sound.play()
         
@@ -340,35 +401,34 @@ class Level2:
         
         return False
     
+    def get_state(self):
+        """Progress as plain data for session snapshots (no surfaces)"""
+        return {
+            "vehicles": [[v.vehicle_type, v.rect.x, v.rect.y, v.original_pos[0], v.original_pos[1], v.placed]
+                         for v in self.vehicles],
+            "zones": {zone.name: [v.vehicle_type for v in zone.vehicles] for zone in self.zones},
+            "vehicles_placed": self.vehicles_placed,
+            "completed": self.completed,
+        }
+    
+    def restore_state(self, state):
+        """Put vehicles back where a snapshot left them, refilling the zones in order"""
+        self.vehicle_store.reset()
+        self.zone_store.reset()
+        vehicles = {v.vehicle_type: v for v in self.vehicles}
+        for vehicle_type, x, y, original_x, original_y, placed in state["vehicles"]:
+            vehicle = vehicles[vehicle_type]
+            vehicle.move_to((x, y))
+            vehicle.original_pos = (original_x, original_y)
+            vehicle.placed = placed
+        # Keep draw/pick order
+        self.vehicle_store.reorder([vehicles[record[0]].index for record in state["vehicles"]])
+        self.vehicles = self.vehicle_store.views
+        for zone in self.zones:
+            zone.vehicles = [vehicles[vehicle_type] for vehicle_type in state["zones"].get(zone.name, [])]
+        self.vehicles_placed = state["vehicles_placed"]
+        self.completed = state["completed"]
+    
     def draw(self):
         """Draw the level"""
-        self.screen.blit(self.background, (0, 0))
-        
-        # Draw title
-        draw_text(self.screen, "Sort Vehicles to their Environments", 48, self.width // 2, 50, (80, 80, 80))
-        
-        # Draw zones
-        for zone in self.zones:
-            zone.draw(self.screen)
-        
-        # Draw vehicles
-        for vehicle in self.vehicles:
-            vehicle.draw(self.screen)
-        
-        # Draw sparkles
-        for sparkle in self.sparkles:
-            sparkle.draw(self.screen)
-        
-        # Draw completion message
-        # Draw completion message
-        if self.completed:
-            # Draw semi-transparent overlay
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            self.screen.blit(overlay, (0, 0))
-            
-            draw_text(self.screen, "Level 2 Complete!", 60, self.width // 2, self.height // 2 - 50, (50, 200, 50))
-            draw_text(self.screen, "Environment Sorted!", 40, self.width // 2, self.height // 2 + 20, (255, 215, 0))
-            
-            self.screen.blit(self.next_button, self.next_button_rect)
-            self.screen.blit(self.restart_button, self.restart_button_rect)
+        self.renderer.draw(self)
@@ -4,91 +4,179 @@ Players match vehicle halves to complete the images
 """
 import pygame
 import random
-from utils import SparkleEffect, ShakeAnimation, ConfettiEffect, create_vehicle_image, draw_text, resource_path, load_sound, create_button
+from utils import SparkleEffect, ConfettiEffect, best_drop_target, create_vehicle_image, resource_path, load_sound, create_button, load_arabic_image, split_halves
+from widgets import Button, button_frames
+from entity_store import EntityStore, EntityView
+from image_fx import outline_glow
+from render import DrawList, LAYER_BACKGROUND, LAYER_OUTLINES, LAYER_TARGETS, LAYER_PIECES, LAYER_EFFECTS, LAYER_DRAGGED, LAYER_OVERLAY, LAYER_UI, make_overlay, make_solid_background
+from telemetry import emit
+from tween import scheduler, Shake, Tween
 
-class VehicleHalf:
-    """Half of a vehicle image that can be dragged"""
-    def __init__(self, image, x, y, vehicle_id, is_left):
-        self.image = image
-        self.rect = image.get_rect(topleft=(x, y))
-        self.original_pos = (x, y)
-        self.vehicle_id = vehicle_id
+# Seconds for a wrong drop to glide home, and for a matched half to snap on
+RETURN_SECONDS = 0.3
+SNAP_SECONDS = 0.2
+# Share of the half that must cover the slot's missing half for a precise drop
+DROP_OVERLAP = 0.5
+
+# Grab tolerance around a half's opaque pixels, so small fingers don't miss thin parts
+GRAB_PADDING = 8
+
+class VehicleHalf(EntityView):
+    """Half of a vehicle image that can be dragged
+
+    Position, flags and the drawn offset (animated by the tween scheduler)
+    live in the level's half EntityStore.
+    """
+    __slots__ = ("piece", "image", "is_left")
+    vehicle_id = EntityView.entity_id
+    
+    def __init__(self, store, piece, x, y, vehicle_id, is_left):
+        super().__init__(store, x, y, *piece.image.get_size(), vehicle_id)
+        self.piece = piece  # utils.ImagePiece
+        self.image = piece.image
         self.is_left = is_left
-        self.dragging = False
-        self.matched = False
-        self.shake = None
     
     def start_drag(self, mouse_pos):
         if self.rect.collidepoint(mouse_pos) and not self.matched:
-            self.dragging = True
-            return True
+            # Cheap rect test first, then the piece's (cached) mask
+            if self.piece.hit((mouse_pos[0] - self.rect.x, mouse_pos[1] - self.rect.y), GRAB_PADDING):
+                scheduler.cancel(self)
+                self.offset = (0, 0)
+                self.dragging = True
+                return True
         return False
     
     def drag(self, mouse_pos):
         if self.dragging:
-            self.rect.center = mouse_pos
+            self.center_on(mouse_pos)
     
     def stop_drag(self):
         self.dragging = False
     
     def return_to_start(self):
-        self.rect.topleft = self.original_pos
-        self.shake = ShakeAnimation(20)
-    
-    def update(self):
-        if self.shake and self.shake.update():
-            return True
-        self.shake = None
-        return False
-    
-    def draw(self, screen):
-        pos = self.rect.topleft
-        if self.shake:
-            offset = self.shake.get_offset()
-            pos = (pos[0] + offset[0], pos[1] + offset[1])
-        
-        if not self.matched:
-            screen.blit(self.image, pos)
+        """Go home at once; the drawn image glides back from the drop point and shakes"""
+        drop = self.topleft
+        home = self.original_pos
+        self.move_to(home)
+        self.offset = (drop[0] - home[0], drop[1] - home[1])
+        scheduler.sequence(Tween(self, "offset", (0, 0), RETURN_SECONDS), Shake(self))
 
-class PuzzleSlot:
-    """A slot where the matching half should be placed"""
-    def __init__(self, fixed_half, x, y, vehicle_id):
+class PuzzleSlot(EntityView):
+    """A slot where the matching half should be placed (a row of the level's slot EntityStore)
+
+    Its offset is the drawn offset of the matched half while it snaps on.
+    """
+    __slots__ = ("fixed_half", "matching_half", "target_mask")
+    vehicle_id = EntityView.entity_id
+    
+    def __init__(self, store, fixed_half, x, y, vehicle_id):
+        super().__init__(store, x, y, *fixed_half.get_size(), vehicle_id)
         self.fixed_half = fixed_half
-        self.rect = fixed_half.get_rect(topleft=(x, y))
-        self.vehicle_id = vehicle_id
-        self.matched = False
-        self.highlight = False
         self.matching_half = None
+        self.target_mask = None  # Shape of the missing half, set when the level uses precise drops
     
     def check_match(self, half):
         """Check if the half matches this slot"""
         return half.vehicle_id == self.vehicle_id
+
+class Level3Renderer:
+    """Draws a Level3's state; owns all presentation-only surfaces"""
+    def __init__(self, screen):
+        self.screen = screen
+        self.width, self.height = screen.get_size()
+        
+        # Load background - Solid pastel color as requested
+        self.background = make_solid_background((self.width, self.height), (198, 236, 198), "level3 background")  # Pastel green
+        self.overlay = make_overlay((self.width, self.height))
+        
+        # Success Screen Elements (Arabic Images)
+        # Note: Using "Start-game.png" for Dashboard button as we don't have a specific Dashboard image
+        self.next_button = button_frames(
+            "Start-game.png 200x80",
+            lambda: load_arabic_image('Start-game.png', (200, 80)) or create_button("Dashboard", 0, 0, 200, 80, (50, 200, 50), font_size=30))
+        self.restart_button = button_frames(
+            "try-agin.png 200x80",
+            lambda: load_arabic_image('try-agin.png', (200, 80)) or create_button("Restart", 0, 0, 200, 80, (200, 50, 50), font_size=30))
+        
+        self.draw_list = DrawList(screen)
+    
+    def draw_half(self, half):
+        pos = half.drawn_pos
+        
+        if not half.matched:
+            self.draw_list.add(half.image, pos, LAYER_DRAGGED if half.dragging else LAYER_PIECES)
     
-    def draw(self, screen):
+    def draw_slot(self, slot):
         # Draw the fixed half
-        screen.blit(self.fixed_half, self.rect.topleft)
+        self.draw_list.add(slot.fixed_half, slot.rect.topleft, LAYER_TARGETS)
         
-        # Draw highlight if hovering
-        if self.highlight and not self.matched:
-            pygame.draw.rect(screen, (255, 255, 100), self.rect.inflate(10, 10), 3)
+        # Glow around the fixed half while a matching half hovers near it
+        if slot.highlight and not slot.matched:
+            glow = outline_glow(f"level3 slot:{slot.vehicle_id}", slot.fixed_half)
+            self.draw_list.add(glow, slot.rect, LAYER_OUTLINES)
         
         # Draw matched half
-        if self.matched and self.matching_half:
+        if slot.matched and slot.matching_half:
             # Position right next to the fixed half
-            match_pos = (self.rect.right, self.rect.top)
-            screen.blit(self.matching_half, match_pos)
+            match_pos = (slot.rect.right + slot.offset[0], slot.rect.top + slot.offset[1])
+            self.draw_list.add(slot.matching_half, match_pos, LAYER_TARGETS)
+    
+    def draw(self, level):
+        """Draw the level"""
+        draw_list = self.draw_list
+        draw_list.clear()
+        draw_list.add(self.background, (0, 0), LAYER_BACKGROUND, opaque=True)
+        
+        # Draw title
+        draw_list.add_text("Complete the Vehicle Puzzles", 36, self.width // 2, 40, (80, 80, 80), LAYER_BACKGROUND)
+        
+        # Draw puzzle slots
+        for slot in level.puzzle_slots:
+            self.draw_slot(slot)
+        
+        # Draw draggable halves
+        for half in level.draggable_halves:
+            self.draw_half(half)
+        
+        # Draw sparkles
+        for sparkle in level.sparkles:
+            draw_list.add_call(sparkle.draw, LAYER_EFFECTS)
+        
+        # Draw confetti
+        if level.confetti:
+            draw_list.add_call(level.confetti.draw, LAYER_EFFECTS)
+        
+        # Draw completion message
+        if level.completed:
+            # Draw semi-transparent overlay
+            draw_list.add(self.overlay, (0, 0), LAYER_OVERLAY)
+            
+            draw_list.add_text("Level 3 Complete!", 60, self.width // 2, self.height // 2 - 50, (50, 200, 50))
+            draw_list.add_text("Puzzle Solved!", 40, self.width // 2, self.height // 2 + 20, (255, 215, 0))
+            
+            draw_list.add(*level.next_button.frame(self.next_button), LAYER_UI)
+            draw_list.add(*level.restart_button.frame(self.restart_button), LAYER_UI)
+        
+        draw_list.draw()
 
 class Level3:
-    def __init__(self, screen, success_sound=None, error_sound=None, complete_sound=None):
+    def __init__(self, screen, success_sound=None, error_sound=None, complete_sound=None, renderer=None, rng=None,
+                 precise_drops=False):
         self.screen = screen
         self.width, self.height = screen.get_size()
         self.success_sound = success_sound
         self.error_sound = error_sound
         self.complete_sound = complete_sound
         
-        # Load background - Solid pastel color as requested
-        self.background = pygame.Surface((self.width, self.height))
-        self.background.fill((198, 236, 198))  # Pastel green
+        # Layout RNG; the game passes a per-level seeded Random so layouts are reproducible
+        self.rng = rng if rng else random
+        
+        # Judge drops by how much of the piece's shape overlaps the target (cached masks)
+        # instead of any rect contact / center distance
+        self.precise_drops = precise_drops
+        
+        # Presentation lives in the renderer; pass render.NullRenderer() to skip drawing
+        self.renderer = renderer if renderer else Level3Renderer(screen)
         
         # Vehicle data
         vehicle_data = [
@@ -102,24 +190,21 @@ class Level3:
             ("ship", (100, 200, 200))
         ]
         
-        self.puzzle_slots = []
-        self.draggable_halves = []
+        # The slot and half lists are their stores' views, in pick/draw order
+        self.slot_store = EntityStore()
+        self.half_store = EntityStore()
+        self.puzzle_slots = self.slot_store.views
+        self.draggable_halves = self.half_store.views
         
         # Increase size for kids view (was 150, now 200)
         full_size = 200
-        half_width = full_size // 2
         
         # Create split vehicles
         for i, (vtype, color) in enumerate(vehicle_data):
-            # Create full vehicle (larger size)
-            full_vehicle = create_vehicle_image(vtype, color, (full_size, full_size))
-            
-            # Split into halves
-            left_half = pygame.Surface((half_width, full_size), pygame.SRCALPHA)
-            right_half = pygame.Surface((half_width, full_size), pygame.SRCALPHA)
-            
-            left_half.blit(full_vehicle, (0, 0), (0, 0, half_width, full_size))
-            right_half.blit(full_vehicle, (0, 0), (half_width, 0, half_width, full_size))
+            # Halves are views into one cached full-size vehicle (shared across restarts)
+            left_half, right_half = split_halves(
+                f"level3:{vtype}:{full_size}",
+                lambda vtype=vtype, color=color: create_vehicle_image(vtype, color, (full_size, full_size)))
             
             # Position slots on left side (adjusted for 1280x800)
             # 8 items total. Use 4 rows x 2 columns
@@ -130,8 +215,9 @@ class Level3:
             slot_y = 50 + row * 190 # 4 rows: 50, 240, 430, 620
             
             # Create puzzle slot with left half (fixed)
-            slot = PuzzleSlot(left_half, slot_x, slot_y, i)
-            self.puzzle_slots.append(slot)
+            slot = PuzzleSlot(self.slot_store, left_half.image, slot_x, slot_y, i)
+            if self.precise_drops:
+                slot.target_mask = right_half.hit_mask()
             
             # Create draggable right half on right side
             # Mirror the left side layout
@@ -140,14 +226,13 @@ class Level3:
             half_x = 800 + d_col * 280
             half_y = 50 + d_row * 190
             
-            draggable = VehicleHalf(right_half, half_x, half_y, i, False)
-            self.draggable_halves.append(draggable)
+            VehicleHalf(self.half_store, right_half, half_x, half_y, i, False)
         
         # Shuffle draggable halves positions
-        positions = [(h.rect.x, h.rect.y) for h in self.draggable_halves]
-        random.shuffle(positions)
+        positions = [h.topleft for h in self.draggable_halves]
+        self.rng.shuffle(positions)
         for half, pos in zip(self.draggable_halves, positions):
-            half.rect.topleft = pos
+            half.move_to(pos)
             half.original_pos = pos
         
         self.dragging_half = None
@@ -162,34 +247,39 @@ class Level3:
         # Load specific level complete sound
         self.level_complete_sound = load_sound(resource_path('assets/sounds/level3_complete.wav'))
             
-        # Success Screen Elements (Arabic Images)
-        from utils import load_arabic_image
-        
-        # Note: Using "Start-game.png" for Dashboard button as we don't have a specific Dashboard image
-        self.next_button = load_arabic_image('Start-game.png', (200, 80))
-        if not self.next_button:
-            self.next_button = create_button("Dashboard", 0, 0, 200, 80, (50, 200, 50), font_size=30)
-        self.next_button_rect = pygame.Rect((self.width - 200) // 2, self.height // 2 + 150, 200, 80)
-
-        self.restart_button = load_arabic_image('try-agin.png', (200, 80))
-        if not self.restart_button:
-            self.restart_button = create_button("Restart", 0, 0, 200, 80, (200, 50, 50), font_size=30)
-        self.restart_button_rect = pygame.Rect((self.width - 200) // 2, self.height // 2 + 250, 200, 80)
+        # Success screen button hit areas (images are in the renderer)
+        self.next_button = Button(pygame.Rect((self.width - 200) // 2, self.height // 2 + 150, 200, 80))
+        self.restart_button = Button(pygame.Rect((self.width - 200) // 2, self.height // 2 + 250, 200, 80))
+        self.next_button_rect = self.next_button.rect
+        self.restart_button_rect = self.restart_button.rect
+    
+    def target_rect(self, slot, half):
+        """Where a half sits once it's matched to slot (right next to the fixed half)"""
+        return pygame.Rect((slot.rect.right, slot.rect.top), half.rect.size)
+    
+    def drop_slots(self, half):
+        """Slots to try for a drop: all of them, or just the one the half covers most"""
+        if not self.precise_drops:
+            return self.puzzle_slots
+        targets = [(slot, self.target_rect(slot, half), slot.target_mask)
+                   for slot in self.puzzle_slots if not slot.matched]
+        slot = best_drop_target(half.piece.hit_mask(), half.rect, targets, DROP_OVERLAP)
+        return [slot] if slot else []
     
     def handle_event(self, event):
         """Handle mouse events"""
         if self.completed:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.next_button_rect.collidepoint(event.pos):
-                    return True
-                elif self.restart_button_rect.collidepoint(event.pos):
-                    return "restart"
+            if self.next_button.handle_event(event):
+                return True
+            if self.restart_button.handle_event(event):
+                return "restart"
             return False
         
         if event.type == pygame.MOUSEBUTTONDOWN:
-            for half in self.draggable_halves:
+            for half in self.half_store.hit(event.pos):
                 if half.start_drag(event.pos):
                     self.dragging_half = half
+                    emit("drag_start", level=3, piece=half.vehicle_id)
                     break
         
         elif event.type == pygame.MOUSEMOTION:
@@ -197,21 +287,23 @@ class Level3:
                 self.dragging_half.drag(event.pos)
                 
                 # Highlight slots - check distance for "magnetic" feel
-                for slot in self.puzzle_slots:
-                    # Calculate distance between centers
-                    dist_x = abs(self.dragging_half.rect.centerx - (slot.rect.right + self.dragging_half.rect.width/2))
-                    dist_y = abs(self.dragging_half.rect.centery - slot.rect.centery)
-                    
-                    # Highlight if close enough (within 100 pixels)
-                    is_close = dist_x < 100 and dist_y < 100
-                    slot.highlight = (is_close and not slot.matched)
+                # Distance between the half's center and where its center would be
+                # next to each slot, for all slots at once
+                half = self.dragging_half.rect
+                store = self.slot_store
+                n = store.count
+                dist_x = abs(half.centerx - (store.xy[:n, 0] + store.size[:n, 0] + half.width / 2))
+                dist_y = abs(half.centery - (store.xy[:n, 1] + store.size[:n, 1] // 2))
+                
+                # Highlight if close enough (within 100 pixels)
+                store.set_highlight((dist_x < 100) & (dist_y < 100) & ~store.matched[:n])
         
         elif event.type == pygame.MOUSEBUTTONUP:
             if self.dragging_half:
                 matched = False
                 
                 # Check if dropped near correct slot
-                for slot in self.puzzle_slots:
+                for slot in self.drop_slots(self.dragging_half):
                     # Calculate distance to target position (right next to slot)
                     target_x = slot.rect.right
                     target_y = slot.rect.top
@@ -219,19 +311,23 @@ class Level3:
                     # Check distance (generous 100px radius)
                     dist = ((self.dragging_half.rect.x - target_x)**2 + (self.dragging_half.rect.y - target_y)**2)**0.5
                     
-                    if dist < 100 and not slot.matched:
+                    if (dist < 100 or self.precise_drops) and not slot.matched:
                         if slot.check_match(self.dragging_half):
                             # Correct match!
                             slot.matched = True
                             slot.matching_half = self.dragging_half.image
                             self.dragging_half.matched = True
                             self.matches_found += 1
+                            emit("correct_match", level=3, piece=slot.vehicle_id)
                             
                             if self.success_sound:
                                 self.success_sound.play()
                             
                             # Snap to position
-                            self.dragging_half.rect.topleft = (slot.rect.right, slot.rect.top)
+                            drop = self.dragging_half.topleft
+                            self.dragging_half.move_to((slot.rect.right, slot.rect.top))
+                            slot.offset = (drop[0] - slot.rect.right, drop[1] - slot.rect.top)
+                            scheduler.tween(slot, "offset", (0, 0), SNAP_SECONDS, "ease_out_back")
                             
                             sparkle = SparkleEffect(slot.rect.centerx + 30, slot.rect.centery)
                             self.sparkles.append(sparkle)
@@ -241,6 +337,7 @@ class Level3:
                 
                 if not matched and self.dragging_half.dragging:
                     # Wrong match
+                    emit("wrong_drop", level=3, piece=self.dragging_half.vehicle_id, pos=event.pos)
                     self.dragging_half.return_to_start()
                     if self.error_sound:
                         self.error_sound.play()
@@ -249,16 +346,12 @@ class Level3:
                 self.dragging_half = None
                 
                 # Reset highlights
-                for slot in self.puzzle_slots:
-                    slot.highlight = False
+                self.slot_store.set_highlight(False)
         
         return False
     
     def update(self):
         """Update animations and check completion"""
-        for half in self.draggable_halves:
-            half.update()
-        
         self.sparkles = [s for s in self.sparkles if s.update()]
         
         if self.confetti:
@@ -268,6 +361,7 @@ class Level3:
         if self.matches_found >= self.total_matches and not self.completed:
             self.completed = True
             self.completion_timer = pygame.time.get_ticks()
+            emit("level_complete", level=3)
             if self.level_complete_sound:
                 self.level_complete_sound.play()
             # Create confetti effect
@@ -278,39 +372,36 @@ class Level3:
         
         return False
     
+    def get_state(self):
+        """Progress as plain data for session snapshots (no surfaces)"""
+        return {
+            "halves": [[h.vehicle_id, h.rect.x, h.rect.y, h.original_pos[0], h.original_pos[1], h.matched]
+                       for h in self.draggable_halves],
+            "matched_slots": [slot.vehicle_id for slot in self.puzzle_slots if slot.matched],
+            "matches_found": self.matches_found,
+            "completed": self.completed,
+        }
+    
+    def restore_state(self, state):
+        """Put halves and slots back where a snapshot left them"""
+        self.half_store.reset()
+        self.slot_store.reset()
+        halves = {h.vehicle_id: h for h in self.draggable_halves}
+        for vehicle_id, x, y, original_x, original_y, matched in state["halves"]:
+            half = halves[vehicle_id]
+            half.move_to((x, y))
+            half.original_pos = (original_x, original_y)
+            half.matched = matched
+        # Keep draw/pick order
+        self.half_store.reorder([halves[record[0]].index for record in state["halves"]])
+        self.draggable_halves = self.half_store.views
+        matched_slots = set(state["matched_slots"])
+        for slot in self.puzzle_slots:
+            slot.matched = slot.vehicle_id in matched_slots
+            slot.matching_half = halves[slot.vehicle_id].image if slot.matched else None
+        self.matches_found = state["matches_found"]
+        self.completed = state["completed"]
+    
     def draw(self):
         """Draw the level"""
-        self.screen.blit(self.background, (0, 0))
-        
-        # Draw title
-        draw_text(self.screen, "Complete the Vehicle Puzzles", 36, self.width // 2, 40, (80, 80, 80))
-        
-        # Draw puzzle slots
-        for slot in self.puzzle_slots:
-            slot.draw(self.screen)
-        
-        # Draw draggable halves
-        for half in self.draggable_halves:
-            half.draw(self.screen)
-        
-        # Draw sparkles
-        for sparkle in self.sparkles:
-            sparkle.draw(self.screen)
-        
-        # Draw confetti
-        if self.confetti:
-            self.confetti.draw(self.screen)
-        
-        # Draw completion message
-        # Draw completion message
-        if self.completed:
-            # Draw semi-transparent overlay
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            self.screen.blit(overlay, (0, 0))
-            
-            draw_text(self.screen, "Level 3 Complete!", 60, self.width // 2, self.height // 2 - 50, (50, 200, 50))
-            draw_text(self.screen, "Puzzle Solved!", 40, self.width // 2, self.height // 2 + 20, (255, 215, 0))
-            
-            self.screen.blit(self.next_button, self.next_button_rect)
-            self.screen.blit(self.restart_button, self.restart_button_rect)
+        self.renderer.draw(self)
@@ -2,23 +2,33 @@
 Main Game File - Educational Transportation Game
 Entry point and game state management
 """
+import argparse
+import json
+import os
 import pygame
+import random
 import sys
-from start_screen import StartScreen
-from level1 import Level1
-from level2 import Level2
-from level3 import Level3
-from dashboard import Dashboard
-from utils import load_sound, resource_path
+import time
+import tracemalloc
+import memory_report
+import telemetry
+import tween
+from perf import StartupTrace, FrameStats
+from render import NullRenderer
+from prefetch import LevelPrefetcher
+from pacing import make_pacer
 
-# Initialize Pygame
-pygame.init()
-pygame.mixer.init()
+# Startup trace is module-level so the imports below are included in it
+STARTUP_TRACE = StartupTrace()
+with STARTUP_TRACE.measure("import", "utils"):
+    from utils import load_sound, resource_path
 
 # Constants
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 800
 FPS = 60
+MAX_FRAME_SECONDS = 0.1  # Animation step cap, so a stall doesn't teleport things
+IDLE_REDRAW_FRAMES = 15  # Still frames drawn before live play stops redrawing
 
 # Game states
 STATE_START = "start"
@@ -27,13 +37,95 @@ STATE_LEVEL2 = "level2"
 STATE_LEVEL3 = "level3"
 STATE_DASHBOARD = "dashboard"
 STATE_COMPLETE = "complete"
+STATE_PROFILES = "profiles"
+
+def _make_menu(game, screen_class, rng=None):
+    return screen_class(game.screen)
+
+def _make_dashboard(game, screen_class, rng=None):
+    return screen_class(game.screen, classroom=game.profiles is not None)
+
+def _make_profile_screen(game, screen_class, rng=None):
+    return screen_class(game.screen, game.profiles)
+
+def _make_level(game, level_class, rng=None):
+    renderer = NullRenderer() if game.null_render else None
+    return level_class(game.screen, game.success_sound,
+                       game.error_sound, game.complete_sound, renderer=renderer, rng=rng,
+                       precise_drops=game.precise_drops)
+
+# Screen factory registry: state -> (module, class, factory)
+# Modules are only imported the first time their screen is needed
+SCREEN_FACTORIES = {
+    STATE_START: ("start_screen", "StartScreen", _make_menu),
+    STATE_DASHBOARD: ("dashboard", "Dashboard", _make_dashboard),
+    STATE_PROFILES: ("profile_screen", "ProfileScreen", _make_profile_screen),
+    STATE_LEVEL1: ("level1", "Level1", _make_level),
+    STATE_LEVEL2: ("level2", "Level2", _make_level),
+    STATE_LEVEL3: ("level3", "Level3", _make_level),
+}
+
+LEVEL_NUMBERS = {STATE_LEVEL1: 1, STATE_LEVEL2: 2, STATE_LEVEL3: 3}
+
+# Progression is linear, so the level that follows each screen is known ahead of time
+NEXT_LEVEL = {
+    STATE_DASHBOARD: STATE_LEVEL1,
+    STATE_START: STATE_LEVEL1,
+    STATE_LEVEL1: STATE_LEVEL2,
+    STATE_LEVEL2: STATE_LEVEL3,
+}
 
 class Game:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, trace=None, seed=None, recorder=None, replayer=None, fast=False,
+                 autoplayer=None, null_render=False, prefetch=True, snapshots=None,
+                 progress=None, profiles=None, precise_drops=False, pacing="tick",
+                 capture_dir=None, capture_fps=10, record_session=False):
+        self.trace = trace if trace else STARTUP_TRACE
+
+        # Seed the shared RNG so layouts can be reproduced by a replay
+        if replayer:
+            seed = replayer.seed
+        elif seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        random.seed(seed)
+        self.recorder = recorder
+        if self.recorder:
+            self.recorder.seed = seed
+        self.replayer = replayer
+        self.autoplayer = autoplayer  # e.g. bot.BotPlayer, replaces live input
+        self.fast = fast  # Don't cap the frame rate (replays/benchmarks)
+        self.null_render = null_render  # Run logic only, skip all drawing
+        self.precise_drops = precise_drops  # Mask-overlap drop tests in the levels
+        self.frame = 0
+        # How the rest of each frame is waited out (see pacing.py); --fast never waits
+        self.pacer = make_pacer("unlimited" if fast else pacing, FPS)
+        self.frame_stats = FrameStats(target_ms=None if fast else 1000.0 / FPS)
+        # Animations advance by real time live, by exactly one frame when the
+        # input is scripted or recorded so replays see identical animation states
+        self.fixed_dt = 1.0 / FPS if (fast or replayer or recorder or autoplayer) else None
+        # Live play stops redrawing once nothing has moved for a few frames
+        self.skip_idle_draws = not (fast or replayer or autoplayer)
+        self.input_this_frame = False
+        self.quiet_frames = 0
+
+        # Initialize Pygame
+        pygame.init()
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            print("Audio device not available, continuing without sound")
+
+        self.screen = self.pacer.create_display((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Transportation Adventure")
         self.clock = pygame.time.Clock()
         self.running = True
+        # Screenshots (F12) and session recordings (F10), see capture.py
+        self.capture_dir = capture_dir
+        self.capture_fps = capture_fps
+        self.capture = None
+        if record_session and not null_render:
+            self.get_capture().start()
         self.state = STATE_DASHBOARD # Start with Dashboard as requested
         
         # Load sounds
@@ -51,91 +143,274 @@ class Game:
         except:
             print("Background music not found, continuing without music")
         
-        # Initialize screens/levels
-        self.start_screen = StartScreen(self.screen)
-        self.dashboard = Dashboard(self.screen)
+        # Screens are constructed on first use (see SCREEN_FACTORIES)
+        self.screens = {}
         self.current_level = None
+        self.level_builds = {}  # state -> number of layouts generated so far
+        # The next level is built during idle frames while this one is played
+        self.prefetcher = LevelPrefetcher(self.build_screen) if prefetch else None
         
         # Level status tracking
         self.level_status = {1: False, 2: False, 3: False}
+        self.level_started_at = None
+        self.completion_recorded = False
+        
+        # Completed levels persist across launches (progress_store.ProgressStore)
+        self.progress = progress
+        # Classroom mode: each child picks a profile before the Dashboard
+        self.profiles = profiles  # profiles.ProfileIndex
+        self.profile_id = None
+        if self.profiles:
+            self.state = STATE_PROFILES
+        
+        # Resume from the last checkpoint (e.g. after a kiosk was power-cycled)
+        self.snapshots = snapshots  # snapshot.SnapshotWriter
+        if self.snapshots:
+            data = self.snapshots.load()
+            if data:
+                self.restore_snapshot(data)
+        
+        self.merge_progress()
+        self.prefetch_next()
+
+    def build_screen(self, state, rng=None):
+        """Import the screen's module if needed and construct a new instance"""
+        module_name, class_name, factory = SCREEN_FACTORIES[state]
+        module = self.trace.import_module(module_name)
+        with self.trace.measure("construct", class_name), memory_report.tracker.owned_by(state):
+            return factory(self, getattr(module, class_name), rng)
+
+    def level_rng(self, state):
+        """RNG for the next layout of a level, derived only from the game seed
+        
+        This keeps layouts reproducible whether a level is built now or
+        prefetched earlier during an idle frame.
+        """
+        count = self.level_builds.get(state, 0)
+        self.level_builds[state] = count + 1
+        return random.Random(f"{self.seed}:{state}:{count}")
+
+    def merge_progress(self):
+        """Mark levels the current player has completed in an earlier session"""
+        if self.progress:
+            for level, done in self.progress.level_status().items():
+                self.level_status[level] = self.level_status.get(level, False) or done
+
+    def select_profile(self, profile_id):
+        """Switch to a child's profile, loading only their progress file"""
+        with self.trace.measure("profile", profile_id):
+            if self.progress:
+                self.progress.end_session()
+            self.profile_id = profile_id
+            self.progress = self.profiles.open_progress(profile_id)
+            self.level_status = {1: False, 2: False, 3: False}
+            self.merge_progress()
+            telemetry.set_context(profile=profile_id)
+
+    def restore_snapshot(self, data):
+        """Restore game and level progress from a snapshot dict"""
+        with self.trace.measure("restore", data["state"]):
+            profile_id = data.get("profile")
+            if self.profiles:
+                if not (profile_id and self.profiles.get(profile_id)):
+                    # Saved before anyone picked a profile (or it was removed):
+                    # stay on the profile picker rather than play with no progress file
+                    return
+                self.select_profile(profile_id)
+            self.seed = data["seed"]
+            random.seed(self.seed)
+            self.level_builds = dict(data["level_builds"])
+            self.level_status = {int(level): done for level, done in data["level_status"].items()}
+            self.state = data["state"]
+            if data["level"] is not None and self.state in NEXT_LEVEL.values():
+                # The shuffled layout is overwritten by the saved positions
+                self.current_level = self.build_screen(self.state)
+                self.current_level.restore_state(data["level"])
+                self.level_started_at = time.monotonic()
+                self.completion_recorded = self.current_level.completed
+
+    def checkpoint(self):
+        """Queue a snapshot of the current progress (written on a background thread)"""
+        if self.snapshots:
+            self.snapshots.checkpoint(self)
+
+    def prefetch_next(self):
+        """Start building the level that follows the current state"""
+        next_state = NEXT_LEVEL.get(self.state)
+        if self.prefetcher and next_state:
+            self.prefetcher.prefetch(next_state, self.level_rng(next_state))
+
+    def get_screen(self, state):
+        """Return the menu screen for a state, constructing it on first use"""
+        screen = self.screens.get(state)
+        if screen is None:
+            screen = self.build_screen(state)
+            self.screens[state] = screen
+        return screen
+
+    def show_screen(self, state):
+        """Switch to a menu screen; a cached one gets its buttons reset"""
+        self.state = state
+        screen = self.screens.get(state)
+        if screen is not None and hasattr(screen, "enter"):
+            screen.enter()
+
+    def memory_summary(self):
+        """Surface and heap accounting for the screens currently alive"""
+        live_screens = list(self.screens)
+        if self.current_level:
+            live_screens.append(self.state)
+        module_names = [module_name for module_name, _, _ in SCREEN_FACTORIES.values()]
+        return memory_report.format_report(live_screens, module_names)
+
+    def start_level(self, state):
+        """Switch to a level state with a freshly constructed (or prefetched) level"""
+        self.state = state
+        level = self.prefetcher.take(state) if self.prefetcher else None
+        if level is None:
+            level = self.build_screen(state, self.level_rng(state))
+        self.current_level = level
+        tween.scheduler.clear()  # Animations belong to the level being left
+        self.level_started_at = time.monotonic()
+        self.completion_recorded = False
+        if self.progress:
+            self.progress.record_attempt(LEVEL_NUMBERS[state])
+        self.prefetch_next()
+
+    def on_level_completed(self):
+        """Called once when the current level's last piece is matched"""
+        seconds = time.monotonic() - self.level_started_at
+        if self.progress:
+            self.progress.record_completion(LEVEL_NUMBERS[self.state], seconds)
         
+    def poll_events(self):
+        """Return this frame's events, from the replay file, bot or live input"""
+        if self.autoplayer:
+            pygame.event.pump()
+            return self.autoplayer.events_for(self)
+        if self.replayer:
+            # Keep the window responsive but ignore live input
+            pygame.event.pump()
+            if self.replayer.finished(self.frame):
+                self.running = False
+            return self.replayer.events_for(self.frame)
+        
+        events = pygame.event.get()
+        if self.recorder:
+            self.recorder.record(self.frame, events)
+        return events
+
     def handle_events(self):
         """Handle pygame events"""
-        for event in pygame.event.get():
+        events = self.poll_events()
+        self.input_this_frame = bool(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_F9 and memory_report.tracker.enabled:
+                    print(self.memory_summary())
+                elif event.key == pygame.K_F12 and not self.null_render:
+                    path = self.get_capture().screenshot(self.screen)
+                    if path:
+                        print(f"Screenshot: {path}")
+                elif event.key == pygame.K_F10 and not self.null_render:
+                    capture = self.get_capture()
+                    capture.toggle()
+                    print(f"Recording: {capture.recording}" if capture.recording else "Recording stopped")
             
             # Pass events to current screen/level
             if self.state == STATE_START:
-                action = self.start_screen.handle_event(event)
+                action = self.get_screen(STATE_START).handle_event(event)
                 if action == "start":
                     # Start button clicked
-                    self.state = STATE_LEVEL1
-                    self.current_level = Level1(self.screen, self.success_sound, 
-                                               self.error_sound, self.complete_sound)
+                    self.start_level(STATE_LEVEL1)
                     # Play Arabic instruction sound
                     if self.voice_match_image_sound:
                         self.voice_match_image_sound.play()
                 elif action == "dashboard":
-                    self.state = STATE_DASHBOARD
+                    self.show_screen(STATE_DASHBOARD)
+            
+            elif self.state == STATE_PROFILES:
+                action = self.get_screen(STATE_PROFILES).handle_event(event)
+                if action and action[0] == "profile":
+                    self.select_profile(action[1])
+                    self.show_screen(STATE_DASHBOARD)
             
             elif self.state == STATE_DASHBOARD:
-                action = self.dashboard.handle_event(event)
+                action = self.get_screen(STATE_DASHBOARD).handle_event(event)
                 if action == "start":
                     # Start button clicked -> Go to Level 1
-                    self.state = STATE_LEVEL1
-                    self.current_level = Level1(self.screen, self.success_sound, 
-                                               self.error_sound, self.complete_sound)
+                    self.start_level(STATE_LEVEL1)
                     # Play Arabic instruction sound
                     if self.voice_match_image_sound:
                         self.voice_match_image_sound.play()
+                elif action == "profiles":
+                    self.show_screen(STATE_PROFILES)
             
             elif self.current_level:
                 action = self.current_level.handle_event(event)
                 if action == "restart":
                     # Restart current level
-                    if self.state == STATE_LEVEL1:
-                        self.current_level = Level1(self.screen, self.success_sound, 
-                                                   self.error_sound, self.complete_sound)
-                    elif self.state == STATE_LEVEL2:
-                        self.current_level = Level2(self.screen, self.success_sound,
-                                                   self.error_sound, self.complete_sound)
-                    elif self.state == STATE_LEVEL3:
-                        self.current_level = Level3(self.screen, self.success_sound,
-                                                   self.error_sound, self.complete_sound)
+                    self.start_level(self.state)
                 elif action is True:
                     # Move to next level
                     if self.state == STATE_LEVEL1:
                         self.level_status[1] = True
-                        self.state = STATE_LEVEL2
-                        self.current_level = Level2(self.screen, self.success_sound,
-                                                   self.error_sound, self.complete_sound)
+                        self.start_level(STATE_LEVEL2)
                     elif self.state == STATE_LEVEL2:
                         self.level_status[2] = True
-                        self.state = STATE_LEVEL3
-                        self.current_level = Level3(self.screen, self.success_sound,
-                                                   self.error_sound, self.complete_sound)
+                        self.start_level(STATE_LEVEL3)
                     elif self.state == STATE_LEVEL3:
                         self.level_status[3] = True
-                        self.state = STATE_DASHBOARD
+                        self.show_screen(STATE_DASHBOARD)
                         self.current_level = None
+                        self.prefetch_next()
+        
+        # Drops and button clicks are the only things that change progress
+        if any(event.type == pygame.MOUSEBUTTONUP for event in events):
+            self.checkpoint()
     
     def update(self):
         """Update game logic"""
+        dt = self.fixed_dt if self.fixed_dt else min(self.clock.get_time() / 1000.0, MAX_FRAME_SECONDS)
+        tween.scheduler.update(dt)
         if self.current_level:
             # Update animations
             self.current_level.update()
+            if self.current_level.completed and not self.completion_recorded:
+                self.completion_recorded = True
+                self.on_level_completed()
+    
+    def animating(self):
+        """True while tweens, sparkles or confetti are still moving"""
+        if tween.scheduler.busy:
+            return True
+        level = self.current_level
+        return bool(level and (level.sparkles or getattr(level, "confetti", None)))
+    
+    def needs_redraw(self):
+        """False once a live screen has been still for IDLE_REDRAW_FRAMES frames"""
+        if not self.skip_idle_draws or self.input_this_frame or self.animating():
+            self.quiet_frames = 0
+        else:
+            self.quiet_frames += 1
+        return self.quiet_frames < IDLE_REDRAW_FRAMES
     
     def draw(self):
         """Draw current screen"""
+        if self.null_render:
+            return
         if self.state == STATE_START:
-            self.start_screen.draw()
+            self.get_screen(STATE_START).draw()
         elif self.state == STATE_DASHBOARD:
-            self.dashboard.draw(self.level_status)
+            history = self.progress.history if self.progress else None
+            self.get_screen(STATE_DASHBOARD).draw(self.level_status, history)
+        elif self.state == STATE_PROFILES:
+            self.get_screen(STATE_PROFILES).draw()
         elif self.current_level:
             self.current_level.draw()
         elif self.state == STATE_COMPLETE:
@@ -144,20 +419,188 @@ class Game:
         
         pygame.display.flip()
     
+    def get_capture(self):
+        """The ScreenCapture, started on first use"""
+        if self.capture is None:
+            from capture import ScreenCapture
+            from persistence import user_data_path
+            self.capture = ScreenCapture(self.capture_dir or user_data_path("captures"),
+                                         self.screen.get_size(), fps=self.capture_fps)
+        return self.capture
+    
+    def step(self):
+        """Run a single frame"""
+        self.handle_events()
+        self.update()
+        drawn = self.needs_redraw()
+        if drawn:
+            self.draw()
+            if self.capture and self.capture.recording:
+                self.capture.frame(self.screen, self.frame)
+        elif self.prefetcher:
+            # Nothing on screen is changing, so a slow frame here goes unnoticed
+            self.prefetcher.idle()
+        self.pacer.pace(self.clock, drawn and not self.null_render)  # Only a real flip waits for vsync
+        self.frame_stats.tick()
+        self.frame += 1
+    
     def run(self):
         """Main game loop"""
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            self.step()
         
+        if self.recorder:
+            self.recorder.save()
+        if self.prefetcher:
+            self.prefetcher.shutdown()
+        if self.snapshots:
+            self.checkpoint()
+            self.snapshots.close()
+        if self.progress:
+            self.progress.close()
+        if self.profiles:
+            self.profiles.close()
+        if self.capture:
+            self.capture.close()
         pygame.quit()
-        sys.exit()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Transportation Adventure")
+    parser.add_argument("--trace-startup", action="store_true",
+                        help="print import and screen construction times")
+    parser.add_argument("--seed", type=int, help="seed for the layout RNG")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record input events and the RNG seed to PATH")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="replay a recorded session and report frame times")
+    parser.add_argument("--headless", action="store_true",
+                        help="use SDL's dummy video/audio drivers (no window)")
+    parser.add_argument("--fast", action="store_true",
+                        help="run frames as fast as possible instead of at 60 FPS")
+    parser.add_argument("--resume", action="store_true",
+                        help="save progress at checkpoints and resume it on the next start")
+    parser.add_argument("--snapshot", metavar="PATH",
+                        help="snapshot file for --resume (default: in the user data folder)")
+    parser.add_argument("--progress", metavar="PATH",
+                        help="progress file (default: in the user data folder)")
+    parser.add_argument("--no-progress", action="store_true",
+                        help="don't load or save level progress")
+    parser.add_argument("--classroom", action="store_true",
+                        help="pick a child's profile before the Dashboard")
+    parser.add_argument("--add-profile", metavar="NAME", action="append", default=[],
+                        help="add a child to the classroom profiles (repeatable)")
+    parser.add_argument("--telemetry", metavar="DIR",
+                        help="gameplay event log folder (default: in the user data folder)")
+    parser.add_argument("--no-telemetry", action="store_true",
+                        help="don't log gameplay events")
+    parser.add_argument("--no-prefetch", action="store_true",
+                        help="build each level only when it starts, not ahead during idle frames")
+    parser.add_argument("--pacing", choices=["tick", "busy", "hybrid", "vsync"], default="tick",
+                        help="how frames are paced (compare them with: python pacing.py)")
+    parser.add_argument("--precise-drops", action="store_true",
+                        help="accept drops by shape overlap instead of rect contact/distance")
+    parser.add_argument("--null-render", action="store_true",
+                        help="run game logic without drawing anything")
+    parser.add_argument("--capture", action="store_true",
+                        help="record the session from the start (F10 toggles, F12 takes a screenshot)")
+    parser.add_argument("--capture-dir", metavar="DIR",
+                        help="where screenshots and recordings go (default: the user data folder)")
+    parser.add_argument("--capture-fps", type=float, default=10,
+                        help="recorded frames per second (encode later with: python capture.py encode)")
+    parser.add_argument("--trace-alloc", action="store_true",
+                        help="track Python allocations with tracemalloc")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="track surfaces/heap per screen; F9 or exit dumps the report")
+    parser.add_argument("--report", metavar="PATH",
+                        help="write the frame/allocation report as JSON to PATH")
+    args = parser.parse_args(argv)
+    if (args.classroom or args.add_profile) and (args.no_progress or args.replay):
+        parser.error("--classroom/--add-profile save per-child progress, "
+                     "so they can't be combined with --no-progress or --replay")
+    if args.resume and (args.record or args.replay):
+        parser.error("--resume restores a saved seed and layout, "
+                     "so it can't be combined with --record or --replay")
+    return args
+
+def build_report(game):
+    """Frame time and allocation summary for comparing builds"""
+    report = {"seed": game.seed, "frames": game.frame, "pacing": game.pacer.name}
+    report.update(game.frame_stats.summary())
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        report["alloc_current_kb"] = current / 1024
+        report["alloc_peak_kb"] = peak / 1024
+    return report
 
 def main():
-    game = Game()
+    args = parse_args()
+    STARTUP_TRACE.enabled = args.trace_startup
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    if args.trace_alloc:
+        tracemalloc.start()
+    if args.memory_report:
+        memory_report.enable()
+    
+    # Deferred so replay.py's pygame setup only happens when it's used
+    recorder = replayer = None
+    if args.record or args.replay:
+        from replay import InputRecorder, InputReplayer
+        if args.record:
+            recorder = InputRecorder(args.record, args.seed)
+        if args.replay:
+            replayer = InputReplayer(args.replay)
+    
+    snapshots = None
+    if args.resume:
+        from snapshot import SnapshotWriter
+        snapshots = SnapshotWriter(args.snapshot)
+    
+    # Replays must start from a clean slate, so they never use saved progress
+    # (parse_args refuses profiles together with --replay/--no-progress)
+    progress = profiles = None
+    if args.classroom or args.add_profile:
+        from profiles import ProfileIndex
+        profiles = ProfileIndex()
+        for name in args.add_profile:
+            profiles.add_profile(name)
+    elif not (args.no_progress or args.replay):
+        from progress_store import ProgressStore
+        progress = ProgressStore(args.progress)
+    
+    emitter = None
+    if not (args.no_telemetry or args.replay):
+        from persistence import user_data_path
+        emitter = telemetry.TelemetryEmitter(args.telemetry or user_data_path("telemetry"))
+        telemetry.install(emitter)
+    
+    game = Game(seed=args.seed, recorder=recorder, replayer=replayer, fast=args.fast,
+                null_render=args.null_render, prefetch=not args.no_prefetch,
+                precise_drops=args.precise_drops, pacing=args.pacing,
+                snapshots=snapshots, progress=progress, profiles=profiles,
+                capture_dir=args.capture_dir, capture_fps=args.capture_fps, record_session=args.capture)
+    if args.trace_startup:
+        # Dashboard is the first screen shown, so include it in the trace
+        game.get_screen(game.state)
+        print(STARTUP_TRACE.report())
     game.run()
+    
+    if emitter:
+        emitter.close()
+        if emitter.dropped:
+            print(f"Telemetry dropped {emitter.dropped} events")
+    if game.capture and game.capture.captured:
+        print(f"Recorded {game.capture.captured} frames ({game.capture.dropped} skipped) to {game.capture.directory}")
+    if args.memory_report:
+        print(game.memory_summary())
+    if args.replay or args.report:
+        report = build_report(game)
+        print(json.dumps(report, indent=2))
+        if args.report:
+            with open(args.report, "w") as f:
+                json.dump(report, f, indent=2)
+    sys.exit()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,108 @@
+"""
+Memory accounting for the Transportation Game
+Tracks surfaces created by the game's loaders and Python heap use per screen
+"""
+import os
+import tracemalloc
+import weakref
+from contextlib import contextmanager
+
+class SurfaceTracker:
+    """Keeps a live registry of tracked surfaces (size, bytes, owner screen)"""
+    def __init__(self):
+        self.enabled = False
+        self.owner = "global"  # Screen being constructed (screens are only built on the main thread)
+        self.surfaces = {}  # id -> (owner, source, (w, h), bytes)
+        self.construct_heap = {}  # owner -> bytes allocated while constructing
+
+    def track(self, surface, source):
+        """Record a surface; it's dropped from the registry when collected"""
+        if not self.enabled or surface is None:
+            return surface
+        key = id(surface)
+        width, height = surface.get_size()
+        # Subsurfaces share their parent's pixels
+        size_bytes = 0 if surface.get_parent() else surface.get_pitch() * height
+        self.surfaces[key] = (self.owner, source, (width, height), size_bytes)
+        weakref.finalize(surface, self.surfaces.pop, key, None)
+        return surface
+
+    @contextmanager
+    def owned_by(self, owner):
+        """Attribute surfaces and heap allocated in the with-block to owner"""
+        previous = self.owner
+        self.owner = owner
+        before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        try:
+            yield
+        finally:
+            self.owner = previous
+            if before is not None:
+                allocated = tracemalloc.get_traced_memory()[0] - before
+                self.construct_heap[owner] = self.construct_heap.get(owner, 0) + allocated
+
+    def totals_by_owner(self):
+        """Return {owner: (surface count, bytes)} for live surfaces"""
+        totals = {}
+        for owner, _, _, size_bytes in self.surfaces.values():
+            count, total = totals.get(owner, (0, 0))
+            totals[owner] = (count + 1, total + size_bytes)
+        return totals
+
+    def surface_count(self):
+        return len(self.surfaces)
+
+    def surface_bytes(self):
+        return sum(entry[3] for entry in self.surfaces.values())
+
+# Shared tracker used by the loaders in utils
+tracker = SurfaceTracker()
+
+def track_surface(surface, source):
+    return tracker.track(surface, source)
+
+def enable(trace_heap=True):
+    """Start tracking surfaces (and the Python heap with tracemalloc)"""
+    tracker.enabled = True
+    if trace_heap and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def heap_by_module(module_names):
+    """Live Python heap allocated from each module's source file"""
+    if not tracemalloc.is_tracing():
+        return {}
+    snapshot = tracemalloc.take_snapshot()
+    totals = {name: 0 for name in module_names}
+    for stat in snapshot.statistics("filename"):
+        name = os.path.splitext(os.path.basename(stat.traceback[0].filename))[0]
+        if name in totals:
+            totals[name] += stat.size
+    return totals
+
+def format_report(live_screens, module_names, top=10):
+    """Build the memory budget report as printable text"""
+    mb = 1024 * 1024
+    lines = ["Memory report:"]
+    lines.append(f"  tracked surfaces: {tracker.surface_count()}  "
+                 f"pixels: {tracker.surface_bytes() / mb:.2f} MB")
+    lines.append(f"  live screens: {', '.join(live_screens) or 'none'}")
+    lines.append("  surfaces by owner:")
+    totals = tracker.totals_by_owner()
+    for owner, (count, size_bytes) in sorted(totals.items(), key=lambda item: -item[1][1]):
+        lines.append(f"    {owner:<12} {count:4d} surfaces {size_bytes / mb:8.2f} MB")
+
+    lines.append(f"  largest surfaces (top {top}):")
+    largest = sorted(tracker.surfaces.values(), key=lambda entry: -entry[3])[:top]
+    for owner, source, (width, height), size_bytes in largest:
+        lines.append(f"    {owner:<12} {width:4d}x{height:<4d} {size_bytes / 1024:8.1f} KB  {source}")
+
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        lines.append(f"  python heap: {current / mb:.2f} MB (peak {peak / mb:.2f} MB)")
+        lines.append("  heap allocated while constructing:")
+        for owner, size_bytes in tracker.construct_heap.items():
+            lines.append(f"    {owner:<12} {size_bytes / 1024:10.1f} KB")
+        lines.append("  live heap by screen module:")
+        for name, size_bytes in heap_by_module(module_names).items():
+            lines.append(f"    {name:<12} {size_bytes / 1024:10.1f} KB")
+    return "\n".join(lines)
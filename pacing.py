@@ -0,0 +1,151 @@
+"""
+Frame pacing strategies for the Transportation Game
+Each pacer creates the display and waits out the rest of every frame its own way;
+run this module to compare their frame-time jitter on the current machine.
+"""
+import argparse
+import json
+import time
+import pygame
+
+class TickPacer:
+    """pygame's Clock.tick: sleeps, so it is cheap but only as precise as the OS timer"""
+    name = "tick"
+
+    def __init__(self, fps):
+        self.fps = fps
+
+    def create_display(self, size):
+        return pygame.display.set_mode(size)
+
+    def pace(self, clock, drawn=True):
+        """Wait out the rest of the frame; drawn is False when the frame skipped its flip"""
+        clock.tick(self.fps)
+
+class BusyPacer(TickPacer):
+    """Clock.tick_busy_loop: spins for exact frame times at the cost of a busy core"""
+    name = "busy"
+
+    def pace(self, clock, drawn=True):
+        clock.tick_busy_loop(self.fps)
+
+class HybridPacer(TickPacer):
+    """Sleeps most of the frame, then spins the last spin_ms to hit the deadline"""
+    name = "hybrid"
+
+    def __init__(self, fps, spin_ms=2.0):
+        super().__init__(fps)
+        self.period = 1.0 / fps
+        self.spin = spin_ms / 1000.0
+        self.deadline = None
+
+    def pace(self, clock, drawn=True):
+        now = time.perf_counter()
+        if self.deadline is None or now > self.deadline + self.period:
+            # First frame, or too far behind to catch up: restart the schedule
+            self.deadline = now
+        remaining = self.deadline - now - self.spin
+        if remaining > 0:
+            time.sleep(remaining)
+        while time.perf_counter() < self.deadline:
+            pass
+        self.deadline += self.period
+        clock.tick()  # Keeps clock.get_time() right for time-based animations
+
+class VsyncPacer(TickPacer):
+    """Lets display.flip() wait for the monitor's refresh (needs a SCALED window)"""
+    name = "vsync"
+
+    def create_display(self, size):
+        try:
+            return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+        except pygame.error as e:
+            print(f"Vsync not available ({e}), pacing with Clock.tick instead")
+            self.pace = super().pace
+            return pygame.display.set_mode(size)
+
+    def pace(self, clock, drawn=True):
+        if drawn:
+            clock.tick()  # flip() already waited for the refresh
+        else:
+            clock.tick(self.fps)  # No flip on an idle frame, so nothing else would wait
+
+class UnlimitedPacer(TickPacer):
+    """No waiting at all (replays and benchmarks)"""
+    name = "unlimited"
+
+    def pace(self, clock, drawn=True):
+        clock.tick()
+
+PACERS = {pacer.name: pacer for pacer in (TickPacer, BusyPacer, HybridPacer, VsyncPacer, UnlimitedPacer)}
+
+def make_pacer(name, fps):
+    if name not in PACERS:
+        raise ValueError(f"Unknown pacing '{name}' (choose from {', '.join(PACERS)})")
+    return PACERS[name](fps)
+
+def compare(strategies, seconds, seed=0, idle_seconds=3.0):
+    """Play the same bot session under each strategy and return {name: frame stats}
+
+    Each strategy also sits on a still screen for idle_seconds, where the game
+    skips drawing (and flipping); idle_cpu_percent shows whether it still waits.
+    All runs share one pygame init (only the display is restarted between
+    them); pygame only quits once they are done.
+    """
+    import main
+    from bot import BotPlayer
+    results = {}
+    try:
+        for name in strategies:
+            # A fresh window for each run (vsync needs its own renderer); fonts stay loaded
+            pygame.display.quit()
+            game = main.Game(seed=seed, autoplayer=BotPlayer(seed=seed), pacing=name, prefetch=False)
+            game.step()
+            game.frame_stats.reset()
+            end = time.perf_counter() + seconds
+            while game.running and time.perf_counter() < end:
+                game.step()
+            results[name] = game.frame_stats.summary()
+            results[name]["idle_cpu_percent"] = idle_cpu(game, idle_seconds)
+    finally:
+        pygame.quit()
+    return results
+
+def idle_cpu(game, seconds):
+    """Share of one core game uses over seconds once its input stops and it stops redrawing"""
+    import main
+    game.autoplayer = None  # Nothing moves from here on, as if the child looked away
+    game.skip_idle_draws = True
+    for _ in range(10 * main.FPS):  # Let running animations finish first
+        game.step()
+        if game.quiet_frames > main.IDLE_REDRAW_FRAMES:
+            break
+    wall, cpu = time.perf_counter(), time.process_time()
+    end = wall + seconds
+    while game.running and time.perf_counter() < end:
+        game.step()
+    return 100.0 * (time.process_time() - cpu) / (time.perf_counter() - wall)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare frame pacing strategies on this machine")
+    parser.add_argument("--seconds", type=float, default=10.0, help="how long to run each strategy")
+    parser.add_argument("--idle-seconds", type=float, default=3.0,
+                        help="how long to measure each strategy on a still (not redrawn) screen")
+    parser.add_argument("--strategies", default="tick,busy,hybrid,vsync",
+                        help="comma-separated strategies to compare")
+    parser.add_argument("--json", metavar="PATH", help="also write the results to PATH")
+    args = parser.parse_args()
+
+    results = compare(args.strategies.split(","), args.seconds, idle_seconds=args.idle_seconds)
+    print(f"{'pacing':<8} {'frames':>7} {'mean ms':>8} {'stdev':>7} {'jitter':>7} {'p99':>7} {'missed':>7} "
+          f"{'idle cpu':>9}")
+    for name, stats in results.items():
+        print(f"{name:<8} {stats['frames']:>7} {stats['mean_ms']:>8.2f} {stats['stdev_ms']:>7.2f} "
+              f"{stats['jitter_ms']:>7.2f} {stats['p99_ms']:>7.2f} {stats['missed_frames']:>7} "
+              f"{stats['idle_cpu_percent']:>8.0f}%")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
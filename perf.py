@@ -0,0 +1,124 @@
+"""
+Performance helpers for the Transportation Game
+Startup tracing, frame time stats and process memory sampling
+"""
+import importlib
+import os
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+
+class StartupTrace:
+    """Records how long each import and screen construction takes"""
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.entries = []  # (kind, name, milliseconds)
+        self.start_time = time.perf_counter()
+
+    @contextmanager
+    def measure(self, kind, name):
+        """Time the body of a with-block and record it"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.entries.append((kind, name, elapsed_ms))
+            if self.enabled:
+                print(f"[startup] {kind:<9} {name:<16} {elapsed_ms:8.2f} ms")
+
+    def import_module(self, module_name):
+        """Import a module, recording the time only on the first (real) import"""
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+        with self.measure("import", module_name):
+            return importlib.import_module(module_name)
+
+    def total_ms(self, kind=None):
+        """Sum of recorded times, optionally for a single kind"""
+        return sum(ms for k, _, ms in self.entries if kind is None or k == kind)
+
+    def report(self):
+        """Return a printable summary of all recorded entries"""
+        lines = ["Startup trace:"]
+        for kind, name, ms in self.entries:
+            lines.append(f"  {kind:<9} {name:<16} {ms:8.2f} ms")
+        lines.append(f"  {'imports':<26} {self.total_ms('import'):8.2f} ms")
+        lines.append(f"  {'screens':<26} {self.total_ms('construct'):8.2f} ms")
+        elapsed = (time.perf_counter() - self.start_time) * 1000
+        lines.append(f"  {'since launch':<26} {elapsed:8.2f} ms")
+        return "\n".join(lines)
+
+class FrameStats:
+    """Collects per-frame durations and summarizes them"""
+    def __init__(self, max_samples=100000, target_ms=None):
+        # Bounded so an all-day session doesn't grow without limit (~27 min at 60 FPS)
+        self.frame_times = deque(maxlen=max_samples)  # milliseconds
+        self.last_time = None
+        self.target_ms = target_ms  # Intended frame interval, for counting missed frames
+
+    def tick(self):
+        """Call once per frame; records the time since the previous call"""
+        now = time.perf_counter()
+        if self.last_time is not None:
+            self.frame_times.append((now - self.last_time) * 1000)
+        self.last_time = now
+
+    def reset(self):
+        """Drop collected samples (e.g. at the start of a new sampling window)"""
+        self.frame_times.clear()
+
+    def percentile(self, pct):
+        if not self.frame_times:
+            return 0.0
+        ordered = sorted(self.frame_times)
+        index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+        return ordered[index]
+
+    def summary(self):
+        """Return a dict of frame time statistics in milliseconds
+
+        stdev_ms is the spread around the mean; jitter_ms is the mean change
+        from one frame interval to the next (what the eye sees as stutter);
+        missed_frames counts intervals over 1.5x target_ms.
+        """
+        count = len(self.frame_times)
+        mean = sum(self.frame_times) / count if count else 0.0
+        times = list(self.frame_times)
+        deltas = [abs(b - a) for a, b in zip(times, times[1:])]
+        missed = 0
+        if self.target_ms:
+            missed = sum(1 for t in times if t > self.target_ms * 1.5)
+        return {
+            "frames": count,
+            "mean_ms": mean,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": max(self.frame_times) if count else 0.0,
+            "stdev_ms": (sum((t - mean) ** 2 for t in times) / count) ** 0.5 if count else 0.0,
+            "jitter_ms": sum(deltas) / len(deltas) if deltas else 0.0,
+            "missed_frames": missed,
+        }
+
+def current_rss_bytes():
+    """Resident set size of this process, or 0 if it can't be determined"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        # Linux: second field of statm is resident pages
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        # Peak rather than current RSS, but better than nothing (KB on Linux)
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except ImportError:
+        return 0
@@ -0,0 +1,114 @@
+"""
+File persistence helpers for the Transportation Game
+Atomic file replacement and a background writer so disk I/O never blocks a frame
+"""
+import os
+import sys
+import tempfile
+import threading
+
+def user_data_path(*parts):
+    """Path inside the game's writable data folder (created if needed)
+
+    The PyInstaller bundle is unpacked to a temp folder, so saved data lives
+    in the user's home folder instead (override with TRANSPORT_GAME_DATA).
+    """
+    base = os.environ.get("TRANSPORT_GAME_DATA")
+    if not base:
+        if sys.platform == "win32" and os.environ.get("APPDATA"):
+            base = os.path.join(os.environ["APPDATA"], "TransportationGame")
+        else:
+            base = os.path.join(os.path.expanduser("~"), ".transportation_game")
+    path = os.path.join(base, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+def fsync_directory(directory):
+    """Flush a directory's entries to disk, so a rename in it survives a crash (POSIX only)"""
+    if sys.platform == "win32":
+        return  # os.open() can't open a directory there
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Some filesystems don't support fsync on directories
+    finally:
+        os.close(fd)
+
+def atomic_write(path, data):
+    """Write bytes to path so readers only ever see the old or the new file
+
+    Both the file's contents and its directory entry are flushed before this
+    returns, so a power cut can't leave the old file (or an empty one) behind.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    fsync_directory(directory)
+
+class BackgroundWriter:
+    """Writes files on a daemon thread
+
+    submit() is cheap: it just records a function that produces the bytes.
+    If the same path is submitted again before the thread gets to it, only
+    the newest data is written (write-behind with coalescing).
+    """
+    def __init__(self, name="writer"):
+        self.condition = threading.Condition()
+        self.pending = {}  # path -> produce() -> bytes
+        self.busy = False
+        self.closed = False
+        self.errors = 0
+        self.thread = threading.Thread(target=self.run, name=name, daemon=True)
+        self.thread.start()
+
+    def submit(self, path, produce):
+        with self.condition:
+            self.pending[path] = produce
+            self.condition.notify_all()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending and self.closed:
+                    return
+                batch = self.pending
+                self.pending = {}
+                self.busy = True
+            for path, produce in batch.items():
+                try:
+                    atomic_write(path, produce())
+                except Exception as e:
+                    self.errors += 1
+                    print(f"Could not write {path}: {e}")
+            with self.condition:
+                self.busy = False
+                self.condition.notify_all()
+
+    def flush(self, timeout=None):
+        """Block until everything submitted so far has been written"""
+        with self.condition:
+            self.condition.wait_for(lambda: not self.pending and not self.busy, timeout)
+
+    def close(self, timeout=5.0):
+        """Write anything pending and stop the thread"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join(timeout)
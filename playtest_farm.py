@@ -0,0 +1,160 @@
+"""
+Playtest farm for the Transportation Game
+Runs many headless bot sessions in parallel (one per process) over randomized
+layouts and aggregates completion times, frame stats and crashes.
+
+Usage: python playtest_farm.py --sessions 200 --mistake-rate 0.2
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+LEVEL_STATES = ("level1", "level2", "level3")
+
+def play_session(seed, mistake_rate=0.0, max_frames=20000, null_render=False, precise_drops=False):
+    """Play Dashboard -> Level1 -> Level2 -> Level3 -> Dashboard once with the bot"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    import main
+    from bot import BotPlayer
+
+    result = {"seed": seed, "levels": {}, "crash": None, "timeout": False}
+    try:
+        bot = BotPlayer(mistake_rate=mistake_rate, seed=seed)
+        game = main.Game(seed=seed, fast=True, autoplayer=bot, null_render=null_render,
+                         precise_drops=precise_drops)
+        tracked_level = None
+        level_start = None  # (state, frame, time) when tracked_level started
+        while game.running and game.frame < max_frames:
+            game.step()
+            level = game.current_level
+            if level is not tracked_level:
+                tracked_level = level
+                level_start = (game.state, game.frame, time.perf_counter())
+            if level and level.completed and game.state not in result["levels"]:
+                state, start_frame, start_time = level_start
+                result["levels"][state] = {
+                    "frames": game.frame - start_frame,
+                    "seconds": time.perf_counter() - start_time,
+                }
+            if game.level_status.get(3) and game.state == main.STATE_DASHBOARD:
+                break
+        else:
+            result["timeout"] = game.running
+        result["frame_stats"] = game.frame_stats.summary()
+        result["wrong_drops"] = bot.wrong_drops
+        result["drags"] = bot.drags
+    except Exception:
+        result["crash"] = traceback.format_exc()
+    finally:
+        main.pygame.quit()
+    return result
+
+def restart_check(sessions=2, base_seed=0, max_frames=20000):
+    """Play sessions back to back in this process, drawing new text after every restart
+
+    pygame.quit() frees fonts (and other SDL objects) a module cache may still
+    hold; using one after pygame starts again segfaults, so a crash here means
+    something outlives a restart. Returns the session results.
+    """
+    import pygame
+    from utils import text_surface
+    results = []
+    for i in range(sessions):
+        result = play_session(base_seed + i, max_frames=max_frames)
+        results.append(result)
+        # The session quit pygame; text no earlier run drew needs a live font
+        pygame.init()
+        text_surface(f"Restart check {i}", 24)
+        pygame.quit()
+        status = "CRASH" if result["crash"] else "timeout" if result["timeout"] else "ok"
+        print(f"[restart] {i + 1}/{sessions} seed={result['seed']} {status}")
+    return results
+
+def aggregate(results):
+    """Summarize a list of session results"""
+    def describe(values):
+        if not values:
+            return None
+        ordered = sorted(values)
+        return {
+            "mean": statistics.mean(ordered),
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "max": ordered[-1],
+        }
+
+    summary = {
+        "sessions": len(results),
+        "completed": sum(1 for r in results if len(r["levels"]) == len(LEVEL_STATES)),
+        "crashes": sum(1 for r in results if r["crash"]),
+        "timeouts": sum(1 for r in results if r["timeout"]),
+        "levels": {},
+    }
+    for state in LEVEL_STATES:
+        played = [r["levels"][state] for r in results if state in r["levels"]]
+        summary["levels"][state] = {
+            "frames": describe([p["frames"] for p in played]),
+            "seconds": describe([p["seconds"] for p in played]),
+        }
+    stats = [r["frame_stats"] for r in results if r.get("frame_stats")]
+    summary["frame_mean_ms"] = describe([s["mean_ms"] for s in stats])
+    summary["frame_p95_ms"] = describe([s["p95_ms"] for s in stats])
+    summary["wrong_drops"] = sum(r.get("wrong_drops", 0) for r in results)
+    crashes = [r for r in results if r["crash"]]
+    if crashes:
+        summary["first_crash"] = {"seed": crashes[0]["seed"], "traceback": crashes[0]["crash"]}
+    return summary
+
+def run_farm(sessions, workers=None, mistake_rate=0.0, base_seed=0, max_frames=20000,
+             null_render=False, precise_drops=False):
+    """Run sessions across a process pool and return (results, summary)"""
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(play_session, base_seed + i, mistake_rate, max_frames, null_render,
+                               precise_drops)
+                   for i in range(sessions)]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results.append(result)
+            status = "CRASH" if result["crash"] else "timeout" if result["timeout"] else "ok"
+            print(f"[farm] {done}/{sessions} seed={result['seed']} {status}")
+    return results, aggregate(results)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many headless bot playtests in parallel")
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--workers", type=int, help="processes to use (default: all cores)")
+    parser.add_argument("--mistake-rate", type=float, default=0.2,
+                        help="probability that a drag is a deliberate wrong drop")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first session")
+    parser.add_argument("--max-frames", type=int, default=20000,
+                        help="frames before a session counts as a timeout")
+    parser.add_argument("--null-render", action="store_true",
+                        help="skip drawing to measure game logic only")
+    parser.add_argument("--precise-drops", action="store_true",
+                        help="play with mask-overlap drop tests")
+    parser.add_argument("--restart-check", action="store_true",
+                        help="instead, play the sessions in this one process to catch state that outlives pygame.quit()")
+    parser.add_argument("--json", metavar="PATH", help="write results and summary to PATH")
+    args = parser.parse_args()
+
+    if args.restart_check:
+        results = restart_check(args.sessions, args.seed, args.max_frames)
+        print(json.dumps(aggregate(results), indent=2))
+        return
+
+    start = time.perf_counter()
+    results, summary = run_farm(args.sessions, args.workers, args.mistake_rate,
+                                args.seed, args.max_frames, args.null_render, args.precise_drops)
+    summary["wall_seconds"] = time.perf_counter() - start
+    print(json.dumps(summary, indent=2))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"summary": summary, "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
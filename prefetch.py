@@ -0,0 +1,45 @@
+"""
+Idle-time level prefetching for the Transportation Game
+Builds the next level (image loads, scaling, shadows, sounds) on the main thread
+during frames where nothing needs drawing, so transitions don't hitch. Pygame's
+font/mixer calls and the shared image caches aren't thread-safe, so screens are
+never built on another thread.
+"""
+
+class LevelPrefetcher:
+    """Queues screens to build and constructs them one per idle frame"""
+    def __init__(self, build):
+        self.build = build  # build(state, rng) -> screen
+        self.pending = {}  # state -> rng, reserved when the prefetch was asked for
+        self.ready = {}  # state -> built screen
+
+    def prefetch(self, state, rng):
+        """Queue a screen for state unless one is already queued or built"""
+        if state not in self.pending and state not in self.ready:
+            self.pending[state] = rng
+
+    def idle(self):
+        """Build one queued screen; call on a frame with time to spare. True if it built one"""
+        if not self.pending:
+            return False
+        state, rng = next(iter(self.pending.items()))
+        del self.pending[state]
+        try:
+            self.ready[state] = self.build(state, rng)
+        except Exception as e:
+            print(f"Prefetch of {state} failed, building it when needed: {e}")
+            return False
+        return True
+
+    def take(self, state):
+        """Return the screen for state, building a queued one now; None if it was never queued"""
+        if state in self.ready:
+            return self.ready.pop(state)
+        rng = self.pending.pop(state, None)
+        if rng is None:
+            return None
+        return self.build(state, rng)
+
+    def shutdown(self):
+        self.pending.clear()
+        self.ready.clear()
@@ -0,0 +1,94 @@
+"""
+Profile Picker for classroom mode
+Shown before the Dashboard so each child picks their own tile
+"""
+import pygame
+from utils import create_vehicle_image, font_for, get_font, render_text, load_shared_image, track_surface
+
+# Columns/rows of tiles; 6 x 5 fits a class of 30
+TILE_COLUMNS = 6
+TILE_ROWS = 5
+TILE_WIDTH = 160
+TILE_HEIGHT = 115
+TILE_GAP = 15
+AVATAR_SIZE = 70
+# Avatars are tinted per tile so children with the same vehicle can tell theirs apart
+AVATAR_TINTS = ((255, 120, 120), (120, 170, 255), (255, 210, 100), (120, 230, 150), (230, 140, 255), (255, 170, 90))
+
+# Decoded avatar thumbnails, shared by every tile and kept across visits
+_avatar_cache = {}
+
+def get_avatar(avatar, tint=(200, 200, 200)):
+    """Avatar thumbnail surface, decoded, scaled and tinted once per (avatar, tint)"""
+    key = (avatar, tint)
+    if key not in _avatar_cache:
+        _avatar_cache[key] = create_vehicle_image(avatar, tint, (AVATAR_SIZE, AVATAR_SIZE), tint=True)
+    return _avatar_cache[key]
+
+class ProfileScreen:
+    def __init__(self, screen, profiles):
+        self.screen = screen
+        self.width, self.height = screen.get_size()
+        self.profiles = profiles  # profiles.ProfileIndex
+
+        # Same background as the Dashboard (shared surface)
+        try:
+            self.background = load_shared_image('assets/images/start_background.png', (self.width, self.height))
+        except:
+            self.background = pygame.Surface((self.width, self.height))
+            self.background.fill((100, 200, 255))
+            track_surface(self.background, "profile background")
+
+        self.title = render_text("Who is playing?", get_font(56), (255, 255, 255))
+        self.build_tiles()
+
+    def build_tiles(self):
+        """Pre-render every tile (avatar + name) so drawing is just blits"""
+        grid_width = TILE_COLUMNS * TILE_WIDTH + (TILE_COLUMNS - 1) * TILE_GAP
+        start_x = (self.width - grid_width) // 2
+        start_y = 140
+
+        self.tiles = []  # (rect, surface, profile id or None for "add")
+        entries = list(self.profiles.profiles)
+        if len(entries) < TILE_COLUMNS * TILE_ROWS:
+            entries.append(None)
+        for i, profile in enumerate(entries[:TILE_COLUMNS * TILE_ROWS]):
+            col = i % TILE_COLUMNS
+            row = i // TILE_COLUMNS
+            rect = pygame.Rect(start_x + col * (TILE_WIDTH + TILE_GAP),
+                               start_y + row * (TILE_HEIGHT + TILE_GAP), TILE_WIDTH, TILE_HEIGHT)
+            self.tiles.append((rect, self.render_tile(profile, AVATAR_TINTS[i % len(AVATAR_TINTS)]),
+                               profile["id"] if profile else None))
+
+    def render_tile(self, profile, tint=(200, 200, 200)):
+        tile = pygame.Surface((TILE_WIDTH, TILE_HEIGHT), pygame.SRCALPHA)
+        pygame.draw.rect(tile, (255, 255, 255), tile.get_rect(), border_radius=12)
+        pygame.draw.rect(tile, (100, 100, 100), tile.get_rect(), 3, border_radius=12)
+        if profile:
+            avatar = get_avatar(profile["avatar"], tint)
+            tile.blit(avatar, avatar.get_rect(center=(TILE_WIDTH // 2, 45)))
+            name = render_text(profile["name"], font_for(profile["name"], 22), (50, 50, 50))
+            tile.blit(name, name.get_rect(center=(TILE_WIDTH // 2, TILE_HEIGHT - 20)))
+        else:
+            plus = render_text("+", get_font(64), (50, 200, 50))
+            tile.blit(plus, plus.get_rect(center=(TILE_WIDTH // 2, TILE_HEIGHT // 2)))
+        return track_surface(tile, f"profile tile:{profile['id'] if profile else 'add'}")
+
+    def handle_event(self, event):
+        """Return ("profile", id) when a child's tile is clicked"""
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            for rect, _, profile_id in self.tiles:
+                if rect.collidepoint(event.pos):
+                    if profile_id is None:
+                        self.profiles.add_profile()
+                        self.build_tiles()
+                        return None
+                    return ("profile", profile_id)
+        return None
+
+    def draw(self):
+        """Draw the profile picker"""
+        self.screen.blit(self.background, (0, 0))
+        self.screen.blit(self.title, self.title.get_rect(center=(self.width // 2, 70)))
+        for rect, tile, _ in self.tiles:
+            self.screen.blit(tile, rect)
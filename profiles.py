@@ -0,0 +1,76 @@
+"""
+Player profiles for classroom mode
+A small index file lists the children (id, name, avatar); each child's progress
+lives in its own file, so switching profiles only reads that child's record.
+"""
+import json
+import os
+from persistence import BackgroundWriter, user_data_path
+from progress_store import ProgressStore
+
+PROFILES_VERSION = 1
+INDEX_NAME = "index.json"
+AVATARS = ("car", "bike", "plane", "boat", "bus", "helicopter", "train", "ship")
+
+class ProfileIndex:
+    """The class list plus per-child progress files"""
+    def __init__(self, directory=None, writer=None):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self.directory = directory
+        else:
+            self.directory = os.path.dirname(user_data_path("profiles", INDEX_NAME))
+        self.index_path = os.path.join(self.directory, INDEX_NAME)
+        # One writer thread shared by the index and every child's progress store
+        self.writer = writer if writer else BackgroundWriter(name="profile-writer")
+        self.profiles = []  # [{"id": ..., "name": ..., "avatar": ...}]
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                data = json.loads(f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable profile index {self.index_path}: {e}")
+            return
+        if data.get("version") != PROFILES_VERSION:
+            print(f"Ignoring profile index with version {data.get('version')}")
+            return
+        self.profiles = data.get("profiles", [])
+
+    def save(self):
+        data = {"version": PROFILES_VERSION, "profiles": [dict(p) for p in self.profiles]}
+        self.writer.submit(self.index_path, lambda: json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    def get(self, profile_id):
+        for profile in self.profiles:
+            if profile["id"] == profile_id:
+                return profile
+        return None
+
+    def add_profile(self, name=None, avatar=None):
+        """Add a child to the class list and return their profile"""
+        number = len(self.profiles) + 1
+        existing = {p["id"] for p in self.profiles}
+        while f"p{number:03d}" in existing:
+            number += 1
+        profile = {
+            "id": f"p{number:03d}",
+            "name": name if name else f"Player {number}",
+            "avatar": avatar if avatar else AVATARS[(number - 1) % len(AVATARS)],
+        }
+        self.profiles.append(profile)
+        self.save()
+        return profile
+
+    def progress_path(self, profile_id):
+        return os.path.join(self.directory, f"{profile_id}.json")
+
+    def open_progress(self, profile_id):
+        """Load just this child's progress"""
+        return ProgressStore(self.progress_path(profile_id), writer=self.writer)
+
+    def close(self):
+        self.writer.close()
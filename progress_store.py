@@ -0,0 +1,80 @@
+"""
+Persistent progress store for the Transportation Game
+Keeps level attempts and completions in a small JSON file that loads in a few
+milliseconds and is flushed write-behind (background thread, atomic rename).
+"""
+import json
+import os
+import time
+from history import HistoryStore
+from persistence import BackgroundWriter, user_data_path
+
+PROGRESS_VERSION = 1
+DEFAULT_PROGRESS_NAME = "progress.json"
+LEVELS = (1, 2, 3)
+
+def empty_level_record():
+    return {"attempts": 0, "completions": 0, "best_seconds": None,
+            "total_seconds": 0.0, "last_completed": None}
+
+class ProgressStore:
+    """Level attempts/completions that survive restarts"""
+    def __init__(self, path=None, writer=None):
+        self.path = path if path else user_data_path(DEFAULT_PROGRESS_NAME)
+        self.writer = writer if writer else BackgroundWriter(name="progress-writer")
+        self.levels = {level: empty_level_record() for level in LEVELS}
+        self.load()
+        # Daily/weekly rollups for the Dashboard's history view, next to the progress file
+        name = os.path.splitext(os.path.basename(self.path))[0]
+        self.history = HistoryStore(os.path.join(os.path.dirname(self.path), "history", name), self.writer)
+
+    def load(self):
+        """Read the progress file; a missing or unreadable file means no progress"""
+        try:
+            with open(self.path, "rb") as f:
+                data = json.loads(f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable progress file {self.path}: {e}")
+            return
+        if data.get("version") != PROGRESS_VERSION:
+            print(f"Ignoring progress file with version {data.get('version')}")
+            return
+        for level, record in data.get("levels", {}).items():
+            merged = empty_level_record()
+            merged.update(record)
+            self.levels[int(level)] = merged
+
+    def level_status(self):
+        """{level: completed?} in the shape the Dashboard expects"""
+        return {level: record["completions"] > 0 for level, record in self.levels.items()}
+
+    def record_attempt(self, level):
+        self.levels[level]["attempts"] += 1
+        self.history.record_attempt(level)
+        self.save()
+
+    def record_completion(self, level, seconds):
+        record = self.levels[level]
+        record["completions"] += 1
+        record["total_seconds"] += seconds
+        if record["best_seconds"] is None or seconds < record["best_seconds"]:
+            record["best_seconds"] = seconds
+        record["last_completed"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self.history.record_completion(level, seconds)
+        self.save()
+
+    def save(self):
+        """Queue a write; the frame never waits for the disk"""
+        data = {"version": PROGRESS_VERSION,
+                "levels": {str(level): dict(record) for level, record in self.levels.items()}}
+        self.writer.submit(self.path, lambda: json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    def end_session(self):
+        """Fold anything still pending into the history rollups"""
+        self.history.fold()
+
+    def close(self):
+        self.end_session()
+        self.writer.close()
@@ -0,0 +1,111 @@
+"""
+Rendering helpers for the Transportation Game levels
+Levels only hold game state (drag, match, completion); a renderer turns that
+state into pixels. Each level module has its own renderer, e.g. Level1Renderer.
+"""
+import pygame
+from utils import track_surface
+
+class NullRenderer:
+    """Renderer that draws nothing, so level logic can run without display cost"""
+    def draw(self, level):
+        pass
+
+def make_overlay(size, alpha=150):
+    """Semi-transparent black overlay used behind completion messages"""
+    overlay = pygame.Surface(size, pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, alpha))
+    return track_surface(overlay, "overlay")
+
+def make_solid_background(size, color, name):
+    """Solid pastel background surface"""
+    background = pygame.Surface(size)
+    background.fill(color)
+    return track_surface(background, name)
+
+# Draw-list layers, bottom to top
+LAYER_BACKGROUND = 0
+LAYER_OUTLINES = 10  # Highlight and zone rects drawn under the targets
+LAYER_TARGETS = 20   # Shadows, zones, puzzle slots
+LAYER_PIECES = 30    # Draggables at rest or animating
+LAYER_EFFECTS = 40   # Sparkles, confetti
+LAYER_DRAGGED = 50   # The piece under the mouse, always above everything in play
+LAYER_OVERLAY = 60   # Completion overlay
+LAYER_UI = 70        # Completion text and buttons
+
+class DrawList:
+    """Sprites submitted with a layer, drawn back to front in as few calls as possible
+
+    Items off screen, or completely under a later opaque item, are culled.
+    Within a layer items keep their submission order, and each run of plain
+    sprites goes to the screen in one Surface.blits call; a callable item
+    (particles, pygame.draw shapes) or a faded sprite ends the run.
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.bounds = screen.get_rect()
+        self.items = []  # (layer, order, rect, surface or None, callable or alpha, opaque)
+        self.stats = {"submitted": 0, "culled": 0, "blits_calls": 0}
+
+    def clear(self):
+        self.items = []
+
+    def add(self, surface, pos, layer=LAYER_PIECES, alpha=None, opaque=False):
+        """Queue surface with its top-left at pos (or centered in a Rect's place if pos is a Rect)"""
+        rect = surface.get_rect(topleft=pos) if not isinstance(pos, pygame.Rect) else surface.get_rect(center=pos.center)
+        self.items.append((layer, len(self.items), rect, surface, alpha, opaque))
+
+    def add_text(self, text, font_size, x, y, color, layer=LAYER_UI):
+        """Queue a centered text label (rendered through the shared text cache)"""
+        from utils import text_surface
+        surface = text_surface(text, font_size, color)
+        self.items.append((layer, len(self.items), surface.get_rect(center=(x, y)), surface, None, False))
+
+    def add_call(self, draw, layer, rect=None):
+        """Queue draw(screen) for anything that isn't a plain blit; rect (if known) is used for culling"""
+        self.items.append((layer, len(self.items), rect, None, draw, False))
+
+    def visible(self, ordered):
+        """Items that are on screen and not hidden under a later opaque item"""
+        covers = []  # Opaque rects, topmost first
+        keep = []
+        for item in reversed(ordered):
+            rect = item[2]
+            if rect is not None:
+                if not rect.colliderect(self.bounds) or any(cover.contains(rect) for cover in covers):
+                    continue
+                if item[5]:
+                    covers.append(rect)
+            keep.append(item)
+        keep.reverse()
+        return keep
+
+    def draw(self):
+        """Draw everything queued since clear(), back to front"""
+        ordered = sorted(self.items)  # (layer, order) is unique, so surfaces are never compared
+        items = self.visible(ordered)
+        self.stats["submitted"] = len(ordered)
+        self.stats["culled"] = len(ordered) - len(items)
+        self.stats["blits_calls"] = 0
+        batch = []
+        layer = None
+        for item in items:
+            if item[0] != layer or item[3] is None or item[4] is not None:
+                self.flush(batch)
+                layer = item[0]
+            if item[3] is None:
+                item[4](self.screen)
+            elif item[4] is not None:
+                # Faded sprite: alpha is set only for this blit
+                item[3].set_alpha(int(item[4]))
+                self.screen.blit(item[3], item[2])
+                item[3].set_alpha(None)
+            else:
+                batch.append((item[3], item[2]))
+        self.flush(batch)
+
+    def flush(self, batch):
+        if batch:
+            self.screen.blits(batch, doreturn=False)
+            self.stats["blits_calls"] += 1
+            batch.clear()
@@ -0,0 +1,93 @@
+"""
+Input recording and replay for the Transportation Game
+Captures the event stream and RNG seed so a session can be re-run exactly
+"""
+import gzip
+import json
+import pygame
+
+REPLAY_VERSION = 1
+
+# Events worth recording, and the attributes the screens actually read
+RECORDED_EVENTS = {
+    pygame.QUIT: (),
+    pygame.KEYDOWN: ("key",),
+    pygame.MOUSEMOTION: ("pos",),
+    pygame.MOUSEBUTTONDOWN: ("pos", "button"),
+    pygame.MOUSEBUTTONUP: ("pos", "button"),
+}
+
+# Event type ids are not guaranteed stable across SDL builds, so store names
+EVENT_NAMES = {event_type: pygame.event.event_name(event_type) for event_type in RECORDED_EVENTS}
+EVENT_TYPES = {name: event_type for event_type, name in EVENT_NAMES.items()}
+
+def encode_event(frame, ticks, event):
+    """Pack an event into a flat list: [frame, ticks, name, *values]"""
+    record = [frame, ticks, EVENT_NAMES[event.type]]
+    for attr in RECORDED_EVENTS[event.type]:
+        value = getattr(event, attr)
+        if attr == "pos":
+            record.extend(value)
+        else:
+            record.append(value)
+    return record
+
+def decode_event(record):
+    """Rebuild (frame, ticks, pygame Event) from a packed record"""
+    frame, ticks, name = record[0], record[1], record[2]
+    event_type = EVENT_TYPES[name]
+    values = record[3:]
+    attrs = {}
+    for attr in RECORDED_EVENTS[event_type]:
+        if attr == "pos":
+            attrs["pos"] = (values[0], values[1])
+            values = values[2:]
+        else:
+            attrs[attr] = values[0]
+            values = values[1:]
+    return frame, ticks, pygame.event.Event(event_type, attrs)
+
+class InputRecorder:
+    """Records input events per frame and writes them to a gzip'd JSON file"""
+    def __init__(self, path, seed):
+        self.path = path
+        self.seed = seed
+        self.records = []
+        self.start_ticks = None
+
+    def record(self, frame, events):
+        now = pygame.time.get_ticks()
+        if self.start_ticks is None:
+            self.start_ticks = now
+        ticks = now - self.start_ticks
+        for event in events:
+            if event.type in RECORDED_EVENTS:
+                self.records.append(encode_event(frame, ticks, event))
+
+    def save(self):
+        data = {"version": REPLAY_VERSION, "seed": self.seed, "events": self.records}
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        print(f"Recorded {len(self.records)} events to {self.path}")
+
+class InputReplayer:
+    """Feeds recorded events back to the game, frame by frame"""
+    def __init__(self, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        self.seed = data["seed"]
+        self.frames = {}
+        self.last_frame = -1
+        for record in data["events"]:
+            frame, _, event = decode_event(record)
+            self.frames.setdefault(frame, []).append(event)
+            self.last_frame = max(self.last_frame, frame)
+
+    def events_for(self, frame):
+        """Return the events recorded for a frame"""
+        return self.frames.get(frame, [])
+
+    def finished(self, frame):
+        return frame > self.last_frame
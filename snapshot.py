@@ -0,0 +1,59 @@
+"""
+Session snapshots for the Transportation Game
+Saves game and in-level progress (not surfaces) at checkpoints on a background
+thread, and restores it at startup so power-cycled kiosks resume where they were.
+"""
+import json
+from persistence import BackgroundWriter, user_data_path
+
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_NAME = "session_snapshot.json"
+
+def make_snapshot(game):
+    """Capture the game's progress as plain data (cheap; runs on the main thread)"""
+    level = game.current_level
+    return {
+        "version": SNAPSHOT_VERSION,
+        "seed": game.seed,
+        "state": game.state,
+        "profile": game.profile_id,
+        "level_status": dict(game.level_status),
+        "level_builds": dict(game.level_builds),
+        "level": level.get_state() if level else None,
+    }
+
+def load_snapshot(path):
+    """Read a snapshot, or return None if it's missing, corrupt or a different version"""
+    try:
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable snapshot {path}: {e}")
+        return None
+    if data.get("version") != SNAPSHOT_VERSION:
+        print(f"Ignoring snapshot with version {data.get('version')}")
+        return None
+    return data
+
+class SnapshotWriter:
+    """Writes snapshots on a background thread; newer checkpoints replace older ones"""
+    def __init__(self, path=None):
+        self.path = path if path else user_data_path(DEFAULT_SNAPSHOT_NAME)
+        self.writer = BackgroundWriter(name="snapshot-writer")
+        self.last_written = None
+
+    def checkpoint(self, game):
+        snapshot = make_snapshot(game)
+        if snapshot == self.last_written:
+            return
+        self.last_written = snapshot
+        # Serialize on the writer thread; snapshot is a fresh dict the game won't touch
+        self.writer.submit(self.path, lambda: json.dumps(snapshot, separators=(",", ":")).encode("utf-8"))
+
+    def load(self):
+        return load_snapshot(self.path)
+
+    def close(self):
+        self.writer.close()
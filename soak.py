@@ -0,0 +1,128 @@
+"""
+Soak test for the Transportation Game
+Plays Dashboard -> Level1 -> Level2 -> Level3 -> Dashboard with the bot for hours
+under the dummy video driver, sampling memory and frame time to a CSV, and fails
+if they drift upward beyond the given thresholds.
+
+Usage: python soak.py --hours 8 --csv soak.csv
+"""
+import argparse
+import csv
+import gc
+import os
+import statistics
+import sys
+import time
+
+CSV_FIELDS = ["elapsed_s", "frames", "cycles", "state", "rss_mb", "surfaces",
+              "surface_mb", "py_objects", "frame_mean_ms", "frame_p95_ms", "frame_max_ms"]
+
+def take_sample(game, start_time, cycles):
+    """Collect one row of measurements"""
+    import memory_report
+    from perf import current_rss_bytes
+    gc.collect()
+    stats = game.frame_stats.summary()
+    return {
+        "elapsed_s": round(time.perf_counter() - start_time, 1),
+        "frames": game.frame,
+        "cycles": cycles,
+        "state": game.state,
+        "rss_mb": round(current_rss_bytes() / (1024 * 1024), 2),
+        "surfaces": memory_report.tracker.surface_count(),
+        "surface_mb": round(memory_report.tracker.surface_bytes() / (1024 * 1024), 2),
+        "py_objects": len(gc.get_objects()),
+        "frame_mean_ms": round(stats["mean_ms"], 3),
+        "frame_p95_ms": round(stats["p95_ms"], 3),
+        "frame_max_ms": round(stats["max_ms"], 3),
+    }
+
+def check_drift(samples, warmup, max_rss_growth_mb, max_frame_growth_pct, window=3):
+    """Compare the start and end of the run; return a list of failure messages"""
+    samples = samples[warmup:]
+    if len(samples) < 2 * window:
+        return []
+    def median(field, rows):
+        return statistics.median(row[field] for row in rows)
+
+    failures = []
+    rss_growth = median("rss_mb", samples[-window:]) - median("rss_mb", samples[:window])
+    if rss_growth > max_rss_growth_mb:
+        failures.append(f"RSS grew by {rss_growth:.1f} MB (limit {max_rss_growth_mb} MB)")
+
+    frame_start = median("frame_mean_ms", samples[:window])
+    frame_end = median("frame_mean_ms", samples[-window:])
+    if frame_start > 0:
+        frame_growth = (frame_end - frame_start) / frame_start * 100
+        if frame_growth > max_frame_growth_pct:
+            failures.append(f"Mean frame time grew by {frame_growth:.0f}% "
+                            f"({frame_start:.2f} -> {frame_end:.2f} ms, limit {max_frame_growth_pct}%)")
+    return failures
+
+def run_soak(duration_s, sample_s, csv_path, seed=None, fast=False):
+    """Play the game with the bot for duration_s seconds; return the samples"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    import main
+    import memory_report
+    from bot import BotPlayer
+
+    memory_report.enable(trace_heap=False)
+    game = main.Game(seed=seed, fast=fast, autoplayer=BotPlayer())
+    samples = []
+    cycles = 0
+    previous_state = game.state
+    start_time = time.perf_counter()
+    next_sample = start_time + sample_s
+
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        while game.running and time.perf_counter() - start_time < duration_s:
+            game.step()
+            if previous_state == main.STATE_LEVEL3 and game.state == main.STATE_DASHBOARD:
+                cycles += 1
+            previous_state = game.state
+
+            if time.perf_counter() >= next_sample:
+                sample = take_sample(game, start_time, cycles)
+                samples.append(sample)
+                writer.writerow(sample)
+                f.flush()
+                print(f"[soak] {sample['elapsed_s']:>8}s cycles={cycles} "
+                      f"rss={sample['rss_mb']}MB surfaces={sample['surfaces']} "
+                      f"objects={sample['py_objects']} frame={sample['frame_mean_ms']}ms")
+                game.frame_stats.reset()
+                next_sample += sample_s
+
+    main.pygame.quit()
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak test the game with the bot player")
+    parser.add_argument("--hours", type=float, default=1.0, help="how long to run")
+    parser.add_argument("--sample-seconds", type=float, default=30.0,
+                        help="time between samples")
+    parser.add_argument("--csv", default="soak.csv", help="time-series output file")
+    parser.add_argument("--seed", type=int, help="seed for the layout RNG")
+    parser.add_argument("--fast", action="store_true",
+                        help="run frames as fast as possible instead of at 60 FPS")
+    parser.add_argument("--warmup-samples", type=int, default=2,
+                        help="samples ignored before measuring drift")
+    parser.add_argument("--max-rss-growth-mb", type=float, default=50.0)
+    parser.add_argument("--max-frame-growth-pct", type=float, default=25.0)
+    args = parser.parse_args()
+
+    samples = run_soak(args.hours * 3600, args.sample_seconds, args.csv, args.seed, args.fast)
+    print(f"Wrote {len(samples)} samples to {args.csv}")
+
+    failures = check_drift(samples, args.warmup_samples,
+                           args.max_rss_growth_mb, args.max_frame_growth_pct)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("PASS: no memory or frame time drift beyond thresholds")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Gameplay telemetry for the Transportation Game
+Levels call emit() for drag starts, wrong drops, matches and completions. Events
+go into a bounded queue that a background thread writes in batches to rotating
+append-only JSON-lines files. The game thread never takes a lock or touches disk;
+when the buffer is full, events are dropped and counted instead.
+"""
+import glob
+import json
+import os
+import threading
+import time
+from collections import deque
+
+class TelemetryEmitter:
+    """Bounded event queue plus a background batch writer"""
+    def __init__(self, directory, max_buffer=10000, batch_size=500, flush_interval=0.5,
+                 max_file_bytes=1024 * 1024, max_files=50):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.max_buffer = max_buffer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+        self.session = time.strftime("%Y%m%d-%H%M%S")
+        self.file_index = 0
+        self.current_file = None
+        self.current_size = 0
+
+        # deque.append/popleft are atomic under the GIL, so no lock is needed
+        self.queue = deque()
+        self.dropped = 0
+        self.written = 0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="telemetry-writer", daemon=True)
+        self.thread.start()
+
+    def emit(self, event, **fields):
+        """Queue an event; never blocks (drops and counts when the buffer is full)"""
+        if len(self.queue) >= self.max_buffer:
+            self.dropped += 1
+            return
+        fields["event"] = event
+        fields["t"] = round(time.time(), 3)
+        self.queue.append(fields)
+
+    def run(self):
+        while not self.stop_event.wait(self.flush_interval):
+            self.drain()
+        self.drain()
+        if self.current_file:
+            self.current_file.close()
+
+    def drain(self):
+        """Write everything queued so far, batch_size records per write"""
+        while self.queue:
+            batch = []
+            while self.queue and len(batch) < self.batch_size:
+                batch.append(json.dumps(self.queue.popleft(), separators=(",", ":")))
+            try:
+                self.write_batch("\n".join(batch) + "\n")
+                self.written += len(batch)
+            except OSError as e:
+                self.dropped += len(batch)
+                print(f"Telemetry write failed: {e}")
+
+    def write_batch(self, text):
+        data = text.encode("utf-8")
+        if self.current_file is None or self.current_size + len(data) > self.max_file_bytes:
+            self.rotate()
+        self.current_file.write(data)
+        self.current_file.flush()
+        self.current_size += len(data)
+
+    def rotate(self):
+        """Start a new file and delete the oldest ones beyond max_files"""
+        if self.current_file:
+            self.current_file.close()
+        self.file_index += 1
+        path = os.path.join(self.directory, f"events-{self.session}-{self.file_index:04d}.jsonl")
+        self.current_file = open(path, "ab")
+        self.current_size = 0
+        files = sorted(glob.glob(os.path.join(self.directory, "events-*.jsonl")))
+        for old_path in files[:-self.max_files]:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+    def close(self, timeout=5.0):
+        """Write what's left and stop the thread"""
+        self.stop_event.set()
+        self.thread.join(timeout)
+
+# Emitter used by emit(); None means telemetry is off and emit() is a no-op
+_emitter = None
+# Fields added to every event (e.g. the current profile)
+_context = {}
+
+def install(emitter):
+    global _emitter
+    _emitter = emitter
+
+def set_context(**fields):
+    _context.clear()
+    _context.update(fields)
+
+def emit(event, **fields):
+    if _emitter:
+        if _context:
+            fields.update(_context)
+        _emitter.emit(event, **fields)
@@ -0,0 +1,150 @@
+"""
+Tween scheduler for the Transportation Game
+Time-based animations (position offsets, scale, alpha, shakes, sequences and
+callbacks) that are all advanced together once per frame by the main loop.
+"""
+import math
+
+def linear(t):
+    return t
+
+def ease_in_quad(t):
+    return t * t
+
+def ease_out_quad(t):
+    return t * (2 - t)
+
+def ease_in_out_quad(t):
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+def ease_out_back(t):
+    """Overshoots a little and settles, nice for snapping into place"""
+    c = 1.70158
+    return 1 + (c + 1) * (t - 1) ** 3 + c * (t - 1) ** 2
+
+EASINGS = {
+    "linear": linear,
+    "ease_in": ease_in_quad,
+    "ease_out": ease_out_quad,
+    "ease_in_out": ease_in_out_quad,
+    "ease_out_back": ease_out_back,
+}
+
+def lerp(start, end, t):
+    """Interpolate numbers or equal-length tuples"""
+    if isinstance(start, tuple):
+        return tuple(a + (b - a) * t for a, b in zip(start, end))
+    return start + (end - start) * t
+
+class Tween:
+    """Animates target.attr from its value when the tween starts to end over duration seconds"""
+    def __init__(self, target, attr, end, duration, easing=ease_out_quad, start=None, on_done=None):
+        self.target = target
+        self.attr = attr
+        self.end = end
+        self.duration = duration
+        self.easing = EASINGS.get(easing, easing)
+        self.start = start
+        self.on_done = on_done
+        self.elapsed = 0.0
+
+    def update(self, dt):
+        """Advance by dt seconds; return False once finished"""
+        if self.start is None:
+            self.start = getattr(self.target, self.attr)
+        self.elapsed += dt
+        t = min(1.0, self.elapsed / self.duration) if self.duration > 0 else 1.0
+        value = lerp(self.start, self.end, self.easing(t))
+        if isinstance(self.end, tuple):
+            value = tuple(round(v) for v in value) if all(isinstance(v, int) for v in self.end) else value
+        setattr(self.target, self.attr, self.end if t >= 1.0 else value)
+        if t >= 1.0:
+            if self.on_done:
+                self.on_done()
+            return False
+        return True
+
+class Shake:
+    """Wobbles target.attr (an (x, y) offset) sideways, dying out over duration seconds"""
+    def __init__(self, target, attr="offset", amplitude=10, duration=1 / 3, speed=120.0):
+        self.target = target
+        self.attr = attr
+        self.amplitude = amplitude
+        self.duration = duration
+        self.speed = speed  # Radians per second (the old frame-counted shake was 2 per frame at 60 FPS)
+        self.elapsed = 0.0
+
+    def update(self, dt):
+        self.elapsed += dt
+        if self.elapsed >= self.duration:
+            setattr(self.target, self.attr, (0, 0))
+            return False
+        progress = self.elapsed / self.duration
+        shake = self.amplitude * (1 - progress) * math.sin(self.elapsed * self.speed)
+        setattr(self.target, self.attr, (int(shake), 0))
+        return True
+
+class Call:
+    """Runs a function once, as a step of a Sequence"""
+    def __init__(self, function):
+        self.target = None
+        self.function = function
+
+    def update(self, dt):
+        self.function()
+        return False
+
+class Sequence:
+    """Runs steps (tweens, shakes, calls) one after another"""
+    def __init__(self, *steps):
+        self.steps = list(steps)
+        self.target = steps[0].target if steps else None
+
+    def update(self, dt):
+        while self.steps:
+            if self.steps[0].update(dt):
+                return True
+            self.steps.pop(0)
+            dt = 0.0  # The next step starts this frame without skipping ahead
+        return False
+
+    def targets(self):
+        return {step.target for step in self.steps}
+
+class TweenScheduler:
+    """All running animations, advanced together in one pass per frame"""
+    def __init__(self):
+        self.active = []
+
+    def add(self, animation):
+        self.active.append(animation)
+        return animation
+
+    def tween(self, target, attr, end, duration, easing=ease_out_quad, start=None, on_done=None):
+        return self.add(Tween(target, attr, end, duration, easing, start, on_done))
+
+    def shake(self, target, attr="offset", amplitude=10, duration=1 / 3):
+        return self.add(Shake(target, attr, amplitude, duration))
+
+    def sequence(self, *steps):
+        return self.add(Sequence(*steps))
+
+    def cancel(self, target):
+        """Drop every animation touching target (e.g. when it is picked up again)"""
+        self.active = [a for a in self.active
+                       if a.target is not target and not (isinstance(a, Sequence) and target in a.targets())]
+
+    def clear(self):
+        self.active = []
+
+    def update(self, dt):
+        if self.active:
+            self.active = [a for a in self.active if a.update(dt)]
+
+    @property
+    def busy(self):
+        """True while anything is animating"""
+        return bool(self.active)
+
+# Scheduler the levels add their animations to; Game.update() advances it
+scheduler = TweenScheduler()
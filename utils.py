@@ -4,9 +4,14 @@ Includes animations, sound helpers, and visual effects.
 """
 import pygame
 import random
+import json
 import math
 import os
 import sys
+from collections import OrderedDict
+from arabic_text import has_arabic, shape
+from memory_report import track_surface
+import image_fx
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -18,9 +23,46 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
+# Pre-sized copies written by asset_pipeline.py at build time, keyed by source path
+_sized_manifest = None
+_fresh_sources = {}  # Source path -> whether it still matches the manifest (checked once per run)
+
+def sized_variant(relative_path, size):
+    """Path of the build-time copy of relative_path resized to size, or None if there isn't one"""
+    global _sized_manifest
+    if _sized_manifest is None:
+        try:
+            with open(resource_path('assets/sized/manifest.json')) as f:
+                _sized_manifest = json.load(f).get("sources", {})
+        except:
+            _sized_manifest = {}  # Not built yet: scale the originals at load time
+    entry = _sized_manifest.get(relative_path)
+    if not entry or not size:
+        return None
+    variant = entry["variants"].get(f"{size[0]}x{size[1]}")
+    if not variant:
+        return None
+    # A source edited since the last build is used directly instead
+    if relative_path not in _fresh_sources:
+        _fresh_sources[relative_path] = _source_unchanged(resource_path(relative_path), entry)
+    if not _fresh_sources[relative_path]:
+        return None
+    return resource_path(variant)
+
+def _source_unchanged(source, entry):
+    """True if source still has the size and mtime the manifest recorded (or isn't shipped)
+
+    Contents are hashed at build time (asset_pipeline.py); the game only stats
+    the source, so it never reads the big originals just to trust a variant.
+    """
+    if getattr(sys, "frozen", False):
+        return True  # build_game.py rebuilt the manifest right before bundling
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return True  # Not shipped: only the sized copies are
+    return stat.st_size == entry["bytes"] and stat.st_mtime_ns == entry.get("mtime_ns")
 
-# Initialize pygame mixer
-pygame.mixer.init()
 
 # Colors
 PASTEL_BLUE = (173, 216, 230)
@@ -97,24 +139,6 @@ class ConfettiEffect:
         for p in self.particles:
             p.draw(screen)
 
-class ShakeAnimation:
-    """Shake animation for incorrect matches"""
-    def __init__(self, duration=20):
-        self.duration = duration
-        self.time = 0
-        self.amplitude = 10
-    
-    def update(self):
-        self.time += 1
-        return self.time < self.duration
-    
-    def get_offset(self):
-        if self.time >= self.duration:
-            return (0, 0)
-        progress = self.time / self.duration
-        shake = self.amplitude * (1 - progress) * math.sin(self.time * 2)
-        return (int(shake), 0)
-
 def load_sound(filename):
     """Load a sound file, return None if not found"""
     try:
@@ -122,26 +146,196 @@ def load_sound(filename):
     except:
         return None
 
+# Text of each Arabic UI image; rendered at runtime, the PNGs are only used without an Arabic font
+ARABIC_LABELS = {
+    'Start-game.png': "ابدأ اللعبة",
+    'go-to-the-next-level.png': "الانتقال إلى المستوى التالي",
+    'level-1-complet.png': "لقد أكملت المستوى الأول بنجاح!",
+    'level-one.png': "المستوى الأول",
+    'level-tow.png': "المستوى الثاني",
+    'level-three.png': "المستوى الثالث",
+    'try-agin.png': "إعادة المحاولة",
+}
+
+def arabic_label(image_name, size):
+    """The label for an Arabic UI image rendered as shaped text on a card, or None if it can't be
+
+    Same look as the shipped PNGs (red text on a white card); None without a
+    font that has Arabic glyphs, so the caller falls back to the PNG.
+    """
+    text = ARABIC_LABELS.get(image_name)
+    if not text or not size:
+        return None
+    font_size = size[1] // 3
+    if get_arabic_font(font_size) is get_font(font_size):
+        return None
+    # Long labels shrink to fit the card
+    while font_size > 12 and get_arabic_font(font_size).size(shape(text))[0] > size[0] - 20:
+        font_size -= 2
+    label = create_button(text, 0, 0, size[0], size[1], WHITE, text_color=(230, 40, 40), font_size=font_size)
+    return track_surface(label, f"arabic:{image_name}")
+
 def load_arabic_image(image_name, default_size=None):
-    """Load an Arabic UI image from assets/arabic-image folder
+    """Arabic UI label for an assets/arabic-image file name, rendered at runtime when possible
     
     Args:
         image_name: Name of the image file (e.g., 'Start-game.png')
         default_size: Optional tuple (width, height) to scale the image
     
     Returns:
-        Scaled pygame Surface or None if image not found
+        pygame Surface, or None if there's neither a label nor an image
     """
+    label = arabic_label(image_name, default_size)
+    if label:
+        return label
     try:
-        image_path = resource_path(f'assets/arabic-image/{image_name}')
-        image = pygame.image.load(image_path)
-        if default_size:
-            image = pygame.transform.scale(image, default_size)
-        return image
+        relative_path = f'assets/arabic-image/{image_name}'
+        sized = sized_variant(relative_path, default_size)
+        if sized:
+            image = pygame.image.load(sized)
+        else:
+            image = pygame.image.load(resource_path(relative_path))
+            if default_size:
+                image = pygame.transform.scale(image, default_size)
+        return track_surface(image, f"arabic:{image_name}")
     except:
         print(f"Warning: Arabic image '{image_name}' not found")
         return None
 
+def load_image(relative_path, size=None):
+    """Load an image from the assets folder, optionally scaled to size
+    
+    Raises pygame.error / FileNotFoundError if the image can't be loaded
+    """
+    sized = sized_variant(relative_path, size)
+    if sized:
+        return track_surface(pygame.image.load(sized), relative_path)
+    image = pygame.image.load(resource_path(relative_path))
+    if size:
+        image = pygame.transform.scale(image, size)
+    return track_surface(image, relative_path)
+
+# Decoded images shared between screens, keyed by (path, size)
+_shared_images = {}
+
+def load_shared_image(relative_path, size=None):
+    """Like load_image, but every screen asking for the same file and size gets one surface"""
+    key = (relative_path, size)
+    if key not in _shared_images:
+        _shared_images[key] = load_image(relative_path, size)
+    return _shared_images[key]
+
+class ImagePiece:
+    """One piece of a sliced image: a subsurface view of the shared source plus hit masks"""
+    def __init__(self, source, rect, column, row):
+        self.image = source.subsurface(rect)  # Shares the source's pixels, no copy
+        self.offset = rect.topleft  # Where the piece sits in the source image
+        self.column = column
+        self.row = row
+        self._hit_masks = {}
+    
+    def hit_mask(self, padding=0):
+        """Mask of the piece's opaque pixels grown by padding (built once per padding)"""
+        if padding not in self._hit_masks:
+            mask = pygame.mask.from_surface(self.image)
+            if padding:
+                # Convolving with a disc grows the shape by padding pixels on every side
+                disc = pygame.mask.Mask((2 * padding + 1, 2 * padding + 1))
+                for x in range(2 * padding + 1):
+                    for y in range(2 * padding + 1):
+                        if (x - padding) ** 2 + (y - padding) ** 2 <= padding ** 2:
+                            disc.set_at((x, y))
+                mask = mask.convolve(disc)
+            self._hit_masks[padding] = mask
+        return self._hit_masks[padding]
+    
+    def hit(self, pos, padding=0):
+        """True if pos (relative to the piece's top-left) is on the piece"""
+        x, y = pos[0] + padding, pos[1] + padding
+        mask = self.hit_mask(padding)
+        width, height = mask.get_size()
+        return 0 <= x < width and 0 <= y < height and bool(mask.get_at((x, y)))
+    
+    def grab_point(self):
+        """A point on the piece (relative to its top-left), e.g. for the autoplayer"""
+        mask = self.hit_mask()
+        if mask.count() == 0:
+            return self.image.get_rect().center
+        x, y = mask.centroid()
+        if not mask.get_at((x, y)):
+            # Hollow shapes (a bike wheel) have an empty centroid; take the nearest opaque pixel
+            x, y = min(mask.outline(), key=lambda p: (p[0] - x) ** 2 + (p[1] - y) ** 2)
+        return (x, y)
+
+# Sliced images keyed by (name, columns, rows); pieces keep their source alive
+_sliced_images = {}
+
+def slice_image(name, make_source, columns, rows=1):
+    """Cut an image into a columns x rows grid of pieces, row by row
+
+    make_source() is only called the first time a name is sliced that way;
+    afterwards the same pieces (and their masks) are returned, so rebuilding
+    a puzzle costs nothing and pieces never copy pixels.
+    """
+    key = (name, columns, rows)
+    if key not in _sliced_images:
+        source = make_source()
+        width, height = source.get_size()
+        pieces = []
+        for row in range(rows):
+            for column in range(columns):
+                left = column * width // columns
+                top = row * height // rows
+                rect = pygame.Rect(left, top, (column + 1) * width // columns - left,
+                                   (row + 1) * height // rows - top)
+                pieces.append(ImagePiece(source, rect, column, row))
+        _sliced_images[key] = pieces
+    return _sliced_images[key]
+
+def split_halves(name, make_source):
+    """Left and right halves of an image as (left, right) pieces"""
+    return tuple(slice_image(name, make_source, 2))
+
+# Collision masks keyed by (asset name, size), built once per process
+_collision_masks = {}
+
+def collision_mask(name, surface):
+    """Mask of surface's opaque pixels, shared by every surface of the same asset and size"""
+    key = (name, surface.get_size())
+    if key not in _collision_masks:
+        _collision_masks[key] = pygame.mask.from_surface(surface)
+    return _collision_masks[key]
+
+def rect_mask(size):
+    """Solid mask for a plain rectangular target (cached per size)"""
+    key = ("rect", tuple(size))
+    if key not in _collision_masks:
+        _collision_masks[key] = pygame.mask.Mask(size, fill=True)
+    return _collision_masks[key]
+
+def overlap_fraction(mask, pos, other_mask, other_pos):
+    """Share (0..1) of the smaller shape's pixels that the other shape covers"""
+    smallest = min(mask.count(), other_mask.count())
+    if smallest == 0:
+        return 0.0
+    offset = (other_pos[0] - pos[0], other_pos[1] - pos[1])
+    return mask.overlap_area(other_mask, offset) / smallest
+
+def best_drop_target(mask, rect, targets, threshold):
+    """The target the dropped shape overlaps most, or None below threshold
+
+    targets is a list of (target, target_rect, target_mask). The rect test
+    runs first, so masks are only compared for targets the drop touches.
+    """
+    best, best_fraction = None, threshold
+    for target, target_rect, target_mask in targets:
+        if not rect.colliderect(target_rect):
+            continue
+        fraction = overlap_fraction(mask, rect.topleft, target_mask, target_rect.topleft)
+        if fraction >= best_fraction:
+            best, best_fraction = target, fraction
+    return best
+
 def play_sound(sound):
     """Play a sound if it exists"""
     if sound:
@@ -149,8 +343,74 @@ def play_sound(sound):
 
 
 
+# Loaded fonts keyed by (size, arabic); opening a .ttf is far too slow to do per frame
+_fonts = {}
+_fonts_hooked = False  # clear_font_caches registered for the current pygame init
+
+def clear_font_caches():
+    """Forget every font and the text drawn with them
+
+    pygame.quit() frees the fonts underneath the Font objects, so using one
+    after pygame is initialized again crashes; this runs on every quit.
+    """
+    global _fonts_hooked
+    _fonts.clear()
+    _text_surfaces.clear()
+    _fonts_hooked = False
+
+def _cache_font(key, font):
+    global _fonts_hooked
+    if not _fonts_hooked:
+        # Quit callbacks are dropped after they run, so register again each init
+        pygame.register_quit(clear_font_caches)
+        _fonts_hooked = True
+    _fonts[key] = font
+
 def get_font(size):
-    """Get a font, trying bundled, then system, then default."""
+    """Get a font, trying bundled, then system, then default (cached per size)."""
+    key = (size, False)
+    if key not in _fonts:
+        _cache_font(key, _load_font(size))
+    return _fonts[key]
+
+# Fonts that carry the Arabic presentation forms the shaper produces
+ARABIC_FONT_PATHS = [
+    "assets/fonts/NotoNaskhArabic-Regular.ttf",
+    "/usr/share/fonts/truetype/noto/NotoNaskhArabic-Regular.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "C:/Windows/Fonts/tahoma.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+    "/System/Library/Fonts/Supplemental/GeezaPro.ttc",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+]
+
+def get_arabic_font(size):
+    """Get a font that can draw shaped Arabic, falling back to get_font (cached per size)."""
+    key = (size, True)
+    if key not in _fonts:
+        font = None
+        for path in ARABIC_FONT_PATHS:
+            path = resource_path(path) if path.startswith("assets/") else path
+            if os.path.exists(path):
+                try:
+                    candidate = pygame.font.Font(path, size)
+                    # Lam-alef ligature: only fonts with presentation forms have it
+                    if candidate.metrics("\ufefb")[0] is not None:
+                        font = candidate
+                        break
+                except Exception:
+                    continue
+        if font is None:
+            print("Warning: no font with Arabic glyphs found")
+            font = get_font(size)
+        _cache_font(key, font)
+    return _fonts[key]
+
+def font_for(text, size):
+    """The font to draw this text in (Arabic text needs Arabic glyphs)"""
+    return get_arabic_font(size) if has_arabic(text) else get_font(size)
+
+def _load_font(size):
     # Helper to test font
     def test_font(f):
         try:
@@ -203,8 +463,25 @@ def get_font(size):
     raise RuntimeError("Could not load any font.")
 
 def render_text(text, font, color):
-    """Render text."""
-    return font.render(text, True, color)
+    """Render text (Arabic is shaped and put in right-to-left order first)."""
+    return font.render(shape(text), True, color)
+
+# Rendered text keyed by (text, size, color), least recently used dropped first
+TEXT_CACHE_SIZE = 256
+_text_surfaces = OrderedDict()
+
+def text_surface(text, font_size, color=WHITE):
+    """Rendered text surface, shaped and rasterized once per (text, size, color)"""
+    key = (text, font_size, tuple(color))
+    surface = _text_surfaces.get(key)
+    if surface is None:
+        surface = render_text(text, font_for(text, font_size), color)
+        _text_surfaces[key] = surface
+        if len(_text_surfaces) > TEXT_CACHE_SIZE:
+            _text_surfaces.popitem(last=False)
+    else:
+        _text_surfaces.move_to_end(key)
+    return surface
 
 def create_button(text, x, y, width, height, color, text_color=WHITE, font_size=48):
     """Create a simple button surface"""
@@ -212,45 +489,48 @@ def create_button(text, x, y, width, height, color, text_color=WHITE, font_size=
     button.fill(color)
     pygame.draw.rect(button, WHITE, button.get_rect(), 3)
     
-    font = get_font(font_size)
-    text_surf = render_text(text, font, text_color)
+    text_surf = text_surface(text, font_size, text_color)
     text_rect = text_surf.get_rect(center=(width//2, height//2))
     button.blit(text_surf, text_rect)
     
-    return button
+    return track_surface(button, f"button:{text}")
 
 def draw_text(screen, text, font_size, x, y, color=WHITE, center=True):
-    """Draw text on screen"""
-    font = get_font(font_size)
-    text_surf = render_text(text, font, color)
+    """Draw text on screen (cached, so drawing the same label every frame is just a blit)"""
+    text_surf = text_surface(text, font_size, color)
     if center:
         text_rect = text_surf.get_rect(center=(x, y))
     else:
         text_rect = text_surf.get_rect(topleft=(x, y))
     screen.blit(text_surf, text_rect)
 
+# Edge softening, in pixels, of shadows generated from the vehicle image
+SHADOW_BLUR = 2
+
 def create_shadow(image, vehicle_type=None):
     """Create a shadow version of an image, or load from file"""
     # Try to load shadow image from file first if vehicle_type is provided
     if vehicle_type:
-        shadow_path = resource_path(f'assets/images/{vehicle_type}_shadow.png')
+        relative_path = f'assets/images/{vehicle_type}_shadow.png'
+        sized = sized_variant(relative_path, image.get_size())
+        if sized:
+            return track_surface(pygame.image.load(sized), f"shadow:{vehicle_type}")
+        shadow_path = resource_path(relative_path)
         if os.path.exists(shadow_path):
             try:
                 shadow = pygame.image.load(shadow_path)
                 shadow = pygame.transform.scale(shadow, image.get_size())
-                return shadow
+                return track_surface(shadow, f"shadow:{vehicle_type}")
             except:
                 pass
 
-    # Create silhouette using mask (cleaner and faster than pixel iteration)
+    # Soft-edged silhouette computed over the whole alpha channel (cached per vehicle type)
     try:
-        mask = pygame.mask.from_surface(image)
-        # Create a surface from the mask, setting set bits to black with alpha
-        shadow = mask.to_surface(setcolor=(0, 0, 0, 100), unsetcolor=(0, 0, 0, 0))
-        return shadow
+        return image_fx.silhouette(f"shadow:{vehicle_type}" if vehicle_type else None,
+                                   image, (0, 0, 0), alpha=100, blur=SHADOW_BLUR)
     except:
         # Fallback if mask fails
-        return pygame.Surface(image.get_size(), pygame.SRCALPHA)
+        return track_surface(pygame.Surface(image.get_size(), pygame.SRCALPHA), f"shadow:{vehicle_type}")
 
 def create_vehicle_image(vtype, color, size):
     """Create a simple vehicle image surface with transparent background"""
@@ -358,21 +638,32 @@ def create_vehicle_image(vtype, color, size):
         pygame.draw.rect(surface, color, (width*0.1, height*0.1, width*0.8, height*0.8), border_radius=10)
         
     return surface
-def create_vehicle_image(vehicle_type, color, size=(150, 150)):
-    """Load vehicle image from file, or create using pygame drawing as fallback"""
-    # Try to load from file first
-    image_path = resource_path(f'assets/images/{vehicle_type}.png')
+def create_vehicle_image(vehicle_type, color, size=(150, 150), tint=False):
+    """Load vehicle image from file, or create using pygame drawing as fallback
+
+    The drawn fallback is always in color; with tint=True a loaded image is
+    tinted towards color as well (cached per type, size and color).
+    """
+    if tint:
+        image = create_vehicle_image(vehicle_type, color, size)
+        return image_fx.tinted(f"vehicle:{vehicle_type}:{size[0]}x{size[1]}", image, color)
+    # Try the build-time pre-sized copy, then the full-size file
+    relative_path = f'assets/images/{vehicle_type}.png'
+    sized = sized_variant(relative_path, size)
+    if sized:
+        return track_surface(pygame.image.load(sized), f"vehicle:{vehicle_type}")
+    image_path = resource_path(relative_path)
     if os.path.exists(image_path):
         try:
             image = pygame.image.load(image_path)
             # Scale to requested size while maintaining aspect ratio
             image = pygame.transform.scale(image, size)
-            return image
+            return track_surface(image, f"vehicle:{vehicle_type}")
         except:
             pass  # Fall through to procedural generation
     
-    # Fallback: Create procedurally
-    surface = pygame.Surface(size, pygame.SRCALPHA)
+    # Fallback: Create procedurally (drawn on a 100x100 canvas, scaled to size below)
+    surface = pygame.Surface((100, 100), pygame.SRCALPHA)
     
     if vehicle_type == "car":
         # Simple car shape
@@ -433,7 +724,9 @@ def create_vehicle_image(vehicle_type, color, size=(150, 150)):
         pygame.draw.rect(surface, (255, 100, 100), (40, 25, 20, 12))
         pygame.draw.circle(surface, (255, 230, 150), (70, 40), 5)
     
-    return surface
+    if tuple(size) != (100, 100):
+        surface = pygame.transform.smoothscale(surface, size)
+    return track_surface(surface, f"vehicle:{vehicle_type}")
 
 def check_file_exists(filepath):
     """Check if a file exists"""
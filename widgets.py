@@ -0,0 +1,89 @@
+"""
+UI widgets for the Transportation Game
+Buttons whose hover, pressed and grow-on-hover looks are rendered once up front,
+so drawing a button is always a single blit.
+"""
+import pygame
+from memory_report import track_surface
+
+# Frame strips keyed by name, shared by every screen that builds the same button
+_button_frames = {}
+
+def button_frames(name, make_image, hover_scale=1.06, steps=5):
+    """ButtonFrames for name, calling make_image() only the first time"""
+    if name not in _button_frames:
+        _button_frames[name] = ButtonFrames(make_image(), name, hover_scale, steps)
+    return _button_frames[name]
+
+class ButtonFrames:
+    """Pre-rendered looks of one button image
+
+    grow holds the scale-up animation (grow[0] is the normal image, grow[-1]
+    the hover look); pressed is a slightly smaller, darker copy.
+    """
+    def __init__(self, image, name="button", hover_scale=1.06, steps=5):
+        width, height = image.get_size()
+        self.grow = [image]
+        for step in range(1, steps + 1):
+            t = step / steps
+            t = t * (2 - t)  # Ease out: quick start, gentle finish
+            scale = 1 + (hover_scale - 1) * t
+            size = (round(width * scale), round(height * scale))
+            self.grow.append(track_surface(pygame.transform.smoothscale(image.convert_alpha(), size),
+                                           f"{name} grow {step}"))
+        size = (round(width * 0.96), round(height * 0.96))
+        self.pressed = pygame.transform.smoothscale(image.convert_alpha(), size)
+        self.pressed.fill((40, 40, 40), special_flags=pygame.BLEND_RGB_SUB)
+        track_surface(self.pressed, f"{name} pressed")
+
+class Button:
+    """Hit testing and hover/press state for a rectangular button
+
+    Holds no surfaces, so level logic can own its buttons and still run
+    under render.NullRenderer; the renderer passes its ButtonFrames to draw().
+    """
+    def __init__(self, rect, frames=None):
+        self.rect = pygame.Rect(rect)
+        self.frames = frames
+        self.hover = False
+        self.pressed = False
+        self.grow_index = 0  # Position in frames.grow, moves one step per draw
+
+    def handle_event(self, event):
+        """Track hover/press; return True when the button is clicked (released over it after a press)
+
+        Firing on release means the screen that saw the press also sees it
+        end, so a screen left by the click isn't shown pressed on return.
+        """
+        if event.type == pygame.MOUSEMOTION:
+            self.hover = self.rect.collidepoint(event.pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if self.rect.collidepoint(event.pos):
+                self.pressed = True
+        elif event.type == pygame.MOUSEBUTTONUP:
+            clicked = self.pressed and self.rect.collidepoint(event.pos)
+            self.pressed = False
+            if clicked:
+                self.hover = False  # The click usually changes screens; the next motion sets it again
+                return True
+        return False
+
+    def reset(self):
+        """Back to the idle look, e.g. when a cached screen is shown again"""
+        self.hover = False
+        self.pressed = False
+        self.grow_index = 0
+
+    def frame(self, frames=None):
+        """(image, rect) for the current state, centered on the button; advances the grow animation"""
+        frames = frames if frames else self.frames
+        if self.hover:
+            self.grow_index = min(self.grow_index + 1, len(frames.grow) - 1)
+        else:
+            self.grow_index = max(self.grow_index - 1, 0)
+        image = frames.pressed if self.pressed else frames.grow[self.grow_index]
+        return image, image.get_rect(center=self.rect.center)
+
+    def draw(self, screen, frames=None):
+        """Blit the frame for the current state, centered on the button"""
+        screen.blit(*self.frame(frames))